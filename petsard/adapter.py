@@ -4,12 +4,14 @@ import time
 from copy import deepcopy
 from datetime import timedelta
 
+import numpy as np
 import pandas as pd
 
 from petsard.constrainer import Constrainer
 from petsard.evaluator import Describer, Evaluator
 from petsard.exceptions import ConfigError
-from petsard.loader import Loader, Splitter
+from petsard.instrumentation import span
+from petsard.loader import Loader, Splitter, SplitView
 from petsard.metadater.metadata import Schema
 from petsard.metadater.metadater import SchemaMetadater
 from petsard.processor import Processor
@@ -17,11 +19,24 @@ from petsard.reporter import Reporter
 from petsard.synthesizer import Synthesizer
 
 
+def _is_copy_on_write() -> bool:
+    """
+    Whether pandas Copy-on-Write is enabled (see ExecutorConfig.copy_on_write).
+
+    Returns:
+        (bool): True if DataFrames can be handed off without copying.
+    """
+    return pd.options.mode.copy_on_write is True
+
+
 class BaseAdapter:
     """
     The interface of the objects used by Executor.run()
     """
 
+    # Attribute holding the module output, measured by the "run" span
+    _result_attr: str | None = None
+
     def __init__(self, config: dict) -> None:
         """
         Args:
@@ -48,6 +63,22 @@ class BaseAdapter:
             self._logger.debug("Error details: ", exc_info=True)
             raise ConfigError
 
+    @classmethod
+    def validate(cls, config: dict) -> None:
+        """
+        Check an experiment config without keeping its adapter,
+            so that Config can reject invalid experiments before any step runs.
+
+        Adapters only parse their config when built,
+            the data, models and evaluators are created when they run,
+            so by default the adapter is built on a copy of the config and dropped.
+            Adapters with side effects on construction override this.
+
+        Args:
+            config (dict): Configuration parameters of the experiment.
+        """
+        cls(deepcopy(config))
+
     def _apply_precision_rounding(
         self, data: pd.DataFrame, schema: Schema, context: str
     ) -> None:
@@ -130,42 +161,44 @@ class BaseAdapter:
 
         return updated_schema
 
-    def _handle_benchmark_download(
-        self, protocol_value: str, value_type: str = "filepath"
-    ) -> tuple[bool, str, object]:
+    @classmethod
+    def _resolve_benchmark(
+        cls, protocol_value: str, value_type: str = "filepath"
+    ) -> tuple[str, object, str] | None:
         """
-        Unified handling of benchmark:// protocol download logic
+        Resolve a benchmark:// value to its benchmark, without downloading it.
 
         Args:
             protocol_value: Original protocol string (e.g., "benchmark://adult")
             value_type: Value type, either "filepath" or "schema"
 
         Returns:
-            tuple: (is_benchmark, local_path, benchmarker_config)
+            tuple: (benchmark_name, benchmarker_config, local_path),
+                None if the value does not use the benchmark:// protocol
+
+        Raises:
+            BenchmarkDatasetsError: If the benchmark is not supported.
         """
         import re
         from pathlib import Path
 
         # Handle non-string values (e.g., dict, Schema objects)
         if not isinstance(protocol_value, str):
-            return False, protocol_value, None
+            return None
 
         is_benchmark = protocol_value.lower().startswith("benchmark://")
         if not is_benchmark:
-            return False, protocol_value, None
+            return None
 
-        from petsard.exceptions import (BenchmarkDatasetsError,
-                                        UnsupportedMethodError)
-        from petsard.loader.benchmarker import (BenchmarkerConfig,
-                                                BenchmarkerRequests)
+        from petsard.exceptions import BenchmarkDatasetsError, UnsupportedMethodError
+        from petsard.loader.benchmarker import BenchmarkerConfig
 
+        logger = logging.getLogger(f"PETsARD.{cls.__name__}")
         benchmark_name = re.sub(
             r"^benchmark://", "", protocol_value, flags=re.IGNORECASE
         ).lower()
 
-        self._logger.debug(
-            f"Detected benchmark protocol for {value_type}: {benchmark_name}"
-        )
+        logger.debug(f"Detected benchmark protocol for {value_type}: {benchmark_name}")
 
         # Create BenchmarkerConfig
         try:
@@ -176,14 +209,38 @@ class BaseAdapter:
             error_msg = (
                 f"Unsupported benchmark {value_type} '{benchmark_name}': {str(e)}"
             )
-            self._logger.error(error_msg)
+            logger.error(error_msg)
             raise BenchmarkDatasetsError(error_msg) from e
 
         # Update to local path
         local_path = str(
             Path("benchmark").joinpath(benchmarker_config.benchmark_filename)
         )
-        self._logger.debug(f"Updated {value_type} to local path: {local_path}")
+        logger.debug(f"Updated {value_type} to local path: {local_path}")
+
+        return benchmark_name, benchmarker_config, local_path
+
+    def _handle_benchmark_download(
+        self, protocol_value: str, value_type: str = "filepath"
+    ) -> tuple[bool, str, object]:
+        """
+        Unified handling of benchmark:// protocol download logic
+
+        Args:
+            protocol_value: Original protocol string (e.g., "benchmark://adult")
+            value_type: Value type, either "filepath" or "schema"
+
+        Returns:
+            tuple: (is_benchmark, local_path, benchmarker_config)
+        """
+        benchmark = self._resolve_benchmark(protocol_value, value_type)
+        if benchmark is None:
+            return False, protocol_value, None
+
+        from petsard.exceptions import BenchmarkDatasetsError
+        from petsard.loader.benchmarker import BenchmarkerRequests
+
+        benchmark_name, benchmarker_config, local_path = benchmark
 
         # Download benchmark file
         self._logger.info(f"Downloading benchmark {value_type}: {benchmark_name}")
@@ -313,6 +370,10 @@ class BaseAdapter:
         """
         Unified copy strategy, determines copy method based on data type
 
+        Under pandas Copy-on-Write, DataFrames are handed off as shallow copies
+            sharing memory with the original, and pandas only copies
+            the columns a downstream stage actually writes to.
+
         Args:
             data: Data to copy
 
@@ -323,8 +384,10 @@ class BaseAdapter:
             return None
         elif isinstance(data, pd.DataFrame):
             # DataFrame's copy() is usually sufficient and faster
-            return data.copy()
+            return data.copy(deep=not _is_copy_on_write())
         elif isinstance(data, dict):
+            if _is_copy_on_write():
+                return {key: self._safe_copy(value) for key, value in data.items()}
             # dict may contain DataFrame, needs deep copy
             return deepcopy(data)
         else:
@@ -340,28 +403,19 @@ class BaseAdapter:
                 See self.set_input() for more details.
         """
         start_time: time = time.time()
-        self._logger.debug(f"TIMING_START|{self.module_name}|run|{start_time}")
         self._logger.info(f"Starting {self.module_name} execution")
 
-        try:
+        with span("run", module=self.module_name) as run_span:
+            run_span.set_input(input.get("data") if isinstance(input, dict) else None)
             self._run(input)
+            if self._result_attr is not None:
+                run_span.set_output(getattr(self, self._result_attr, None))
 
-            elapsed_time: time = time.time() - start_time
-            formatted_elapsed_time: str = str(timedelta(seconds=round(elapsed_time)))
-
-            self._logger.debug(
-                f"TIMING_END|{self.module_name}|run|{time.time()}|{elapsed_time}"
-            )
-            self._logger.info(
-                f"Completed {self.module_name} execution "
-                f"(elapsed: {formatted_elapsed_time})"
-            )
-        except Exception as e:
-            elapsed_time: time = time.time() - start_time
-            self._logger.debug(
-                f"TIMING_ERROR|{self.module_name}|run|{time.time()}|{elapsed_time}|{str(e)}"
-            )
-            raise
+        elapsed_time: time = time.time() - start_time
+        formatted_elapsed_time: str = str(timedelta(seconds=round(elapsed_time)))
+        self._logger.info(
+            f"Completed {self.module_name} execution (elapsed: {formatted_elapsed_time})"
+        )
 
     @classmethod
     def log_and_raise_config_error(cls, func):
@@ -440,6 +494,8 @@ class LoaderAdapter(BaseAdapter):
     For benchmark:// protocol files, it handles downloading before loading.
     """
 
+    _result_attr: str | None = "data"
+
     def __init__(self, config: dict) -> None:
         """
         Args:
@@ -485,6 +541,33 @@ class LoaderAdapter(BaseAdapter):
         self.loader = Loader(**config)
         self._schema_metadata = None  # Store the Schema
 
+    @classmethod
+    def validate(cls, config: dict) -> None:
+        """
+        Check a Loader config without downloading benchmark datasets.
+
+        benchmark:// values are checked against the supported benchmarks,
+            a benchmark filepath is checked by its local path,
+            and a benchmark schema is left out as it is read after the download.
+
+        Args:
+            config (dict): Configuration parameters for the Loader.
+        """
+        if config is None:
+            raise ConfigError
+
+        config = {key: value for key, value in config.items() if key != "method"}
+        for key in ["filepath", "schema"]:
+            benchmark = cls._resolve_benchmark(config.get(key, ""), key)
+            if benchmark is None:
+                continue
+            if key == "filepath":
+                config[key] = benchmark[2]
+            else:
+                config.pop(key)
+
+        Loader(**config)
+
     def _run(self, input: dict) -> None:
         """
         Executes the data loading process using the Loader instance.
@@ -579,6 +662,9 @@ class LoaderAdapter(BaseAdapter):
         """
         Retrieve the loading result.
         """
+        if _is_copy_on_write():
+            # Hand off a separate object so downstream writes never reach self.data
+            return self._safe_copy(self.data)
         return self.data
 
     def get_metadata(self) -> Schema:
@@ -597,6 +683,8 @@ class SplitterAdapter(BaseAdapter):
         using the configured Loader instance as a decorator.
     """
 
+    _result_attr: str | None = "data"
+
     def __init__(self, config: dict):
         """
         Args:
@@ -605,8 +693,18 @@ class SplitterAdapter(BaseAdapter):
         Attributes:
             splitter (Splitter):
                 An instance of the Splitter class initialized with the provided configuration.
+            batch (dict, optional):
+                The group, index and size of an experiment expanded by Config
+                from num_samples, None otherwise.
+            _materialized (dict, optional):
+                The lazy split copied out by get_result(), None until it is called.
         """
         super().__init__(config)
+        self._materialized: dict | None = None
+
+        # Expanded experiments of one group share a batch of splits
+        self.batch: dict | None = config.get("_batch")
+        config = {key: value for key, value in config.items() if key != "_batch"}
 
         # Check if it's custom_data method
         if config.get("method") == "custom_data":
@@ -623,7 +721,22 @@ class SplitterAdapter(BaseAdapter):
             self.splitter = Splitter(**config)
             self.is_custom_data = False
 
-    def _create_loader_config(self, config: dict, key: str) -> dict:
+    @classmethod
+    def validate(cls, config: dict) -> None:
+        """
+        Check a Splitter config, custom_data by the configs of its Loaders.
+
+        Args:
+            config (dict): Configuration parameters for the Splitter.
+        """
+        if config is not None and config.get("method") == "custom_data":
+            for key in ["ori", "control"]:
+                LoaderAdapter.validate(cls._create_loader_config(config, key))
+        else:
+            super().validate(config)
+
+    @staticmethod
+    def _create_loader_config(config: dict, key: str) -> dict:
         """
         Create Loader configuration for a specific key (ori/control).
 
@@ -642,6 +755,7 @@ class SplitterAdapter(BaseAdapter):
             "random_state",
             "max_overlap_ratio",
             "max_attempts",
+            "lazy",
         ]
 
         loader_config = {}
@@ -728,9 +842,15 @@ class SplitterAdapter(BaseAdapter):
                     split_params[key] = value
                 elif key == "exist_train_indices" and value:  # Only pass when not empty
                     split_params[key] = value
-            self.data, self.metadata, self.train_indices = self.splitter.split(
-                **split_params
-            )
+            split_batches = input.get("split_batches")
+            if self.batch is not None and split_batches is not None:
+                self.data, self.metadata, self.train_indices = self._split_in_batch(
+                    split_params, split_batches
+                )
+            else:
+                self.data, self.metadata, self.train_indices = self.splitter.split(
+                    **split_params
+                )
 
         # Update schema statistics for train data after splitting
         # Update schema statistics for train data after splitting
@@ -738,9 +858,12 @@ class SplitterAdapter(BaseAdapter):
             train_metadata = self.metadata[1].get("train")
             if train_metadata and train_metadata.enable_stats:
                 train_data = self.data[1]["train"]
+                if isinstance(train_data, SplitView):
+                    train_data = train_data.materialize()
                 self.metadata[1]["train"] = self._update_schema_stats(
                     train_metadata, train_data, "Splitter (train)"
                 )
+        self._materialized = None
 
         self._logger.debug("Data splitting completed")
 
@@ -765,34 +888,109 @@ class SplitterAdapter(BaseAdapter):
             self.input["data"] = status.get_result("Loader")
             self.input["metadata"] = status.get_metadata("Loader")
         self.input["exist_train_indices"] = status.get_exist_train_indices()
+        if self.batch is not None and not self.is_custom_data:
+            self.input["split_batches"] = status.get_split_batches()
 
         return self.input
 
+    def _split_in_batch(
+        self, split_params: dict, split_batches: dict
+    ) -> tuple[dict, dict, list[set] | list[np.ndarray]]:
+        """
+        Take the split of this experiment from the batch of its group,
+            generating the splits of this and the following experiments
+            of the group in one call when there is none to take.
+
+        The batch reproduces the experiments running Splitter.split() one by one,
+            each seeing the train indices of the previous ones in exist_train_indices.
+
+        Args:
+            split_params (dict): The parameters of Splitter.split().
+            split_batches (dict): The batches of Status, by group, updated in place.
+
+        Returns:
+            tuple[dict, dict, list[set] | list[np.ndarray]]:
+                The result of Splitter.split(), train indices as arrays when lazy.
+        """
+        group, index, size = (
+            self.batch["group"],
+            self.batch["index"],
+            self.batch["size"],
+        )
+        n_exist: int = len(split_params.get("exist_train_indices") or [])
+
+        batch: dict | None = split_batches.get(group)
+        if (
+            index == 1
+            or batch is None
+            or not batch["first"] <= index < batch["first"] + len(batch["results"])
+            or batch["n_exist"] + index - batch["first"] != n_exist
+        ):
+            # Keep the splits as views, materialized only when taken
+            batch_splitter = Splitter(**{**self.splitter.config, "lazy": True})
+            batch = {
+                "first": index,
+                "n_exist": n_exist,
+                "results": batch_splitter.split_batch(
+                    num_batches=size - index + 1, **split_params
+                ),
+            }
+            split_batches[group] = batch
+            self._logger.debug(
+                f"Generated splits {index} ~ {size} of {group} in one batch"
+            )
+
+        data, metadata, train_indices = batch["results"][index - batch["first"]]
+        if index == size:
+            del split_batches[group]
+
+        if not self.splitter.config["lazy"]:
+            data = {
+                key: {name: view.materialize() for name, view in views.items()}
+                for key, views in data.items()
+            }
+            train_indices = [set(indices.tolist()) for indices in train_indices]
+        return data, metadata, train_indices
+
     def get_result(self):
         """
         Retrieve the splitting result.
             Due to Config force num_samples = 1, return 1st dataset is fine.
-        """
-        result: dict = deepcopy(self.data[1])
+            Lazy SplitView results are materialized once, on the first call.
+        """
+        data: dict = self.data[1]
+        if any(isinstance(value, SplitView) for value in data.values()):
+            if self._materialized is None:
+                self._materialized = {
+                    key: value.materialize() if isinstance(value, SplitView) else value
+                    for key, value in data.items()
+                }
+            data = self._materialized
+        result: dict = self._safe_copy(data)
         return result
 
     def get_metadata(self) -> Schema:
         """
         Retrieve the metadata.
+            The Schema is shared, callers modifying it should copy it first.
 
         Returns:
             (Schema): The updated metadata.
         """
-        return deepcopy(self.metadata[1]["train"])
+        return self.metadata[1]["train"]
 
     def get_train_indices(self) -> list[set]:
         """
         Retrieve the training indices for each sample.
+            Lazy splits keep them as arrays, they are converted to sets here.
 
         Returns:
-            list[set]: Training indices as list of sets
+            list[set]: Training indices as list of sets, built anew on each call.
         """
-        return deepcopy(self.train_indices)
+        return [
+            set(indices.tolist()) if isinstance(indices, np.ndarray) else set(indices)
+            for indices in self.train_indices
+        ]
 
 
 class PreprocessorAdapter(BaseAdapter):
@@ -801,6 +999,8 @@ class PreprocessorAdapter(BaseAdapter):
         using the configured Processor instance as a decorator.
     """
 
+    _result_attr: str | None = "data_preproc"
+
     def __init__(self, config: dict):
         """
         Args:
@@ -996,7 +1196,7 @@ class PreprocessorAdapter(BaseAdapter):
         """
         Retrieve the pre-processing result.
         """
-        result: pd.DataFrame = deepcopy(self.data_preproc)
+        result: pd.DataFrame = self._safe_copy(self.data_preproc)
         return result
 
     def get_metadata(self) -> Schema:
@@ -1024,6 +1224,8 @@ class SynthesizerAdapter(BaseAdapter):
         using the configured Synthesizer instance as a decorator.
     """
 
+    _result_attr: str | None = "data_syn"
+
     def __init__(self, config: dict):
         """
         Attributes:
@@ -1047,7 +1249,21 @@ class SynthesizerAdapter(BaseAdapter):
             self.is_custom_data = False
         self.data_syn: pd.DataFrame = None
 
-    def _extract_loader_config(self, config: dict) -> dict:
+    @classmethod
+    def validate(cls, config: dict) -> None:
+        """
+        Check a Synthesizer config, custom_data by the config of its Loader.
+
+        Args:
+            config (dict): Configuration parameters for the Synthesizer.
+        """
+        if config is not None and config.get("method") == "custom_data":
+            LoaderAdapter.validate(cls._extract_loader_config(config))
+        else:
+            super().validate(config)
+
+    @staticmethod
+    def _extract_loader_config(config: dict) -> dict:
         """
         Extract Loader-related configuration from synthesizer config.
 
@@ -1171,7 +1387,7 @@ class SynthesizerAdapter(BaseAdapter):
         """
         Retrieve the synthesizing result.
         """
-        return deepcopy(self.data_syn)
+        return self._safe_copy(self.data_syn)
 
 
 class PostprocessorAdapter(BaseAdapter):
@@ -1180,6 +1396,8 @@ class PostprocessorAdapter(BaseAdapter):
         using the configured Processor instance as a decorator.
     """
 
+    _result_attr: str | None = "data_postproc"
+
     def __init__(self, config: dict):
         """
         Args:
@@ -1291,7 +1509,7 @@ class PostprocessorAdapter(BaseAdapter):
         """
         Retrieve the pre-processing result.
         """
-        result: pd.DataFrame = deepcopy(self.data_postproc)
+        result: pd.DataFrame = self._safe_copy(self.data_postproc)
         return result
 
     def get_metadata(self) -> Schema:
@@ -1321,6 +1539,8 @@ class ConstrainerAdapter(BaseAdapter):
     using the configured Constrainer instance as a decorator.
     """
 
+    _result_attr: str | None = "constrained_data"
+
     def __init__(self, config: dict) -> None:
         """
         Initialize ConstrainerAdapter with given configuration.
@@ -1853,6 +2073,8 @@ class EvaluatorAdapter(BaseAdapter):
         using the configured Evaluator instance as a decorator.
     """
 
+    _result_attr: str | None = "evaluations"
+
     def __init__(self, config: dict) -> None:
         """
         Attributes:
@@ -2009,6 +2231,8 @@ class DescriberAdapter(BaseAdapter):
         using the configured Describer instance as a decorator.
     """
 
+    _result_attr: str | None = "description"
+
     def __init__(self, config: dict) -> None:
         """
         Attributes:
@@ -2344,6 +2568,8 @@ class ReporterAdapter(BaseAdapter):
 
     """
 
+    _result_attr: str | None = "report"
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
 
@@ -2494,12 +2720,12 @@ class ReporterAdapter(BaseAdapter):
                     index_tuple = tuple(
                         item for pair in temp_dict.items() for item in pair
                     )
-                    data[index_tuple] = deepcopy(result[key])
+                    data[index_tuple] = self._safe_copy(result[key])
             else:
                 index_tuple = tuple(
                     item for pair in index_dict.items() for item in pair
                 )
-                data[index_tuple] = deepcopy(result)
+                data[index_tuple] = self._safe_copy(result)
         self.input["data"] = data
         self.input["data"]["exist_report"] = status.get_report()
         self.input["metadata"] = (
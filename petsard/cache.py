@@ -0,0 +1,607 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from urllib.parse import urlsplit
+
+import numpy as np
+
+
+def _get_petsard_version() -> str:
+    """
+    Get the installed PETsARD version, so cache entries do not outlive an upgrade.
+
+    Returns:
+        (str): The package version, or "unknown" when running from source.
+    """
+    try:
+        return version("petsard")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class StageCache:
+    """
+    Content-addressed on-disk cache of executed operators.
+
+    Every step of the experiment flow gets a key hashed from
+        its module and config, the key of its upstream step,
+        and a fingerprint of the data it reads outside the flow
+        (input files, Splitter exist_train_indices).
+    Operators of the cacheable modules are pickled under that key,
+        so a re-run with the same upstream skips them entirely.
+    Stochastic steps without a random_state get a fresh key every run instead,
+        so they and the steps downstream of them are re-executed.
+    The cache is capped in size and evicts the least recently used entries.
+    """
+
+    CACHEABLE_MODULES: tuple[str, ...] = (
+        "Loader",
+        "Splitter",
+        "Preprocessor",
+        "Synthesizer",
+    )
+    # Modules drawing random numbers, reproducible only under a random_state
+    STOCHASTIC_MODULES: tuple[str, ...] = ("Splitter", "Synthesizer")
+    # Methods of the stochastic modules that draw nothing
+    DETERMINISTIC_METHODS: dict[str, tuple[str, ...]] = {
+        "Synthesizer": ("custom_data",),
+    }
+    # Prefix of keys unique to one run, which are never stored
+    RUN_LOCAL_PREFIX: str = "run-"
+    SUFFIX: str = ".pkl"
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 1024):
+        """
+        Args:
+            cache_dir (str): Directory to store cache entries.
+            max_size_mb (int): Upper bound of the total cache size in MB.
+                Least recently used entries are evicted above it.
+
+        Attr.:
+            _logger (logging.Logger): The logger object.
+            cache_dir (str): Directory to store cache entries.
+            max_size (int): Upper bound of the total cache size in bytes.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.cache_dir: str = cache_dir
+        self.max_size: int = max_size_mb * 1024 * 1024
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def is_reproducible(cls, module: str, expt_config: dict) -> bool:
+        """
+        Whether re-running a step with the same config and upstream gives the same result.
+
+        Args:
+            module (str): The name of the module.
+            expt_config (dict): The experiment config.
+
+        Returns:
+            (bool): False for stochastic steps without a random_state.
+        """
+        if module not in cls.STOCHASTIC_MODULES:
+            return True
+        method: str = str(expt_config.get("method", "")).lower()
+        if method in cls.DETERMINISTIC_METHODS.get(module, ()):
+            return True
+        return expt_config.get("random_state") is not None
+
+    def make_key(self, module: str, spec: tuple, upstream_key: str, status) -> str:
+        """
+        Compute the cache key of a step.
+
+        Args:
+            module (str): The name of the module.
+            spec (tuple): (adapter class, experiment config) as queued by Config.
+            upstream_key (str): The key of the previous step in the same branch.
+                Empty string for the first module.
+            status (Status): The current status, used for Splitter state.
+
+        Returns:
+            (str): Hex digest identifying the step.
+                Stochastic steps without a random_state, and the steps downstream
+                of them, get a key unique to this run with RUN_LOCAL_PREFIX.
+        """
+        adapter_class, expt_config = spec
+        hasher = hashlib.sha256()
+        run_local: bool = upstream_key.startswith(self.RUN_LOCAL_PREFIX)
+        if not self.is_reproducible(module, expt_config):
+            # Per-run nonce, an unseeded draw must not be replayed by later runs
+            hasher.update(os.urandom(16))
+            run_local = True
+        hasher.update(
+            json.dumps(
+                {
+                    "version": _get_petsard_version(),
+                    "module": module,
+                    "adapter": f"{adapter_class.__module__}.{adapter_class.__qualname__}",
+                    "config": expt_config,
+                    "upstream": upstream_key,
+                },
+                sort_keys=True,
+                default=repr,
+            ).encode()
+        )
+        self._update_input_fingerprint(hasher, expt_config)
+        if module == "Splitter":
+            # Splitter avoids overlapping with earlier samples
+            exist_train_indices = getattr(status, "exist_train_indices", [])
+            for idx in exist_train_indices:
+                indices: np.ndarray = np.sort(
+                    np.fromiter(idx, dtype=np.int64, count=len(idx))
+                )
+                # Length prefix keeps the boundaries between samples in the hash
+                hasher.update(np.int64(indices.size).tobytes())
+                hasher.update(indices.tobytes())
+        if run_local:
+            return f"{self.RUN_LOCAL_PREFIX}{hasher.hexdigest()}"
+        return hasher.hexdigest()
+
+    def _update_input_fingerprint(self, hasher, value) -> None:
+        """
+        Feed the content of every local file referenced by the config into the hash.
+
+        Args:
+            hasher (hashlib._Hash): The running hash.
+            value: The config value to scan, nested dict and list are walked.
+        """
+        if isinstance(value, dict):
+            for key in sorted(value, key=str):
+                self._update_input_fingerprint(hasher, value[key])
+        elif isinstance(value, list | tuple):
+            for item in value:
+                self._update_input_fingerprint(hasher, item)
+        elif isinstance(value, str) and value.lower().startswith("sqlite:///"):
+            # SQLite database URL, the database is a local file
+            database: str = urlsplit(value).path[1:]
+            if database and os.path.isfile(database):
+                self._update_input_fingerprint(hasher, database)
+        elif isinstance(value, str) and os.path.isfile(value):
+            with open(value, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self.SUFFIX}")
+
+    def load(self, key: str):
+        """
+        Load an executed operator from the cache.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            (BaseAdapter | None): The cached operator, or None on a miss.
+        """
+        path: str = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                operator = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return operator
+
+    def save(self, key: str, operator) -> None:
+        """
+        Store an executed operator in the cache, then evict above the size cap.
+
+        Args:
+            key (str): The cache key.
+            operator (BaseAdapter): The executed operator.
+        """
+        try:
+            payload: bytes = pickle.dumps(operator, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self._logger.warning(
+                f"Operator for cache entry {key} is not cacheable: {e}"
+            )
+            return
+
+        if len(payload) > self.max_size:
+            self._logger.info(
+                f"Skip caching {key}: {len(payload)} bytes exceeds the cache size limit"
+            )
+            return
+
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._get_path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits the size cap.
+        """
+        entries: list[tuple[float, int, str]] = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.SUFFIX):
+                continue
+            path: str = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self._logger.debug(f"Evicting cache entry {os.path.basename(path)}")
+            self._remove(path)
+            total_size -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class LoadCache:
+    """
+    On-disk cache of data loaded by Loader, with its inferred schema.
+
+    Every entry is keyed by the source file, identified by its size,
+        modification time and content hash, together with the loader config
+        shaping the result (schema, nrows, na_values, ...).
+    The data is stored as uncompressed Feather and memory-mapped on a hit
+        instead of being parsed again, the schema is stored as YAML beside it.
+    Content hashes are remembered per file path,
+        so the source is only re-hashed after its size or mtime changes.
+    The cache is capped in size and evicts the least recently used entries.
+    """
+
+    DATA_SUFFIX: str = ".feather"
+    SCHEMA_SUFFIX: str = ".schema.yaml"
+    DIGEST_SUFFIX: str = ".digest.json"
+    PYARROW_STRINGS_KEY: bytes = b"petsard.pyarrow_strings"
+    COMPACT_REPORT_KEY: bytes = b"petsard.compact_report"
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 1024):
+        """
+        Args:
+            cache_dir (str): Directory to store cache entries.
+            max_size_mb (int): Upper bound of the total cache size in MB.
+                Least recently used entries are evicted above it.
+
+        Attr.:
+            _logger (logging.Logger): The logger object.
+            cache_dir (str): Directory to store cache entries.
+            max_size (int): Upper bound of the total cache size in bytes.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.cache_dir: str = cache_dir
+        self.max_size: int = max_size_mb * 1024 * 1024
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, filepath: str, config: dict) -> str:
+        """
+        Compute the cache key of a load.
+
+        Args:
+            filepath (str): The source file.
+            config (dict): The loader config shaping the loaded data and schema.
+
+        Returns:
+            (str): Hex digest identifying the load.
+        """
+        stat = os.stat(filepath)
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "version": _get_petsard_version(),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "content": self._get_content_digest(filepath, stat),
+                    "config": config,
+                },
+                sort_keys=True,
+                default=repr,
+            ).encode()
+        ).hexdigest()
+
+    def _get_content_digest(self, filepath: str, stat: os.stat_result) -> str:
+        """
+        Hash the content of a file, reusing the hash recorded for the same
+            path, size and mtime.
+
+        Args:
+            filepath (str): The file to hash.
+            stat (os.stat_result): The current stat of the file.
+
+        Returns:
+            (str): Hex digest of the file content.
+        """
+        abspath: str = os.path.abspath(filepath)
+        record_path: str = os.path.join(
+            self.cache_dir,
+            hashlib.sha256(abspath.encode()).hexdigest() + self.DIGEST_SUFFIX,
+        )
+        try:
+            with open(record_path) as f:
+                record: dict = json.load(f)
+            if (record["size"], record["mtime_ns"]) == (
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                return record["digest"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        hasher = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        digest: str = hasher.hexdigest()
+
+        self._write_atomic(
+            record_path,
+            json.dumps(
+                {
+                    "path": abspath,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "digest": digest,
+                }
+            ).encode(),
+        )
+        return digest
+
+    def _get_paths(self, key: str) -> tuple[str, str]:
+        return (
+            os.path.join(self.cache_dir, f"{key}{self.DATA_SUFFIX}"),
+            os.path.join(self.cache_dir, f"{key}{self.SCHEMA_SUFFIX}"),
+        )
+
+    def load(self, key: str):
+        """
+        Load data and schema from the cache.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            (tuple[pd.DataFrame, Schema, pd.DataFrame | None] | None):
+                The cached data, schema and compact dtypes report,
+                or None on a miss.
+        """
+        import pandas as pd
+        import pyarrow.feather as feather
+        import yaml
+
+        data_path, schema_path = self._get_paths(key)
+        try:
+            with open(schema_path) as f:
+                schema = _schema_from_dict(yaml.safe_load(f))
+            table = feather.read_table(data_path, memory_map=True)
+            metadata: dict = table.schema.metadata or {}
+            data: pd.DataFrame = table.to_pandas()
+            # Loader gives pd.NA in text columns, Arrow nulls come back as None
+            for col, dtype in data.dtypes.items():
+                if pd.api.types.is_object_dtype(dtype) and table.column(col).null_count:
+                    data[col] = data[col].fillna(pd.NA)
+            # Arrow-backed strings come back with the default storage otherwise
+            for col in json.loads(metadata.get(self.PYARROW_STRINGS_KEY, b"[]")):
+                data[col] = data[col].astype("string[pyarrow]")
+            report: pd.DataFrame | None = None
+            if self.COMPACT_REPORT_KEY in metadata:
+                report = pd.DataFrame(**json.loads(metadata[self.COMPACT_REPORT_KEY]))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self._remove(data_path)
+            self._remove(schema_path)
+            return None
+
+        # Mark as recently used for LRU eviction
+        for path in (data_path, schema_path):
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+        return data, schema, report
+
+    def save(self, key: str, data, schema, report=None) -> None:
+        """
+        Store data and schema in the cache, then evict above the size cap.
+
+        Args:
+            key (str): The cache key.
+            data (pd.DataFrame): The loaded data.
+            schema (Schema): The schema of the data.
+            report (pd.DataFrame, optional): The compact dtypes report of the load.
+        """
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        import yaml
+
+        try:
+            schema_payload: bytes = yaml.dump(
+                dataclasses.asdict(schema),
+                Dumper=_get_schema_dumper(),
+                allow_unicode=True,
+                sort_keys=False,
+            ).encode("utf-8")
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            metadata: dict = {
+                **(table.schema.metadata or {}),
+                self.PYARROW_STRINGS_KEY: json.dumps(
+                    [
+                        col
+                        for col, dtype in data.dtypes.items()
+                        if isinstance(dtype, pd.StringDtype)
+                        and dtype.storage == "pyarrow"
+                    ]
+                ),
+            }
+            if report is not None:
+                split: dict = report.to_dict(orient="split")
+                metadata[self.COMPACT_REPORT_KEY] = json.dumps(
+                    {"data": split["data"], "columns": split["columns"]}
+                )
+            table = table.replace_schema_metadata(metadata)
+        except Exception as e:
+            self._logger.warning(f"Data for cache entry {key} is not cacheable: {e}")
+            return
+
+        if table.nbytes + len(schema_payload) > self.max_size:
+            self._logger.info(
+                f"Skip caching {key}: {table.nbytes} bytes exceeds the cache size limit"
+            )
+            return
+
+        data_path, schema_path = self._get_paths(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            # Uncompressed, so hits can be memory-mapped
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+            os.replace(tmp_path, data_path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        # The schema is written last, an entry is complete once it exists
+        self._write_atomic(schema_path, schema_payload)
+
+        self._evict()
+
+    def _write_atomic(self, path: str, payload: bytes) -> None:
+        """
+        Write a file through a temporary file, so readers never see a partial one.
+
+        Args:
+            path (str): The file to write.
+            payload (bytes): The content of the file.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits the size cap.
+        """
+        entries: dict[str, list] = {}
+        for name in os.listdir(self.cache_dir):
+            for suffix in (self.DATA_SUFFIX, self.SCHEMA_SUFFIX):
+                if name.endswith(suffix):
+                    break
+            else:
+                continue
+            path: str = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entry = entries.setdefault(name[: -len(suffix)], [0.0, 0, []])
+            entry[0] = max(entry[0], stat.st_mtime)
+            entry[1] += stat.st_size
+            entry[2].append(path)
+
+        total_size: int = sum(size for _, size, _ in entries.values())
+        for key, (_, size, paths) in sorted(
+            entries.items(), key=lambda item: item[1][0]
+        ):
+            if total_size <= self.max_size:
+                break
+            self._logger.debug(f"Evicting cache entry {key}")
+            for path in paths:
+                self._remove(path)
+            total_size -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _get_schema_dumper():
+    """
+    Build a YAML SafeDumper also writing the numpy scalars and pandas Timestamps
+        found in schema statistics, as plain Python values.
+
+    Returns:
+        (type[yaml.SafeDumper]): The dumper class.
+    """
+    import datetime
+
+    import numpy as np
+    import yaml
+
+    class SchemaDumper(yaml.SafeDumper):
+        pass
+
+    SchemaDumper.add_multi_representer(
+        np.generic, lambda dumper, value: dumper.represent_data(value.item())
+    )
+    SchemaDumper.add_multi_representer(
+        datetime.datetime, yaml.SafeDumper.represent_datetime
+    )
+    return SchemaDumper
+
+
+def _schema_from_dict(config: dict):
+    """
+    Rebuild a Schema written as dataclasses.asdict() by LoadCache.
+
+    Args:
+        config (dict): The schema fields.
+
+    Returns:
+        (Schema): The schema.
+    """
+    from petsard.metadater.metadata import Attribute, Schema
+    from petsard.metadater.stats import FieldStats, TableStats
+
+    attributes: dict = {}
+    for name, attribute in (config.pop("attributes", None) or {}).items():
+        if attribute.get("stats") is not None:
+            attribute["stats"] = FieldStats(**attribute["stats"])
+        attributes[name] = Attribute(**attribute)
+
+    if config.get("stats") is not None:
+        stats: dict = config["stats"]
+        stats["field_stats"] = {
+            name: FieldStats(**field_stats)
+            for name, field_stats in (stats.get("field_stats") or {}).items()
+        }
+        config["stats"] = TableStats(**stats)
+    return Schema(attributes=attributes, **config)
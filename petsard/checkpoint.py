@@ -0,0 +1,199 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+
+from petsard.exceptions import ConfigError
+
+
+class ExecutorCheckpoint:
+    """
+    On-disk progress record of an Executor run.
+
+    Every finished branch of the experiment tree is persisted as it completes:
+        its leaf result and the accumulated Reporter report,
+        so that an interrupted run can be resumed
+        without re-running the finished branches.
+
+    Layout of the checkpoint directory:
+        - index.json: config digest and completed branches
+        - results/<digest>.pkl: leaf result of each completed branch
+        - report.pkl: Status report accumulated by Reporter
+    """
+
+    INDEX_FILENAME: str = "index.json"
+    REPORT_FILENAME: str = "report.pkl"
+    RESULTS_DIRNAME: str = "results"
+
+    def __init__(self, checkpoint_dir: str):
+        """
+        Args:
+            checkpoint_dir (str): Directory to store the checkpoint.
+
+        Attr.:
+            _logger (logging.Logger): The logger object.
+            checkpoint_dir (str): Directory to store the checkpoint.
+            config_digest (str): Digest of the workflow config the checkpoint belongs to.
+            completed (dict[str, str]): Full experiment name -> result filename
+                of every completed branch, in completion order.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.checkpoint_dir: str = checkpoint_dir
+        self.config_digest: str = ""
+        self.completed: dict[str, str] = {}
+
+        index_path: str = os.path.join(self.checkpoint_dir, self.INDEX_FILENAME)
+        if os.path.isfile(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                index: dict = json.load(f)
+            self.config_digest = index.get("config_digest", "")
+            self.completed = index.get("completed", {})
+
+    @staticmethod
+    def get_config_digest(config: dict) -> str:
+        """
+        Digest a workflow config, to tell whether a checkpoint belongs to it.
+
+        Args:
+            config (dict): The workflow config (Config.yaml).
+
+        Returns:
+            (str): Hex digest of the config.
+        """
+        return hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=repr).encode()
+        ).hexdigest()
+
+    def exists(self) -> bool:
+        """
+        Returns:
+            (bool): Whether a checkpoint has been recorded in the directory.
+        """
+        return bool(self.config_digest)
+
+    def start(self, config_digest: str) -> None:
+        """
+        Start a new checkpoint, discarding any previous progress in the directory.
+
+        Args:
+            config_digest (str): Digest of the workflow config.
+        """
+        self.config_digest = config_digest
+        self.completed = {}
+        results_dir: str = os.path.join(self.checkpoint_dir, self.RESULTS_DIRNAME)
+        os.makedirs(results_dir, exist_ok=True)
+        for filename in os.listdir(results_dir):
+            self._remove(os.path.join(results_dir, filename))
+        self._remove(os.path.join(self.checkpoint_dir, self.REPORT_FILENAME))
+        self._write_index()
+
+    def validate(self, config_digest: str) -> None:
+        """
+        Check the checkpoint can be used to resume the given workflow.
+
+        Args:
+            config_digest (str): Digest of the workflow config.
+
+        Raises:
+            ConfigError: If there is no checkpoint, or it belongs to another config.
+        """
+        if not self.exists():
+            error_msg: str = f"No checkpoint found in {self.checkpoint_dir}"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.config_digest != config_digest:
+            error_msg = (
+                f"Checkpoint in {self.checkpoint_dir} was recorded "
+                "for a different workflow config"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+    def save(self, full_expt_name: str, result, status) -> None:
+        """
+        Record a completed branch.
+
+        Args:
+            full_expt_name (str): Full experiment name of the branch leaf.
+            result: The leaf result collected by the Executor.
+            status (Status): The current status.
+        """
+        filename: str = (
+            hashlib.sha256(full_expt_name.encode()).hexdigest()[:16] + ".pkl"
+        )
+        self._write_pickle(
+            os.path.join(self.checkpoint_dir, self.RESULTS_DIRNAME, filename), result
+        )
+        if hasattr(status, "report"):
+            self._write_pickle(
+                os.path.join(self.checkpoint_dir, self.REPORT_FILENAME), status.report
+            )
+
+        self.completed[full_expt_name] = filename
+        self._write_index()
+        self._logger.debug(f"Checkpoint saved for {full_expt_name}")
+
+    def load_results(self) -> dict:
+        """
+        Returns:
+            (dict): Full experiment name -> leaf result of every completed branch.
+        """
+        results: dict = {}
+        for full_expt_name, filename in self.completed.items():
+            path: str = os.path.join(
+                self.checkpoint_dir, self.RESULTS_DIRNAME, filename
+            )
+            with open(path, "rb") as f:
+                results[full_expt_name] = pickle.load(f)
+        return results
+
+    def load_report(self) -> dict:
+        """
+        Returns:
+            (dict): The Status report accumulated up to the checkpoint.
+        """
+        path: str = os.path.join(self.checkpoint_dir, self.REPORT_FILENAME)
+        if not os.path.isfile(path):
+            return {}
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def _write_index(self) -> None:
+        payload: bytes = json.dumps(
+            {
+                "config_digest": self.config_digest,
+                "completed": self.completed,
+            },
+            indent=2,
+        ).encode("utf-8")
+        self._write_atomic(
+            os.path.join(self.checkpoint_dir, self.INDEX_FILENAME), payload
+        )
+
+    def _write_pickle(self, path: str, obj) -> None:
+        self._write_atomic(path, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    def _write_atomic(path: str, payload: bytes) -> None:
+        # Write to a temporary file first so an interrupted run never leaves a partial file
+        directory: str = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception:
+            ExecutorCheckpoint._remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -6,6 +6,56 @@ from petsard import adapter
 from petsard.exceptions import ConfigError
 
 
+class AdapterQueue(queue.Queue):
+    """
+    Queue of operators which builds each adapter only when it is taken out.
+
+    Items are stored as (adapter class, experiment config) specs,
+        so no adapter exists before the Executor needs it,
+        and every get() returns a fresh adapter on a private copy of the config.
+    """
+
+    def get(self, block: bool = True, timeout: float | None = None):
+        """
+        Remove the next spec from the queue and build its adapter.
+
+        Args:
+            block (bool): Block until an item is available. Default is True.
+            timeout (float, optional): Seconds to wait when blocking.
+
+        Returns:
+            (BaseAdapter): The newly constructed adapter.
+        """
+        return self.build_adapter(self.get_spec(block=block, timeout=timeout))
+
+    def get_spec(self, block: bool = True, timeout: float | None = None) -> tuple:
+        """
+        Remove the next spec from the queue without building its adapter.
+
+        Args:
+            block (bool): Block until an item is available. Default is True.
+            timeout (float, optional): Seconds to wait when blocking.
+
+        Returns:
+            (tuple): (adapter class, experiment config).
+        """
+        return super().get(block=block, timeout=timeout)
+
+    @staticmethod
+    def build_adapter(spec: tuple):
+        """
+        Build an adapter from a queued spec.
+
+        Args:
+            spec (tuple): (adapter class, experiment config).
+
+        Returns:
+            (BaseAdapter): The newly constructed adapter.
+        """
+        adapter_class, expt_config = spec
+        return adapter_class(deepcopy(expt_config))
+
+
 class Config:
     """
     The config of experiment for executor to read.
@@ -27,7 +77,7 @@ class Config:
         Args:
             config (dict): The configuration dictionary.
         """
-        self.config: queue.Queue = queue.Queue()
+        self.config: AdapterQueue = AdapterQueue()
         self.module_flow: queue.Queue = queue.Queue()
         self.expt_flow: queue.Queue = queue.Queue()
         self.sequence: list = []
@@ -54,22 +104,33 @@ class Config:
 
         self.config, self.module_flow, self.expt_flow = self._set_flow()
 
-    def _set_flow(self) -> tuple[queue.Queue, queue.Queue, queue.Queue]:
+    def _set_flow(self) -> tuple[AdapterQueue, queue.Queue, queue.Queue]:
         """
         Populate queues with module operators.
 
+        Adapters are not constructed here: the flow only keeps
+            the adapter class and its experiment config,
+            and each adapter is built when it is taken out of the queue.
+            Each experiment config is validated once beforehand,
+            so an invalid experiment fails here, not when its step runs.
+
         Returns:
-            flow (queue.Queue):
-                Queue containing the operators in the order they were traversed.
+            flow (AdapterQueue):
+                Queue containing the operator specs in the order they were traversed.
             module_flow (queue.Queue):
                 Queue containing the module names corresponding to each operator.
             expt_flow (queue.Queue):
                 Queue containing the experiment names corresponding to each operator.
         """
-        flow: queue.Queue = queue.Queue()
+        flow: AdapterQueue = AdapterQueue()
         module_flow: queue.Queue = queue.Queue()
         expt_flow: queue.Queue = queue.Queue()
 
+        for module in self.sequence:
+            adapter_class = getattr(adapter, f"{module}Adapter")
+            for expt_config in self.yaml[module].values():
+                adapter_class.validate(expt_config)
+
         def _set_flow_dfs(modules):
             """
             Depth-First Search (DFS) algorithm
@@ -86,7 +147,7 @@ class Config:
                     # Get adapter class from petsard.adapter module
                     adapter_class_name = f"{module}Adapter"
                     adapter_class = getattr(adapter, adapter_class_name)
-                    flow.put(adapter_class(expt_config))
+                    flow.put((adapter_class, expt_config))
                     module_flow.put(module)
                     expt_flow.put(expt_name)
                     _set_flow_dfs(remaining_modules)
@@ -94,10 +155,28 @@ class Config:
         _set_flow_dfs(self.sequence)
         return flow, module_flow, expt_flow
 
+    def get_flow(self) -> list[tuple[str, str, tuple]]:
+        """
+        List the queued flow without consuming it.
+
+        Returns:
+            (list[tuple]): (module, expt, adapter spec) in the order they will run.
+        """
+        return list(
+            zip(
+                list(self.module_flow.queue),
+                list(self.expt_flow.queue),
+                list(self.config.queue),
+                strict=True,
+            )
+        )
+
     def _splitter_handler(self, config: dict) -> dict:
         """
         Transforms and expands the Splitter configuration for each specified 'num_samples',
             creating unique entries with a new experiment name format '{expt_name}_0n|NN}."
+            Expanded entries carry a "_batch" key (group, index, size),
+            so that SplitterAdapter generates the splits of a group in one call.
 
         Args:
             config (dict): The original Splitter configuration.
@@ -117,5 +196,16 @@ class Config:
                 # fill zero on n
                 formatted_n = f"{n + 1:0{zero_padding}}"
                 iter_expt_name = f"{expt_name}_[{num_samples}-{formatted_n}]"
-                transformed_config[iter_expt_name] = iter_expt_config
+                if num_samples > 1:
+                    # Let the expanded experiments share one batch of splits
+                    transformed_config[iter_expt_name] = {
+                        **iter_expt_config,
+                        "_batch": {
+                            "group": expt_name,
+                            "index": n + 1,
+                            "size": num_samples,
+                        },
+                    }
+                else:
+                    transformed_config[iter_expt_name] = iter_expt_config
         return transformed_config
@@ -1,3 +1,4 @@
+import importlib
 import logging
 import re
 import time
@@ -8,13 +9,29 @@ from typing import Any
 import pandas as pd
 
 from petsard.config_base import BaseConfig
-from petsard.evaluator.anonymeter import Anonymeter
 from petsard.evaluator.customer_evaluator import CustomEvaluator
 from petsard.evaluator.evaluator_base import BaseEvaluator
-from petsard.evaluator.mlutility import MLUtility
-from petsard.evaluator.mpuccs import MPUCCs
-from petsard.evaluator.sdmetrics import SDMetricsSingleTable
 from petsard.exceptions import UncreatedError, UnsupportedMethodError
+from petsard.instrumentation import span
+
+
+def _import_evaluator_class(
+    evaluator_class: BaseEvaluator | tuple[str, str],
+) -> BaseEvaluator:
+    """
+    Resolve an evaluator class given lazily as (module, class name).
+
+    Args:
+        evaluator_class (BaseEvaluator | tuple[str, str]):
+            The evaluator class, or the module and name to import it from.
+
+    Returns:
+        BaseEvaluator: The evaluator class.
+    """
+    if isinstance(evaluator_class, tuple):
+        module_name, class_name = evaluator_class
+        evaluator_class = getattr(importlib.import_module(module_name), class_name)
+    return evaluator_class
 
 
 class EvaluatorMap(Enum):
@@ -111,12 +128,14 @@ class Evaluator:
     as well as analyzing data based on the evaluation criteria.
     """
 
-    EVALUATOR_MAP: dict[int, BaseEvaluator] = {
-        EvaluatorMap.DEFAULT: SDMetricsSingleTable,
-        EvaluatorMap.ANONYMETER: Anonymeter,
-        EvaluatorMap.MPUCCS: MPUCCs,
-        EvaluatorMap.SDMETRICS: SDMetricsSingleTable,
-        EvaluatorMap.MLUTILITY: MLUtility,
+    # Built-in evaluators wrap heavy libraries (sdmetrics, anonymeter, sklearn, ...),
+    #   so they are given as (module, class name) and imported on first use.
+    EVALUATOR_MAP: dict[int, BaseEvaluator | tuple[str, str]] = {
+        EvaluatorMap.DEFAULT: ("petsard.evaluator.sdmetrics", "SDMetricsSingleTable"),
+        EvaluatorMap.ANONYMETER: ("petsard.evaluator.anonymeter", "Anonymeter"),
+        EvaluatorMap.MPUCCS: ("petsard.evaluator.mpuccs", "MPUCCs"),
+        EvaluatorMap.SDMETRICS: ("petsard.evaluator.sdmetrics", "SDMetricsSingleTable"),
+        EvaluatorMap.MLUTILITY: ("petsard.evaluator.mlutility", "MLUtility"),
         EvaluatorMap.CUSTOM_METHOD: CustomEvaluator,
     }
     # Note: Stats and Describe functionality are now only available through the Describer class
@@ -182,7 +201,7 @@ class Evaluator:
         Returns:
             BaseEvaluator: The evaluator object.
         """
-        return self.EVALUATOR_MAP[self.config.method_code]
+        return _import_evaluator_class(self.EVALUATOR_MAP[self.config.method_code])
 
     def create(self) -> None:
         """
@@ -242,7 +261,10 @@ class Evaluator:
         self._logger.debug(
             f"Evaluating data with keys {list(data.keys())} using evaluation method: {self.config.eval_method}"
         )
-        evaluated_report: dict[str, pd.DataFrame] = self._impl.eval(data=data)
+        with span("eval") as eval_span:
+            eval_span.set_input(data)
+            evaluated_report: dict[str, pd.DataFrame] = self._impl.eval(data=data)
+            eval_span.set_output(evaluated_report)
         time_spent: float = round(time.time() - time_start, 4)
         self._logger.info(f"Evaluation completed successfully in {time_spent} seconds")
 
@@ -1,16 +1,24 @@
 import logging
 import os
 import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 
+import pandas as pd
 import yaml
 
-from petsard.config import Config
+from petsard.adapter import BaseAdapter
+from petsard.cache import StageCache
+from petsard.checkpoint import ExecutorCheckpoint
+from petsard.config import AdapterQueue, Config
 from petsard.config_base import BaseConfig
 from petsard.exceptions import ConfigError
-from petsard.status import Status
+from petsard.planner import ExecutionPlan, ExecutionPlanner, TimingHistory
+from petsard.status import Status, TimingRecord
 
 if TYPE_CHECKING:
     from petsard.metadater.metadata import Schema
@@ -35,12 +43,49 @@ class ExecutorConfig(BaseConfig):
             - CRITICAL
         log_dir (str): Directory for storing log files
         log_name (str): Log file name template (can include {timestamp})
+        max_workers (int): Number of worker processes for independent experiment branches
+            - 1: run the whole flow serially (default)
+            - N > 1: run sibling branches below Loader/Splitter in a process pool
+        cache_dir (str, optional): Directory of the stage cache.
+            Loader/Splitter/Preprocessor/Synthesizer steps whose config and upstream
+            are unchanged are loaded from it instead of re-executed.
+            Splitter/Synthesizer steps without random_state are never cached,
+            and neither are the steps downstream of them.
+            Default is None, which disables the cache.
+        cache_max_size_mb (int): Size cap of the stage cache in MB,
+            least recently used entries are evicted above it. Default is 1024.
+        checkpoint_dir (str, optional): Directory to record finished branches in,
+            so an interrupted run can be continued with Executor.resume().
+            Default is None, which disables checkpointing.
+        copy_on_write (bool): Hand off DataFrames between modules without copying.
+            Enables pandas Copy-on-Write for the process, so a module only copies
+            the columns it modifies. Default is False.
+        memory_budget_mb (int, optional): Memory budget of the operators kept in Status.
+            Above it, idle operators and finished snapshot schemas spill to disk
+            and are reloaded on access. Default is None, which keeps all in memory.
+        spill_dir (str, optional): Directory for spilled artifacts.
+            Default is a temporary directory.
+        trace_memory (bool): Record the memory delta and peak of every module
+            and sub-step with tracemalloc in the timing report.
+            Default is False, as tracing slows allocation-heavy modules down.
+        timing_history (str, optional): Path of a JSON file the timing of every run
+            is appended to, so Executor.plan() can estimate later runs from it.
+            Default is None, which keeps no history.
     """
 
     log_output_type: str = "file"
     log_level: str = "INFO"
     log_dir: str = "."
     log_filename: str = "PETsARD_{timestamp}.log"
+    max_workers: int = 1
+    cache_dir: str | None = None
+    cache_max_size_mb: int = 1024
+    checkpoint_dir: str | None = None
+    copy_on_write: bool = False
+    memory_budget_mb: int | None = None
+    spill_dir: str | None = None
+    trace_memory: bool = False
+    timing_history: str | None = None
 
     def __post_init__(self):
         """
@@ -51,6 +96,135 @@ class ExecutorConfig(BaseConfig):
             raise ConfigError("Invalid log_output_type {self.log_output_type}")
         if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
             raise ConfigError("Invalid log_level {self.log_level}")
+        if not isinstance(self.max_workers, int) or self.max_workers < 1:
+            raise ConfigError(f"Invalid max_workers {self.max_workers}")
+        if not isinstance(self.cache_max_size_mb, int) or self.cache_max_size_mb < 1:
+            raise ConfigError(f"Invalid cache_max_size_mb {self.cache_max_size_mb}")
+        if self.memory_budget_mb is not None and (
+            not isinstance(self.memory_budget_mb, int) or self.memory_budget_mb < 1
+        ):
+            raise ConfigError(f"Invalid memory_budget_mb {self.memory_budget_mb}")
+
+
+def _run_adapter(
+    module: str,
+    expt: str,
+    spec: tuple,
+    status: Status,
+    stage_cache: StageCache | None,
+    cache_keys: list[str],
+) -> BaseAdapter:
+    """
+    Build and run one step, through the stage cache if it is enabled.
+
+    Args:
+        module (str): The name of the module.
+        expt (str): The name of the experiment.
+        spec (tuple): (adapter class, experiment config) as queued by Config.
+        status (Status): The status the step reads its input from,
+            and records the timing of the step.
+        stage_cache (StageCache): The stage cache, None if disabled.
+        cache_keys (list[str]): Cache keys of the current branch by sequence index,
+            updated in place with the key of this step.
+
+    Returns:
+        (BaseAdapter): The executed or cached operator.
+    """
+    depth: int = status.sequence.index(module)
+    # No key is needed once no cacheable module follows in the sequence
+    last_cacheable: int = max(
+        (
+            i
+            for i, name in enumerate(status.sequence)
+            if name in StageCache.CACHEABLE_MODULES
+        ),
+        default=-1,
+    )
+    if stage_cache is None or depth > last_cacheable:
+        ops = AdapterQueue.build_adapter(spec)
+        with status.recording(expt):
+            ops.run(ops.set_input(status=status))
+        return ops
+
+    del cache_keys[depth:]
+    key: str = stage_cache.make_key(
+        module, spec, cache_keys[-1] if cache_keys else "", status
+    )
+    cache_keys.append(key)
+
+    cacheable: bool = module in StageCache.CACHEABLE_MODULES and not key.startswith(
+        StageCache.RUN_LOCAL_PREFIX
+    )
+    if cacheable:
+        ops = stage_cache.load(key)
+        if ops is not None:
+            logger = logging.getLogger("PETsARD.Executor")
+            logger.info(f"Loaded {module} from stage cache ({key[:12]})")
+            if spec[1].get("random_state") is not None:
+                logger.info(
+                    f"{module} {expt} replays the cached draw of "
+                    f"random_state {spec[1].get('random_state')!r}"
+                )
+            return ops
+
+    ops = AdapterQueue.build_adapter(spec)
+    with status.recording(expt):
+        ops.run(ops.set_input(status=status))
+    if cacheable:
+        stage_cache.save(key, ops)
+    return ops
+
+
+def _run_branch(
+    sequence: list[str],
+    prefix: list[tuple[str, str, BaseAdapter]],
+    steps: list[tuple[str, str, tuple | None]],
+    stage_cache: StageCache | None,
+    cache_keys: list[str],
+    trace_memory: bool = False,
+) -> list[tuple[BaseAdapter | None, list[TimingRecord]]]:
+    """
+    Worker entry point of the Executor parallel mode.
+
+    Rebuild a private Status from the upstream operators of the branch,
+        then run one experiment subtree serially.
+
+    Args:
+        sequence (list[str]): The module sequence of the whole workflow.
+        prefix (list[tuple]): (module, expt, operator) already executed upstream, in order.
+        steps (list[tuple]): (module, expt, adapter spec) of the subtree in DFS order.
+            The spec is (adapter class, experiment config) as queued by Config,
+            or None for steps deferred to the main process (e.g. Reporter).
+        stage_cache (StageCache, optional): The stage cache, None if disabled.
+        cache_keys (list[str]): Cache keys of the upstream steps.
+        trace_memory (bool): Whether to record tracemalloc metrics in the timing.
+
+    Returns:
+        (list[tuple]): (executed operator, timing records) for each step,
+            (None, []) for the deferred steps.
+    """
+    status = Status(
+        config=SimpleNamespace(sequence=sequence), trace_memory=trace_memory
+    )
+    outcomes: list[tuple[BaseAdapter | None, list[TimingRecord]]] = []
+    try:
+        for module, expt, ops in prefix:
+            status.put(module, expt, ops)
+
+        for module, expt, spec in steps:
+            if spec is None:
+                outcomes.append((None, []))
+                continue
+
+            timing_start: int = len(status.timing_records)
+            ops = _run_adapter(module, expt, spec, status, stage_cache, cache_keys)
+            status.put(module, expt, ops)
+            outcomes.append((ops, list(status.timing_records)[timing_start:]))
+    finally:
+        # Worker processes are reused across branches
+        status.close()
+
+    return outcomes
 
 
 class Executor:
@@ -91,8 +265,19 @@ class Executor:
 
         self.config = Config(config=yaml_config)
         self.sequence = self.config.sequence
-        self.status = Status(config=self.config)
+        self.status = self._create_status()
         self.result: dict = {}
+        self.stage_cache: StageCache | None = (
+            StageCache(
+                cache_dir=self.executor_config.cache_dir,
+                max_size_mb=self.executor_config.cache_max_size_mb,
+            )
+            if self.executor_config.cache_dir
+            else None
+        )
+        self.checkpoint: ExecutorCheckpoint | None = None
+        # Whether final results are collected in self.result (False in iter_run)
+        self._keep_results: bool = True
 
         # 4. Infer Schema (if Preprocessor is included in config)
         self._infer_pipeline_schemas(yaml_config)
@@ -101,6 +286,20 @@ class Executor:
         # NOTE: This attribute will be removed in v2.0.0 and replaced with run() return value
         self._execution_completed: bool = False
 
+    def _create_status(self) -> Status:
+        """
+        Create a Status with the memory budget of the Executor config.
+
+        Returns:
+            (Status): The new Status.
+        """
+        return Status(
+            config=self.config,
+            memory_budget_mb=self.executor_config.memory_budget_mb,
+            spill_dir=self.executor_config.spill_dir,
+            trace_memory=self.executor_config.trace_memory,
+        )
+
     def _create_formatter(self) -> logging.Formatter:
         """
         Create log formatter with standardized format.
@@ -275,33 +474,91 @@ class Executor:
         instead of None. Use is_execution_completed() to check completion status
         in the current version.
         """
+        for _ in self._iter_flow():
+            pass
+
+        # TODO: In v2.0.0, return execution status here
+        # return "success"  # or "failed" based on execution result
+
+    def iter_run(self) -> Iterator[tuple[str, Any, pd.DataFrame]]:
+        """
+        iter_run(): Runs the operators like run(), yielding every branch as it completes.
+
+        Final module results are handed to the caller instead of kept in self.result,
+            so they can be written, scored or discarded incrementally.
+            In the parallel mode, branches are yielded in configuration order.
+
+        Yields:
+            (tuple[str, Any, pd.DataFrame]):
+                - full_expt_name: Full experiment name of the branch, as in get_result().
+                - result: Result of the final module of the branch.
+                - timing: Timing report data of the steps on the branch.
+        """
+        for full_expt_name, result in self._iter_flow(keep_results=False):
+            yield full_expt_name, result, self.status.get_branch_timing_data()
+
+    def _iter_flow(self, keep_results: bool = True) -> Iterator[tuple[str, Any]]:
+        """
+        Run the whole flow, yielding every branch as its final module completes.
+
+        Args:
+            keep_results (bool): Whether to collect final results in self.result.
+                Default is True.
+
+        Yields:
+            (tuple[str, Any]): Full experiment name and final result of the branch.
+        """
         # Reset execution state
         self._execution_completed = False
+        self._keep_results = keep_results
         start_time: float = time.time()
         self._logger.info("Starting PETsARD execution workflow")
-        while self.config.config.qsize() > 0:
-            ops = self.config.config.get()
-            module = self.config.module_flow.get()
-            expt = self.config.expt_flow.get()
 
-            self._logger.info(f"Executing {module} with {expt}")
-            ops.run(ops.set_input(status=self.status))
-
-            self.status.put(module, expt, ops)
+        if self.checkpoint is None and self.executor_config.checkpoint_dir:
+            self.checkpoint = ExecutorCheckpoint(self.executor_config.checkpoint_dir)
+            self.checkpoint.start(
+                ExecutorCheckpoint.get_config_digest(self.config.yaml)
+            )
 
-            # CRITICAL: Infer Preprocessor Schema immediately after Loader/Splitter execution
-            # This ensures that Synthesizer and other downstream modules get the correct Schema
-            if (
-                module in ["Loader", "Splitter"]
-                and "_preprocessor_config" in self.status.inferred_schemas
-            ):
-                self._logger.info(
-                    f"{module} execution completed, starting Preprocessor Schema inference"
-                )
-                self.infer_preprocessor_schema()
+        # Restored when the run ends, so the caller's pandas session is unchanged
+        copy_on_write_before = pd.options.mode.copy_on_write
+        if self.executor_config.copy_on_write:
+            # Adapters share DataFrames and rely on pandas to copy on modification
+            pd.set_option("mode.copy_on_write", True)
 
-            # collect result
-            self._set_result(module)
+        try:
+            if self.executor_config.max_workers > 1:
+                yield from self._iter_parallel()
+            else:
+                cache_keys: list[str] = []
+                while self.config.config.qsize() > 0:
+                    if self.stage_cache is None:
+                        ops = self.config.config.get()
+                        module = self.config.module_flow.get()
+                        expt = self.config.expt_flow.get()
+
+                        leaf = self._execute_step(module, expt, ops)
+                    else:
+                        spec = self.config.config.get_spec()
+                        module = self.config.module_flow.get()
+                        expt = self.config.expt_flow.get()
+
+                        self._logger.info(f"Executing {module} with {expt}")
+                        ops = _run_adapter(
+                            module,
+                            expt,
+                            spec,
+                            self.status,
+                            self.stage_cache,
+                            cache_keys,
+                        )
+                        leaf = self._record_step(module, expt, ops)
+
+                    if leaf is not None:
+                        yield leaf
+        finally:
+            self._keep_results = True
+            pd.set_option("mode.copy_on_write", copy_on_write_before)
 
         elapsed_time: float = time.time() - start_time
         formatted_elapsed_time: str = str(timedelta(seconds=round(elapsed_time)))
@@ -309,13 +566,363 @@ class Executor:
             f"Completed PETsARD execution workflow (elapsed: {formatted_elapsed_time})"
         )
 
+        if self.executor_config.timing_history:
+            TimingHistory(self.executor_config.timing_history).record(
+                ExecutorCheckpoint.get_config_digest(self.config.yaml),
+                self.config.yaml,
+                self.status.get_timing_report_data(),
+            )
+
         # Mark execution as completed
         self._execution_completed = True
 
-        # TODO: In v2.0.0, return execution status here
-        # return "success"  # or "failed" based on execution result
+    def plan(self) -> ExecutionPlan:
+        """
+        plan(): Expands the configuration without running anything.
+
+        Reports how often each module/experiment pair will run,
+            and estimates time and memory per stage from the data shape
+            of local Loader files and the timing_history of previous runs.
+
+        Returns:
+            (ExecutionPlan): The expanded flow with its cost estimates.
+        """
+        history: TimingHistory | None = (
+            TimingHistory(self.executor_config.timing_history)
+            if self.executor_config.timing_history
+            else None
+        )
+        fanout_depth, _ = self._get_parallel_depths()
+        plan: ExecutionPlan = ExecutionPlanner(
+            sequence=self.sequence,
+            flow=self.config.get_flow(),
+            fanout_depth=fanout_depth,
+            max_workers=self.executor_config.max_workers,
+            history=history,
+            config_digest=ExecutorCheckpoint.get_config_digest(self.config.yaml),
+        ).plan()
+
+        self._logger.info(
+            f"Planned {len(plan.stages)} stages in {plan.n_branches} branches, "
+            f"estimated {plan.est_total_seconds:.2f}s serial, "
+            f"{plan.est_parallel_seconds:.2f}s with {plan.max_workers} workers"
+        )
+        if plan.unestimated_stages:
+            self._logger.info(
+                f"No time estimate for: {', '.join(plan.unestimated_stages)}"
+            )
+        return plan
+
+    def resume(self, checkpoint_dir: str | None = None):
+        """
+        resume(): Continues an interrupted run from its checkpoint.
+
+        Finished branches are restored from the checkpoint instead of re-run.
+            Loader and Splitter steps are always re-run,
+            since Splitter depends on the samples drawn before it.
+
+        Args:
+            checkpoint_dir (str, optional): Directory of the checkpoint.
+                Default is the checkpoint_dir of the Executor config.
+        """
+        checkpoint_dir = checkpoint_dir or self.executor_config.checkpoint_dir
+        if not checkpoint_dir:
+            error_msg: str = "checkpoint_dir is required to resume execution"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        checkpoint = ExecutorCheckpoint(checkpoint_dir)
+        checkpoint.validate(ExecutorCheckpoint.get_config_digest(self.config.yaml))
+        self._logger.info(
+            f"Resuming from {checkpoint_dir} "
+            f"with {len(checkpoint.completed)} completed branches"
+        )
+
+        self.result.update(checkpoint.load_results())
+        if hasattr(self.status, "report"):
+            self.status.report.update(checkpoint.load_report())
+        leaf_names: list[str] = self._skip_completed_branches(set(checkpoint.completed))
 
-    def _set_result(self, module: str):
+        self.checkpoint = checkpoint
+        self.run()
+
+        # Keep results in the same order as an uninterrupted run
+        self.result = {
+            name: self.result[name] for name in leaf_names if name in self.result
+        }
+
+    def _skip_completed_branches(self, completed: set[str]) -> list[str]:
+        """
+        Remove subtrees whose branches are all completed from the Config flow.
+
+        Args:
+            completed (set[str]): Full experiment names of the completed branches.
+
+        Returns:
+            (list[str]): Full experiment names of all branches in DFS order.
+        """
+        flow: list[tuple[str, str, tuple]] = []
+        while self.config.config.qsize() > 0:
+            spec = self.config.config.get_spec()
+            module = self.config.module_flow.get()
+            expt = self.config.expt_flow.get()
+            flow.append((module, expt, spec))
+
+        # Full experiment name of the branch ending at each leaf step
+        leaf_names: dict[int, str] = {}
+        path: list[str] = []
+        for idx, (module, expt, _spec) in enumerate(flow):
+            del path[self.sequence.index(module) :]
+            path.append(f"{module}[{expt}]")
+            if module == self.sequence[-1]:
+                leaf_names[idx] = "_".join(path)
+
+        fanout_depth, _ = self._get_parallel_depths()
+        idx: int = 0
+        while idx < len(flow):
+            module, expt, spec = flow[idx]
+            depth: int = self.sequence.index(module)
+            end: int = idx + 1
+            while end < len(flow) and self.sequence.index(flow[end][0]) > depth:
+                end += 1
+
+            subtree_leaves = [
+                leaf_names[leaf] for leaf in range(idx, end) if leaf in leaf_names
+            ]
+            if (
+                depth >= fanout_depth
+                and subtree_leaves
+                and all(name in completed for name in subtree_leaves)
+            ):
+                self._logger.info(f"Skipping completed branch {module}[{expt}]")
+                idx = end
+                continue
+
+            self.config.config.put(spec)
+            self.config.module_flow.put(module)
+            self.config.expt_flow.put(expt)
+            idx += 1
+
+        return list(leaf_names.values())
+
+    def _execute_step(
+        self, module: str, expt: str, ops: BaseAdapter
+    ) -> tuple[str, Any] | None:
+        """
+        Run a single operator against the current Status and record it.
+
+        Args:
+            module (str): The name of the module.
+            expt (str): The name of the experiment.
+            ops (BaseAdapter): The operator to run.
+
+        Returns:
+            (tuple[str, Any] | None): See _set_result().
+        """
+        self._logger.info(f"Executing {module} with {expt}")
+        with self.status.recording(expt):
+            ops.run(ops.set_input(status=self.status))
+
+        return self._record_step(module, expt, ops)
+
+    def _record_step(
+        self, module: str, expt: str, ops: BaseAdapter
+    ) -> tuple[str, Any] | None:
+        """
+        Put an executed operator into Status and collect its result.
+
+        Args:
+            module (str): The name of the module.
+            expt (str): The name of the experiment.
+            ops (BaseAdapter): The executed operator.
+
+        Returns:
+            (tuple[str, Any] | None): See _set_result().
+        """
+        self.status.put(module, expt, ops)
+
+        # CRITICAL: Infer Preprocessor Schema immediately after Loader/Splitter execution
+        # This ensures that Synthesizer and other downstream modules get the correct Schema
+        if (
+            module in ["Loader", "Splitter"]
+            and "_preprocessor_config" in self.status.inferred_schemas
+        ):
+            self._logger.info(
+                f"{module} execution completed, starting Preprocessor Schema inference"
+            )
+            self.infer_preprocessor_schema()
+
+        # collect result
+        return self._set_result(module)
+
+    def _get_parallel_depths(self) -> tuple[int, int]:
+        """
+        Locate where the experiment tree can be split into independent branches.
+
+        Loader and Splitter carry state across sibling branches
+            (e.g. Splitter avoids overlapping with exist_train_indices),
+            so they always run in the main process.
+        Reporter aggregates reports of all branches,
+            so it is deferred to the main process as well.
+
+        Returns:
+            (tuple[int, int]):
+                - fanout_depth: sequence index of the first module run by workers.
+                - deferred_depth: sequence index of the first module run
+                    by the main process after the workers.
+        """
+        stateful_depths: list[int] = [
+            idx
+            for idx, module in enumerate(self.sequence)
+            if module in ["Loader", "Splitter"]
+        ]
+        fanout_depth: int = max(stateful_depths) + 1 if stateful_depths else 0
+        deferred_depth: int = (
+            self.sequence.index("Reporter")
+            if "Reporter" in self.sequence
+            else len(self.sequence)
+        )
+        return fanout_depth, deferred_depth
+
+    def _iter_parallel(self) -> Iterator[tuple[str, Any]]:
+        """
+        Run the experiment tree with independent sibling branches in a process pool.
+
+        The flow is executed in two phases:
+            1. Execution: Loader/Splitter run in the main process on a working Status,
+                every subtree below them is submitted to the pool.
+            2. Replay: executed operators are put into self.status in the
+                original DFS order, and deferred modules (Reporter) run in between,
+                so results, timing and reports match the serial run.
+
+        Yields:
+            (tuple[str, Any]): See _set_result(), for every completed branch.
+        """
+        flow: list[tuple[str, str, tuple]] = []
+        while self.config.config.qsize() > 0:
+            spec = self.config.config.get_spec()
+            module = self.config.module_flow.get()
+            expt = self.config.expt_flow.get()
+            flow.append((module, expt, spec))
+
+        fanout_depth, deferred_depth = self._get_parallel_depths()
+        if fanout_depth >= deferred_depth:
+            self._logger.info(
+                "No independent branches to parallelize, running serially"
+            )
+            cache_keys: list[str] = []
+            for module, expt, spec in flow:
+                self._logger.info(f"Executing {module} with {expt}")
+                ops = _run_adapter(
+                    module, expt, spec, self.status, self.stage_cache, cache_keys
+                )
+                leaf = self._record_step(module, expt, ops)
+                if leaf is not None:
+                    yield leaf
+            return
+
+        self._logger.info(
+            f"Running experiment branches from {self.sequence[fanout_depth]} "
+            f"with {self.executor_config.max_workers} workers"
+        )
+
+        work_status = self._create_status()
+        try:
+            # plan keeps the DFS order:
+            #   (module, expt, ops, timing records) for steps run in the main process
+            #   (Future, subtree) for steps submitted to the pool
+            plan: list[tuple] = []
+            path: list[tuple[str, str, BaseAdapter]] = []
+            cache_keys: list[str] = []
+            with ProcessPoolExecutor(
+                max_workers=self.executor_config.max_workers
+            ) as pool:
+                idx: int = 0
+                while idx < len(flow):
+                    module, expt, spec = flow[idx]
+                    depth: int = self.sequence.index(module)
+
+                    if depth < fanout_depth:
+                        self._logger.info(f"Executing {module} with {expt}")
+                        timing_start: int = len(work_status.timing_records)
+                        ops = _run_adapter(
+                            module,
+                            expt,
+                            spec,
+                            work_status,
+                            self.stage_cache,
+                            cache_keys,
+                        )
+                        work_status.put(module, expt, ops)
+
+                        del path[depth:]
+                        path.append((module, expt, ops))
+                        plan.append(
+                            (
+                                module,
+                                expt,
+                                ops,
+                                list(work_status.timing_records)[timing_start:],
+                            )
+                        )
+                        idx += 1
+                        continue
+
+                    # Subtree: every following step deeper than the current one
+                    end: int = idx + 1
+                    while end < len(flow) and self.sequence.index(flow[end][0]) > depth:
+                        end += 1
+                    subtree = flow[idx:end]
+                    steps = [
+                        (
+                            step_module,
+                            step_expt,
+                            None
+                            if self.sequence.index(step_module) >= deferred_depth
+                            else step_spec,
+                        )
+                        for step_module, step_expt, step_spec in subtree
+                    ]
+                    self._logger.info(f"Submitting branch {module}[{expt}] to workers")
+                    future: Future = pool.submit(
+                        _run_branch,
+                        self.sequence,
+                        list(path),
+                        steps,
+                        self.stage_cache,
+                        list(cache_keys),
+                        self.executor_config.trace_memory,
+                    )
+                    plan.append((future, subtree))
+                    idx = end
+
+                for entry in plan:
+                    if len(entry) == 4:
+                        module, expt, ops, timing_records = entry
+                        self.status.add_timing_records(timing_records)
+                        leaf = self._record_step(module, expt, ops)
+                        if leaf is not None:
+                            yield leaf
+                        continue
+
+                    future, subtree = entry
+                    outcomes = future.result()
+                    for (module, expt, spec), (done_ops, timing_records) in zip(
+                        subtree, outcomes, strict=True
+                    ):
+                        if done_ops is None:
+                            leaf = self._execute_step(
+                                module, expt, AdapterQueue.build_adapter(spec)
+                            )
+                        else:
+                            self.status.add_timing_records(timing_records)
+                            leaf = self._record_step(module, expt, done_ops)
+                        if leaf is not None:
+                            yield leaf
+        finally:
+            work_status.close()
+
+    def _set_result(self, module: str) -> tuple[str, Any] | None:
         """
         Get the result for a final module.
 
@@ -323,7 +930,9 @@ class Executor:
             module (str): The name of the module.
 
         Returns:
-            None. Update in self.result
+            (tuple[str, Any] | None): Full experiment name and result of the branch
+                if the module is the final module, otherwise None.
+                The result is also kept in self.result unless iterating with iter_run().
         """
         if module == self.sequence[-1]:
             self._logger.debug(f"Collecting final results for {module}")
@@ -331,7 +940,13 @@ class Executor:
             full_expt_name = "_".join(
                 [f"{module}[{expt}]" for module, expt in full_expt.items()]
             )
-            self.result[full_expt_name] = self.status.get_result(module=module)
+            result = self.status.get_result(module=module)
+            if self._keep_results:
+                self.result[full_expt_name] = result
+            if self.checkpoint is not None:
+                self.checkpoint.save(full_expt_name, result, self.status)
+            return full_expt_name, result
+        return None
 
     def get_result(self):
         """
@@ -0,0 +1,283 @@
+"""
+Structured timing and resource metrics of PETsARD operations.
+
+Operations are wrapped in spans:
+
+    with span("fit") as s:
+        s.set_input(data)
+        ...
+
+A span measures wall time, CPU time, peak RSS, optionally the tracemalloc
+    memory delta and peak, and the row/column counts of its input and output.
+Spans are only recorded while a recorder is active (see Status.recording()),
+    so library code can be instrumented unconditionally at no cost otherwise.
+Nested spans are recorded as sub-steps of the enclosing one.
+"""
+
+import itertools
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from sys import platform
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+@dataclass
+class _Recorder:
+    """
+    Receiver of the spans finished while recording is active.
+
+    Attr.:
+        callback (Callable): Called with every finished Span.
+        expt (str): Experiment name recorded on the spans.
+        trace_memory (bool): Whether spans measure memory with tracemalloc.
+    """
+
+    callback: Callable[["Span"], None]
+    expt: str = "default"
+    trace_memory: bool = False
+
+
+_active_recorder: ContextVar[_Recorder | None] = ContextVar(
+    "petsard_active_recorder", default=None
+)
+_active_span: ContextVar["Span | None"] = ContextVar(
+    "petsard_active_span", default=None
+)
+
+
+def _get_peak_rss_mb() -> float | None:
+    """
+    Returns:
+        (float | None): Peak resident set size of the process in MB,
+            None if the platform does not report it.
+    """
+    if resource is None:
+        return None
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if platform == "darwin" else peak / 1024
+
+
+def _get_shape(data, depth: int = 0) -> tuple[int, int] | None:
+    """
+    Count the rows and columns of the data handled by a span.
+
+    Args:
+        data: A DataFrame, or a dict nesting DataFrames (e.g. Splitter output).
+        depth (int): Current nesting depth.
+
+    Returns:
+        (tuple[int, int] | None): (rows, columns),
+            rows summed and columns maxed over nested DataFrames,
+            None if no DataFrame is found.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.shape
+    if isinstance(data, dict) and depth < 3:
+        shapes = [
+            shape
+            for shape in (_get_shape(value, depth + 1) for value in data.values())
+            if shape is not None
+        ]
+        if shapes:
+            return sum(rows for rows, _ in shapes), max(cols for _, cols in shapes)
+    return None
+
+
+@dataclass
+class Span:
+    """
+    Metrics of one instrumented operation.
+
+    Attr.:
+        span_id (int): Identifier of the span within the process.
+        module_name (str): Module the span belongs to.
+        experiment_name (str): Experiment the span belongs to.
+        step_name (str): Name of the operation, e.g. 'run', 'fit', 'sample'.
+        parent_id (int, optional): span_id of the enclosing span, None for top level.
+        start_time (datetime): Start time.
+        end_time (datetime, optional): End time.
+        wall_seconds (float, optional): Elapsed wall time.
+        cpu_seconds (float, optional): CPU time of the process during the span.
+        peak_rss_mb (float, optional): Peak resident set size of the process at the end.
+        memory_delta_mb (float, optional): Change of traced memory (tracemalloc only).
+        memory_peak_mb (float, optional): Peak traced memory above the start (tracemalloc only).
+        input_rows / input_cols (int, optional): Shape of the input data.
+        output_rows / output_cols (int, optional): Shape of the output data.
+        status (str): 'running', 'completed' or 'error'.
+        error (str, optional): Error message if the operation raised.
+    """
+
+    span_id: int
+    module_name: str
+    experiment_name: str
+    step_name: str
+    parent_id: int | None = None
+    start_time: datetime = field(default_factory=datetime.now)
+    end_time: datetime | None = None
+    wall_seconds: float | None = None
+    cpu_seconds: float | None = None
+    peak_rss_mb: float | None = None
+    memory_delta_mb: float | None = None
+    memory_peak_mb: float | None = None
+    input_rows: int | None = None
+    input_cols: int | None = None
+    output_rows: int | None = None
+    output_cols: int | None = None
+    status: str = "running"
+    error: str | None = None
+
+    _parent: "Span | None" = field(default=None, repr=False)
+    _wall_start: float = field(default=0.0, repr=False)
+    _cpu_start: float = field(default=0.0, repr=False)
+    _traced_start: int | None = field(default=None, repr=False)
+    _traced_peak: int = field(default=0, repr=False)
+
+    def set_input(self, data) -> None:
+        """
+        Record the row/column count of the input data.
+
+        Args:
+            data: A DataFrame, or a dict nesting DataFrames.
+        """
+        shape = _get_shape(data)
+        if shape is not None:
+            self.input_rows, self.input_cols = shape
+
+    def set_output(self, data) -> None:
+        """
+        Record the row/column count of the output data.
+
+        Args:
+            data: A DataFrame, or a dict nesting DataFrames.
+        """
+        shape = _get_shape(data)
+        if shape is not None:
+            self.output_rows, self.output_cols = shape
+
+    def _start(self, trace_memory: bool) -> None:
+        if trace_memory and tracemalloc.is_tracing():
+            self._fold_traced_peak()
+            self._traced_start = tracemalloc.get_traced_memory()[0]
+            self._traced_peak = self._traced_start
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+
+    def _finish(self, error: BaseException | None = None) -> None:
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        self.end_time = datetime.now()
+        self.peak_rss_mb = _get_peak_rss_mb()
+        if self._traced_start is not None and tracemalloc.is_tracing():
+            self._fold_traced_peak()
+            current: int = tracemalloc.get_traced_memory()[0]
+            self.memory_delta_mb = (current - self._traced_start) / (1024 * 1024)
+            self.memory_peak_mb = (self._traced_peak - self._traced_start) / (
+                1024 * 1024
+            )
+        self.status = "completed" if error is None else "error"
+        if error is not None:
+            self.error = str(error)
+
+    def _fold_traced_peak(self) -> None:
+        """
+        Propagate the tracemalloc peak since the last reset to the open spans,
+            then reset it, so nested spans each get their own peak.
+        """
+        peak: int = tracemalloc.get_traced_memory()[1]
+        open_span: Span | None = (
+            self if self._traced_start is not None else self._parent
+        )
+        while open_span is not None:
+            if open_span._traced_start is not None:
+                open_span._traced_peak = max(open_span._traced_peak, peak)
+            open_span = open_span._parent
+        tracemalloc.reset_peak()
+
+
+_span_counter: Iterator[int] = itertools.count(1)
+
+
+@contextmanager
+def span(step: str, module: str | None = None) -> Iterator[Span]:
+    """
+    Measure an operation as a span of the active recorder.
+
+    Args:
+        step (str): Name of the operation, e.g. 'run', 'fit', 'sample'.
+        module (str, optional): Module the span belongs to.
+            Default is the module of the enclosing span.
+
+    Yields:
+        (Span): The running span, to record input/output with set_input()/set_output().
+            A detached span is yielded when nothing is recording.
+    """
+    recorder: _Recorder | None = _active_recorder.get()
+    parent: Span | None = _active_span.get()
+    current = Span(
+        span_id=next(_span_counter),
+        module_name=module or (parent.module_name if parent else "default"),
+        experiment_name=recorder.expt if recorder else "default",
+        step_name=step,
+        parent_id=parent.span_id if parent else None,
+        _parent=parent,
+    )
+    if recorder is None:
+        yield current
+        return
+
+    token = _active_span.set(current)
+    current._start(recorder.trace_memory)
+    try:
+        yield current
+    except BaseException as e:
+        current._finish(error=e)
+        raise
+    else:
+        current._finish()
+    finally:
+        _active_span.reset(token)
+        recorder.callback(current)
+
+
+@contextmanager
+def recording(
+    callback: Callable[[Span], None], expt: str = "default", trace_memory: bool = False
+) -> Iterator[None]:
+    """
+    Record every span finished in the block.
+
+    Args:
+        callback (Callable): Called with every finished Span, inner spans first.
+        expt (str): Experiment name recorded on the spans. Default is 'default'.
+        trace_memory (bool): Measure the memory delta and peak of the spans
+            with tracemalloc, started for the block if it is not tracing yet.
+            Default is False, as tracing slows allocation-heavy code down.
+    """
+    started_tracing: bool = False
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started_tracing = True
+
+    recorder_token = _active_recorder.set(
+        _Recorder(callback=callback, expt=expt, trace_memory=trace_memory)
+    )
+    span_token = _active_span.set(None)
+    try:
+        yield
+    finally:
+        _active_span.reset(span_token)
+        _active_recorder.reset(recorder_token)
+        if started_tracing:
+            tracemalloc.stop()
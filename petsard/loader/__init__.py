@@ -1,4 +1,4 @@
 from petsard.loader.loader import Loader
-from petsard.loader.splitter import Splitter
+from petsard.loader.splitter import Splitter, SplitView
 
-__all__ = ["Loader", "Splitter"]
+__all__ = ["Loader", "SplitView", "Splitter"]
@@ -1,6 +1,8 @@
 import hashlib
+import json
 import logging
 import os
+import tempfile
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from importlib import resources
@@ -166,6 +168,9 @@ class BaseBenchmarker(ABC):
         that all the "Loader" need to implement, as well as common functionality.
     """
 
+    # Sidecar file recording the SHA-256 of the benchmark data
+    DIGEST_SUFFIX: str = ".sha256.json"
+
     def __init__(self, config: dict):
         """
         Attributes:
@@ -179,6 +184,10 @@ class BaseBenchmarker(ABC):
                 filepath (str) The full path of the benchmark data in local.
                 benchmark_already_exist (bool)
                     If the benchmark data already exist. Default is False.
+
+        The SHA-256 of the benchmark data is recorded in a sidecar file
+            (filepath + DIGEST_SUFFIX) with its size and mtime,
+            so later runs skip hashing the unchanged file.
         """
         self._logger: logging.Logger = logging.getLogger(
             f"PETsARD.{self.__class__.__name__}"
@@ -197,7 +206,7 @@ class BaseBenchmarker(ABC):
         else:
             # if same name data didn't exist,
             #     confirm "./benchmark/" folder is exist (create it if not)
-            os.makedirs("benchmark", exist_ok=True)
+            os.makedirs(os.path.dirname(self.config["filepath"]) or ".", exist_ok=True)
 
     @abstractmethod
     def download(self):
@@ -215,7 +224,7 @@ class BaseBenchmarker(ABC):
             already_exist (bool) If the file already exist. Default is True.
               False means verify under download process.
         """
-        file_sha256hash = digest_sha256(self.config["filepath"])
+        file_sha256hash = self._get_sha256()
         expected_sha256 = self.config["benchmark_sha256"]
 
         # Always log the SHA-256 comparison
@@ -260,6 +269,54 @@ class BaseBenchmarker(ABC):
                     self._logger.debug(f"Failed to remove corrupted file: {e}")
                 raise BenchmarkDatasetsError(error_msg)
 
+    def _get_sha256(self) -> str:
+        """
+        Get the SHA-256 of the benchmark data,
+            reusing the sidecar record if the file size and mtime are unchanged.
+
+        Return:
+            (str) SHA-256 value of file.
+        """
+        filepath: str = str(self.config["filepath"])
+        record_path: str = f"{filepath}{self.DIGEST_SUFFIX}"
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return digest_sha256(filepath)
+
+        record_key: dict = {
+            "path": os.path.abspath(filepath),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        try:
+            with open(record_path) as f:
+                record: dict = json.load(f)
+            if {key: record.get(key) for key in record_key} == record_key:
+                self._logger.debug(f"Using recorded SHA-256 from: {record_path}")
+                return record["sha256"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        file_sha256hash: str = digest_sha256(filepath)
+
+        # Record through a temporary file, so a partial record is never read
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(record_path) or ".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({**record_key, "sha256": file_sha256hash}, f)
+                os.replace(tmp_path, record_path)
+            except OSError:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            self._logger.debug(f"Failed to record SHA-256 in {record_path}: {e}")
+
+        return file_sha256hash
+
 
 class BenchmarkerRequests(BaseBenchmarker):
     """
@@ -267,16 +324,35 @@ class BenchmarkerRequests(BaseBenchmarker):
         Download benchmark dataset via requests.
         Expect for public bucket.
 
+        Data is downloaded into filepath + PART_SUFFIX first,
+            an interrupted download is resumed from its size by a Range request.
     """
 
+    # Partial download, renamed to the filepath when completed
+    PART_SUFFIX: str = ".part"
+
     def __init__(self, config: dict):
         super().__init__(config)
 
+    def _get_url(self) -> str:
+        """
+        Return:
+            (str) The URL of the benchmark data in the public bucket.
+        """
+        return (
+            f"https://"
+            f"{self.config['benchmark_bucket_name']}"
+            f".s3.amazonaws.com/"
+            f"{self.config['benchmark_filename']}"
+        )
+
     def download(self) -> None:
         """
         Use requests.get() to download data,
             than confirm its SHA-256 is matched.
 
+        A partial download left by an interrupted run is resumed,
+            unless the server ignores the Range request.
         """
         # Check if requests is installed
         try:
@@ -293,21 +369,34 @@ class BenchmarkerRequests(BaseBenchmarker):
         if self.config["benchmark_already_exist"]:
             self._logger.info(f"Using existing local file: {self.config['filepath']}")
         else:
-            url = (
-                f"https://"
-                f"{self.config['benchmark_bucket_name']}"
-                f".s3.amazonaws.com/"
-                f"{self.config['benchmark_filename']}"
+            url = self._get_url()
+            part_path: str = f"{self.config['filepath']}{self.PART_SUFFIX}"
+            resume_size: int = (
+                os.path.getsize(part_path) if os.path.exists(part_path) else 0
             )
-            self._logger.info(f"Downloading benchmark file from: {url}")
+            headers: dict = {}
+            if resume_size > 0:
+                headers["Range"] = f"bytes={resume_size}-"
+                self._logger.info(
+                    f"Resuming benchmark download from {resume_size / (1024 * 1024):.1f}MB: {url}"
+                )
+            else:
+                self._logger.info(f"Downloading benchmark file from: {url}")
 
             try:
-                with requests.get(url, stream=True, timeout=300) as response:
-                    if response.status_code == 200:
-                        total_size = int(response.headers.get("content-length", 0))
-                        downloaded_size = 0
+                with requests.get(
+                    url, stream=True, timeout=300, headers=headers
+                ) as response:
+                    if response.status_code in (200, 206):
+                        if response.status_code == 200:
+                            # Full content, the server ignored or was not sent a Range
+                            resume_size = 0
+                        total_size = resume_size + int(
+                            response.headers.get("content-length", 0)
+                        )
+                        downloaded_size = resume_size
 
-                        with open(self.config["filepath"], "wb") as f:
+                        with open(part_path, "ab" if resume_size else "wb") as f:
                             # load 8KB at one time
                             for chunk in response.iter_content(chunk_size=8192):
                                 if chunk:
@@ -329,6 +418,11 @@ class BenchmarkerRequests(BaseBenchmarker):
                             f"Download completed: {self.config['benchmark_filename']} "
                             f"({downloaded_size / (1024 * 1024):.1f}MB)"
                         )
+                    elif response.status_code == 416 and resume_size > 0:
+                        # Range starts at the end, the partial download is complete
+                        self._logger.info(
+                            f"Download already completed: {self.config['benchmark_filename']}"
+                        )
                     elif response.status_code == 404:
                         error_msg = (
                             f"Benchmark file not found on server: {self.config['benchmark_filename']}\n"
@@ -346,30 +440,36 @@ class BenchmarkerRequests(BaseBenchmarker):
                         )
                         self._logger.error(error_msg)
                         raise BenchmarkDatasetsError(error_msg)
+                os.replace(part_path, self.config["filepath"])
+            except BenchmarkDatasetsError:
+                raise
             except requests.exceptions.Timeout as e:
                 error_msg = (
                     f"Download timeout for benchmark file: {self.config['benchmark_filename']}\n"
                     f"The file may be too large or the connection may be slow.\n"
-                    f"Please try again with a better connection."
+                    f"Please try again with a better connection, "
+                    f"the download will resume from {part_path}."
                 )
                 self._logger.error(error_msg)
                 raise BenchmarkDatasetsError(error_msg) from e
-            except requests.exceptions.ConnectionError as e:
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
                 error_msg = (
                     f"Connection error while downloading benchmark file: {self.config['benchmark_filename']}\n"
-                    f"Please check your internet connection and try again.\n"
+                    f"Please check your internet connection and try again, "
+                    f"the download will resume from {part_path}.\n"
                     f"Error details: {str(e)}"
                 )
                 self._logger.error(error_msg)
                 raise BenchmarkDatasetsError(error_msg) from e
             except Exception as e:
                 # Clean up partial download
-                if os.path.exists(self.config["filepath"]):
+                if os.path.exists(part_path):
                     try:
-                        os.remove(self.config["filepath"])
-                        self._logger.debug(
-                            f"Removed partial download: {self.config['filepath']}"
-                        )
+                        os.remove(part_path)
+                        self._logger.debug(f"Removed partial download: {part_path}")
                     except OSError as remove_error:
                         self._logger.debug(
                             f"Failed to remove partial download: {remove_error}"
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import re
+from collections.abc import Generator, Iterator
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import yaml
 
+from petsard.cache import LoadCache
 from petsard.config_base import BaseConfig
 from petsard.exceptions import (
     ConfigError,
     UnableToFollowMetadataError,
     UnsupportedMethodError,
 )
-from petsard.metadater import Attribute, Schema, SchemaMetadater
+from petsard.loader.loader_base import COMPRESSIONS, LoaderBase, mask_password
+from petsard.metadater import (
+    Attribute,
+    AttributeMetadater,
+    Schema,
+    SchemaMetadater,
+)
+
+# Database URLs in the SQLAlchemy format, e.g. sqlite:///data.db,
+#   benchmark:// datasets are downloaded by LoaderAdapter instead
+DATABASE_URL_PATTERN = re.compile(r"^(?!benchmark://)[a-zA-Z][a-zA-Z0-9+.-]*://", re.I)
 
 
 class LoaderFileExt:
@@ -23,6 +37,8 @@ class LoaderFileExt:
 
     CSVTYPE: int = 1
     EXCELTYPE: int = 2
+    ARROWTYPE: int = 3
+    SQLTYPE: int = 4
 
     CSV: int = 10
     XLS: int = 20
@@ -32,6 +48,10 @@ class LoaderFileExt:
     ODF: int = 24
     ODS: int = 25
     ODT: int = 26
+    PARQUET: int = 30
+    FEATHER: int = 31
+    ARROW: int = 32
+    IPC: int = 33
 
     @classmethod
     def get(cls, file_ext: str) -> int:
@@ -51,20 +71,44 @@ class LoaderConfig(BaseConfig):
 
     Attributes:
         _logger (logging.Logger): The logger object.
-        filepath (str): The fullpath of dataset.
+        filepath (str): The fullpath of dataset,
+            or a database URL in the SQLAlchemy format, e.g. sqlite:///data.db.
+        query (str): The SQL query of the rows to load from the database.
+        table (str): The table to load from the database, instead of a query.
         column_types (dict): The dictionary of column types and their corresponding column names.
         header_names (list): **DEPRECATED in v2.0.0 - will be removed** Specifies a list of headers for the data without header.
         na_values (str | list | dict): Extra string to recognized as NA/NaN.
         schema (Schema): Schema configuration object with field definitions and global parameters.
         schema_path (str): The path to schema file if loaded from YAML file.
+        filters (list): Row filters pushed down to Parquet/Feather/Arrow IPC scans,
+            in the DNF format of pyarrow.parquet, e.g. [["age", ">=", 18]].
+        chunksize (int): The number of rows per chunk yielded by Loader.iter_load().
+        engine (str): The CSV parsing engine, 'c', 'python', 'pyarrow' or 'polars',
+            or the Excel reading engine, 'openpyxl', 'streaming' or 'calamine'.
+        cache_dir (str): The directory of the load cache, None disables the cache.
+        cache_refresh (bool): Whether to load from the file and overwrite the cache entry.
+        cache_max_size_mb (int): The size cap of the load cache in MB.
+        compact_dtypes (bool): Whether to load columns into the most compact dtypes
+            the schema allows.
+        sample_rows (int): The number of rows to sample uniformly at random.
+        sample_frac (float): The probability of every row to be sampled.
+        random_state (int): The seed of the row sampling.
+        precision_sample_size (int): The number of values per float column
+            to infer precision from, None for all values.
+        DEFAULT_CHUNKSIZE (int): The chunksize used when chunksize is not given.
         dir_name (str): The directory name of the file path.
         base_name (str): The base name of the file path.
         file_name (str): The file name of the file path.
-        file_ext (str): The file extension of the file path.
+        file_ext (str): The file extension of the file path,
+            before the compression extension if compressed.
         file_ext_code (int): The file extension code.
+        compression (str): The compression of the file, 'gzip', 'bz2', 'xz' or 'zstd',
+            from its last extension, e.g. data.csv.gz. None if not compressed.
     """
 
     filepath: str | None = None
+    query: str | None = None  # SQL query for database URLs
+    table: str | None = None  # Table name for database URLs
     column_types: dict[str, list[str]] | None = (
         None  # TODO: Deprecated in v2.0.0 - will be removed
     )
@@ -77,6 +121,18 @@ class LoaderConfig(BaseConfig):
     nrows: int | None = None  # Number of rows to read for quick testing
     schema: Schema | None = None
     schema_path: str | None = None  # Record schema source path (if loaded from file)
+    filters: list | None = None  # Row filters for columnar files
+    chunksize: int | None = None  # Rows per chunk for iter_load()
+    engine: str | None = None  # CSV parsing or Excel reading engine
+    cache_dir: str | None = None  # Directory of the load cache
+    cache_refresh: bool = False  # Reload and overwrite the cache entry
+    cache_max_size_mb: int = 1024
+    compact_dtypes: bool = False  # Load into memory-compact dtypes
+    sample_rows: int | None = None  # Rows to sample at random
+    sample_frac: float | None = None  # Fraction of rows to sample at random
+    random_state: int | None = None  # Seed of the row sampling
+    precision_sample_size: int | None = None  # Values to infer precision from
+    DEFAULT_CHUNKSIZE: int = 100000
 
     # Filepath related
     dir_name: str | None = None
@@ -84,6 +140,7 @@ class LoaderConfig(BaseConfig):
     file_name: str | None = None
     file_ext: str | None = None
     file_ext_code: int | None = None
+    compression: str | None = None
 
     def __post_init__(self):
         super().__post_init__()
@@ -97,21 +154,149 @@ class LoaderConfig(BaseConfig):
             raise ConfigError(error_msg)
 
         # 2. handle filepath
-        filepath_path: Path = Path(self.filepath)
+        is_database: bool = bool(DATABASE_URL_PATTERN.match(str(self.filepath)))
+        if is_database or self.query is not None or self.table is not None:
+            self._validate_database()
+        # The path parts of a database URL are kept without its password
+        filepath_path: Path = Path(
+            mask_password(self.filepath) if is_database else self.filepath
+        )
         self.dir_name = str(filepath_path.parent)
         self.base_name = filepath_path.name
-        self.file_name = filepath_path.stem
-        self.file_ext = filepath_path.suffix.lower()
-        try:
-            self.file_ext_code = LoaderFileExt.get(self.file_ext)
-        except KeyError as e:
-            error_msg = f"Unsupported file extension: {self.file_ext}"
-            self._logger.error(error_msg)
-            raise UnsupportedMethodError(error_msg) from e
+        if is_database:
+            # database URL, named after the table or the database
+            self.file_name = self.table or filepath_path.stem or "query"
+            self.file_ext_code = LoaderFileExt.SQLTYPE
+        elif filepath_path.suffix.lower() in COMPRESSIONS and filepath_path.stem:
+            # compressed file, e.g. data.csv.gz, the format is the inner extension
+            self.compression = COMPRESSIONS[filepath_path.suffix.lower()]
+            filepath_path = Path(filepath_path.stem)
+        if not is_database:
+            self.file_name = filepath_path.stem
+            self.file_ext = filepath_path.suffix.lower()
+            try:
+                self.file_ext_code = LoaderFileExt.get(self.file_ext)
+            except KeyError as e:
+                error_msg = f"Unsupported file extension: {self.file_ext}"
+                self._logger.error(error_msg)
+                raise UnsupportedMethodError(error_msg) from e
         self._logger.debug(
-            f"File path information - dir: {self.dir_name}, name: {self.file_name}, ext: {self.file_ext}, ext code: {self.file_ext_code}"
+            f"File path information - dir: {self.dir_name}, name: {self.file_name}, ext: {self.file_ext}, ext code: {self.file_ext_code}, compression: {self.compression}"
         )
 
+        # 3. validate filters, only columnar files support predicate pushdown
+        if self.filters is not None:
+            if self.file_ext_code != LoaderFileExt.ARROWTYPE:
+                error_msg = (
+                    "filters are only supported for Parquet, Feather and "
+                    f"Arrow IPC files, got: {self.file_ext}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            self.filters = self._normalize_filters(self.filters)
+            self._logger.debug(f"Using row filters: {self.filters}")
+
+        # 3-1. validate chunksize, Excel files cannot be read in chunks
+        if self.chunksize is not None:
+            if (
+                not isinstance(self.chunksize, int)
+                or isinstance(self.chunksize, bool)
+                or self.chunksize <= 0
+            ):
+                error_msg = (
+                    f"chunksize must be a positive integer, got: {self.chunksize}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if self.file_ext_code == LoaderFileExt.EXCELTYPE:
+                error_msg = f"chunksize is not supported for {self.file_ext} files"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
+        # 3-2. validate engine, only CSV and Excel files have parsing engines
+        if self.engine is not None:
+            from petsard.loader.loader_pandas import LoaderPandasCsv, LoaderPandasExcel
+
+            file_engines: dict[int, tuple[str, ...]] = {
+                LoaderFileExt.CSVTYPE: LoaderPandasCsv.ENGINES,
+                LoaderFileExt.EXCELTYPE: LoaderPandasExcel.ENGINES,
+            }
+            self.engine = str(self.engine).lower()
+            if not any(self.engine in engines for engines in file_engines.values()):
+                error_msg = (
+                    f"Unsupported engine: {self.engine}, supported engines are "
+                    f"{list(LoaderPandasCsv.ENGINES)} for CSV files and "
+                    f"{list(LoaderPandasExcel.ENGINES)} for Excel files"
+                )
+                self._logger.error(error_msg)
+                raise UnsupportedMethodError(error_msg)
+            if self.engine not in file_engines.get(self.file_ext_code, ()):
+                error_msg = (
+                    f"engine {self.engine} is not supported for {self.file_ext} files"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
+        # 3-3. validate load cache and compact dtype settings
+        for name in ["cache_refresh", "compact_dtypes"]:
+            if not isinstance(getattr(self, name), bool):
+                error_msg = f"{name} must be a boolean, got: {getattr(self, name)}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+        if (
+            not isinstance(self.cache_max_size_mb, int)
+            or isinstance(self.cache_max_size_mb, bool)
+            or self.cache_max_size_mb < 1
+        ):
+            error_msg = (
+                "cache_max_size_mb must be a positive integer, "
+                f"got: {self.cache_max_size_mb}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # 3-4. validate random row sampling
+        if self.sample_rows is not None and self.sample_frac is not None:
+            error_msg = "sample_rows and sample_frac cannot be used together"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.sample_rows is not None and (
+            not isinstance(self.sample_rows, int)
+            or isinstance(self.sample_rows, bool)
+            or self.sample_rows <= 0
+        ):
+            error_msg = (
+                f"sample_rows must be a positive integer, got: {self.sample_rows}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.sample_frac is not None and (
+            not isinstance(self.sample_frac, int | float)
+            or isinstance(self.sample_frac, bool)
+            or not 0 < self.sample_frac <= 1
+        ):
+            error_msg = f"sample_frac must be in (0, 1], got: {self.sample_frac}"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.random_state is not None and (
+            not isinstance(self.random_state, int)
+            or isinstance(self.random_state, bool)
+        ):
+            error_msg = f"random_state must be an integer, got: {self.random_state}"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.precision_sample_size is not None and (
+            not isinstance(self.precision_sample_size, int)
+            or isinstance(self.precision_sample_size, bool)
+            or self.precision_sample_size <= 0
+        ):
+            error_msg = (
+                "precision_sample_size must be a positive integer, "
+                f"got: {self.precision_sample_size}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
         # 4. validate column_types (using new Metadater architecture)
         if self.column_types is not None:
             self._logger.debug(f"Validating column types: {self.column_types}")
@@ -153,6 +338,254 @@ class LoaderConfig(BaseConfig):
                         "No conflicts found between schema and column_types"
                     )
 
+    def _validate_database(self) -> None:
+        """
+        Validate that a database URL comes with exactly one of query and table.
+        """
+        error_msg: str = ""
+        if not DATABASE_URL_PATTERN.match(str(self.filepath)):
+            error_msg = (
+                "query and table are only supported for database URLs, "
+                f"got: {mask_password(self.filepath)}"
+            )
+        elif (self.query is None) == (self.table is None):
+            error_msg = "Exactly one of query and table must be specified for databases"
+        else:
+            for name in ["query", "table"]:
+                value = getattr(self, name)
+                if value is not None and (not isinstance(value, str) or not value):
+                    error_msg = f"{name} must be a non-empty string, got: {value}"
+        if error_msg:
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+    def _normalize_filters(self, filters: list) -> list:
+        """
+        Normalize filters from YAML lists into the tuples pyarrow expects.
+
+        Args:
+            filters (list): A list of (column, op, value) conditions joined by AND,
+                or a list of such lists joined by OR.
+
+        Returns:
+            (list): Filters as a list of tuples, or a list of lists of tuples.
+        """
+
+        def _is_condition(item) -> bool:
+            return (
+                isinstance(item, list | tuple)
+                and len(item) == 3
+                and isinstance(item[0], str)
+                and isinstance(item[1], str)
+            )
+
+        error_msg: str = (
+            "filters must be a list of [column, op, value] conditions, "
+            f"or a list of such lists, got: {filters}"
+        )
+        if not isinstance(filters, list | tuple) or not filters:
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        if all(_is_condition(item) for item in filters):
+            return [tuple(item) for item in filters]
+        if all(
+            isinstance(group, list | tuple)
+            and group
+            and all(_is_condition(item) for item in group)
+            for group in filters
+        ):
+            return [[tuple(item) for item in group] for group in filters]
+
+        self._logger.error(error_msg)
+        raise ConfigError(error_msg)
+
+
+class _ChunkTracker:
+    """
+    Track the column decisions of Loader.iter_load() that need the whole column,
+        and cannot be merged from the decisions on each chunk.
+
+    Attr.:
+        MAX_DISTINCT_VALUES (int): Distinct values kept per text column.
+            Columns with more are not categorical, which bounds the memory used.
+        n_rows (int): Rows seen so far.
+        distinct_values (dict): Distinct values of the tracked text columns.
+        category_columns (set): Columns read as pandas categoricals.
+        constant_values (dict): The only non-NA value of each column so far.
+        varying_columns (set): Columns with more than one non-NA value.
+    """
+
+    MAX_DISTINCT_VALUES: int = 100000
+
+    def __init__(self):
+        self.n_rows: int = 0
+        self.distinct_values: dict[str, set | None] = {}
+        self.category_columns: set[str] = set()
+        self.constant_values: dict[str, Any] = {}
+        self.varying_columns: set[str] = set()
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Args:
+            chunk (pd.DataFrame): The next chunk of data.
+        """
+        self.n_rows += len(chunk)
+        for col in chunk.columns:
+            series: pd.Series = chunk[col]
+
+            # category: unique ratio over all rows, as AttributeMetadater.from_data()
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                self.category_columns.add(col)
+            elif series.dtype == "object" and (
+                self.distinct_values.get(col, set()) is not None
+            ):
+                distinct: set = self.distinct_values.setdefault(col, set())
+                distinct.update(series.unique())
+                if len(distinct) > self.MAX_DISTINCT_VALUES:
+                    self.distinct_values[col] = None
+
+            # constant: one non-NA value over all rows
+            if col in self.varying_columns:
+                continue
+            values = series.dropna().unique()
+            if len(values) > 1 or (
+                len(values) == 1
+                and col in self.constant_values
+                and self.constant_values[col] != values[0]
+            ):
+                self.varying_columns.add(col)
+            elif len(values) == 1:
+                self.constant_values[col] = values[0]
+
+    def is_category(self, col: str) -> bool:
+        if col in self.category_columns:
+            return True
+        distinct: set | None = self.distinct_values.get(col)
+        return bool(
+            distinct is not None
+            and self.n_rows > 0
+            and len(distinct) / self.n_rows < AttributeMetadater.CATEGORY_UNIQUE_RATIO
+        )
+
+    def is_constant(self, col: str) -> bool:
+        return col in self.constant_values and col not in self.varying_columns
+
+
+class _RowSampler:
+    """
+    Draw a uniform random sample of rows over chunks, in one pass.
+
+    Every row is given a random key in file order,
+        so the sample does not depend on the chunk sizes.
+    - sample_rows: Reservoir sampling, the rows with the smallest keys are kept.
+        Rows are buffered only if their key beats the current reservoir,
+        and the buffer is cut back to sample_rows when it doubles.
+    - sample_frac: Bernoulli sampling, rows with a key below sample_frac are kept.
+
+    Attr.:
+        n_rows (int): Rows seen so far.
+    """
+
+    def __init__(
+        self,
+        sample_rows: int | None = None,
+        sample_frac: float | None = None,
+        random_state: int | None = None,
+    ):
+        """
+        Args:
+            sample_rows (int, optional): The number of rows to sample.
+            sample_frac (float, optional): The probability of every row to be sampled.
+            random_state (int, optional): Seed of the random keys.
+        """
+        import numpy as np
+
+        self.sample_rows: int | None = sample_rows
+        self.sample_frac: float | None = sample_frac
+        self._rng = np.random.default_rng(random_state)
+        self.n_rows: int = 0
+        self._threshold: float = sample_frac if sample_frac is not None else 1.0
+        self._chunks: list[pd.DataFrame] = []
+        self._keys: list = []
+        self._n_buffered: int = 0
+        self._empty: pd.DataFrame | None = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Args:
+            chunk (pd.DataFrame): The next chunk of data.
+        """
+        import numpy as np
+
+        if self._empty is None:
+            self._empty = chunk.iloc[:0]
+        keys = self._rng.random(len(chunk))
+        chunk = chunk.set_axis(np.arange(self.n_rows, self.n_rows + len(chunk)))
+        self.n_rows += len(chunk)
+
+        mask = keys < self._threshold
+        if not mask.any():
+            return
+        self._chunks.append(chunk[mask])
+        self._keys.append(keys[mask])
+        self._n_buffered += int(mask.sum())
+
+        if self.sample_rows is not None and self._n_buffered >= 2 * self.sample_rows:
+            self._shrink()
+
+    def _shrink(self) -> None:
+        """
+        Keep the sample_rows rows with the smallest keys,
+            and only buffer rows with a smaller key than the largest kept.
+        """
+        import numpy as np
+
+        data = pd.concat(self._chunks)
+        keys = np.concatenate(self._keys)
+        if len(keys) > self.sample_rows:
+            kept = np.argpartition(keys, self.sample_rows - 1)[: self.sample_rows]
+            data, keys = data.iloc[kept], keys[kept]
+            self._threshold = float(keys.max())
+        self._chunks, self._keys = [data], [keys]
+        self._n_buffered = len(keys)
+
+    def result(self) -> pd.DataFrame:
+        """
+        Return:
+            (pd.DataFrame): The sampled rows in file order, with a new RangeIndex.
+        """
+        if not self._chunks:
+            return self._empty if self._empty is not None else pd.DataFrame()
+        if self.sample_rows is not None:
+            self._shrink()
+        return pd.concat(self._chunks).sort_index().reset_index(drop=True)
+
+
+def _object_memory_usage(series: pd.Series) -> int:
+    """
+    Memory usage of a categorical column as an object column of its values,
+        as reported by memory_usage(deep=True).
+
+    Args:
+        series (pd.Series): Categorical column.
+
+    Returns:
+        (int): Bytes of the object column.
+    """
+    import sys
+
+    import numpy as np
+
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    value_bytes: int = sum(
+        int(count) * sys.getsizeof(value)
+        for value, count in zip(series.cat.categories, counts, strict=True)
+    )
+    missing_bytes: int = int((codes < 0).sum()) * sys.getsizeof(np.nan)
+    return len(series) * np.dtype(object).itemsize + value_bytes + missing_bytes
+
 
 class Loader:
     """
@@ -176,10 +609,27 @@ class Loader:
         | None = None,  # TODO: Deprecated in v2.0.0
         nrows: int | None = None,
         schema: Schema | dict | str | None = None,
+        filters: list | None = None,
+        chunksize: int | None = None,
+        engine: str | None = None,
+        cache_dir: str | None = None,
+        cache_refresh: bool = False,
+        cache_max_size_mb: int = 1024,
+        compact_dtypes: bool = False,
+        sample_rows: int | None = None,
+        sample_frac: float | None = None,
+        random_state: int | None = None,
+        precision_sample_size: int | None = None,
+        query: str | None = None,
+        table: str | None = None,
     ):
         """
         Args:
-            filepath (str): The fullpath of dataset.
+            filepath (str): The fullpath of dataset,
+                or a database URL in the SQLAlchemy format,
+                e.g. sqlite:///data/users.db or postgresql://user@host/db.
+                SQLite is read by the standard library,
+                other databases require SQLAlchemy and their drivers.
             column_types (dict ,optional): **DEPRECATED in v2.0.0 - will be removed**
                 The dictionary of column types and their corresponding column names,
                 formatted as {type: [colname]}
@@ -206,17 +656,81 @@ class Loader:
                 - dict: Dictionary that will be converted to Schema using from_dict()
                 - str: Path to YAML file containing schema configuration
                 Contains field definitions and global parameters for data processing.
+                For Parquet, Feather and Arrow IPC files,
+                only the columns defined in the schema are read.
+            filters (list, optional): Row filters for Parquet, Feather and Arrow IPC files,
+                applied while scanning the file (predicate pushdown).
+                A list of [column, op, value] conditions joined by AND,
+                or a list of such lists joined by OR.
+                Default is None, which reads all rows.
+            chunksize (int, optional): The number of rows per chunk yielded by iter_load(),
+                for files too large to be loaded at once. Not supported for Excel files.
+                Default is None, which uses LoaderConfig.DEFAULT_CHUNKSIZE in iter_load().
+            engine (str, optional): The CSV parsing engine.
+                - 'c': The pandas C engine, single-threaded.
+                - 'python': The pandas Python engine.
+                - 'pyarrow': Multithreaded parsing by pyarrow.
+                - 'polars': Multithreaded parsing by polars.
+                All engines load identical data for the schema types supported.
+                Default is None, which uses the 'c' engine.
+                For Excel files, the reading engine.
+                - 'openpyxl': pandas.read_excel by openpyxl.
+                - 'streaming': The calamine engine if python-calamine is installed,
+                    otherwise openpyxl read-only row iteration for .xlsx and .xlsm,
+                    loading the same data as 'openpyxl'.
+                - 'calamine': pandas.read_excel by python-calamine.
+                Default is None, which uses the 'openpyxl' engine.
+            cache_dir (str, optional): Directory of the load cache.
+                After a load, the data and schema are stored there,
+                keyed by the file size, mtime and content hash and the loader config,
+                so later loads of the unchanged file skip parsing and schema inference.
+                Requires pyarrow. Default is None, which disables the cache.
+            cache_refresh (bool, optional): Load from the file even on a cache hit,
+                and overwrite the cache entry. Default is False.
+            cache_max_size_mb (int, optional): Size cap of the load cache in MB,
+                least recently used entries are evicted above it. Default is 1024.
+            compact_dtypes (bool, optional): Load columns into compact dtypes.
+                - Category columns become pandas category,
+                    read as category directly when their type is str.
+                - int and float columns are downcast to the smallest width
+                    holding their values, unless enable_optimize_type is False.
+                - Other text columns become Arrow-backed strings if pyarrow is installed.
+                The memory saved per column is kept in compact_report.
+                Default is False.
+            sample_rows (int, optional): Load a uniform random sample of this many rows,
+                drawn in one pass over the file in chunks of chunksize rows,
+                so only the sample is held in memory. Rows keep their file order.
+                Default is None, which loads all rows.
+            sample_frac (float, optional): Load every row with this probability,
+                in one pass like sample_rows. The sample size is about
+                sample_frac of the rows. Cannot be used with sample_rows.
+                Default is None, which loads all rows.
+            random_state (int, optional): Seed of sample_rows and sample_frac,
+                the same seed draws the same rows. Default is None.
+            precision_sample_size (int, optional): Infer the precision of float columns
+                from a random sample of this many values per column,
+                which is faster on large tables but may miss rare longer decimals.
+                Default is None, which infers from all values.
+            query (str, optional): SQL query of the rows to load from a database URL.
+                Rows are fetched from a streaming cursor in chunks of chunksize rows.
+                Default is None.
+            table (str, optional): Table to load from a database URL, instead of query.
+                Only the columns defined in the schema are selected.
+                Default is None.
 
         Attributes:
             _logger (logging.Logger): The logger object.
             config (LoaderConfig): Configuration
+            compact_report (pd.DataFrame): Memory usage per column converted by
+                compact_dtypes in the last load(), None if not converted.
         """
         self._logger: logging.Logger = logging.getLogger(
             f"PETsARD.{self.__class__.__name__}"
         )
         self._logger.debug("Initializing Loader")
         self._logger.debug(
-            f"Loader parameters - filepath: {filepath}, column_types: {column_types}"
+            f"Loader parameters - filepath: {mask_password(filepath)}, "
+            f"column_types: {column_types}"
         )
 
         # Process schema parameter - handle different input types
@@ -230,8 +744,22 @@ class Loader:
             nrows=nrows,
             schema=processed_schema,
             schema_path=schema_path,
+            filters=filters,
+            chunksize=chunksize,
+            engine=engine,
+            cache_dir=cache_dir,
+            cache_refresh=cache_refresh,
+            cache_max_size_mb=cache_max_size_mb,
+            compact_dtypes=compact_dtypes,
+            sample_rows=sample_rows,
+            sample_frac=sample_frac,
+            random_state=random_state,
+            precision_sample_size=precision_sample_size,
+            query=query,
+            table=table,
         )
         self._logger.debug("LoaderConfig successfully initialized")
+        self.compact_report: pd.DataFrame | None = None
 
     def _process_schema_parameter(
         self, schema: Schema | dict | str | None
@@ -320,20 +848,175 @@ class Loader:
             data (pd.DataFrame): Data been loaded
             schema (Schema): Schema metadata of the data
         """
-        self._logger.info(f"Loading data from {self.config.filepath}")
+        self._logger.info(f"Loading data from {mask_password(self.config.filepath)}")
 
         # 1: Schema processing - merge legacy parameters into schema
         merged_schema_config = self._merge_legacy_to_schema()
 
+        sampling: bool = (
+            self.config.sample_rows is not None or self.config.sample_frac is not None
+        )
+
+        load_cache: LoadCache | None = None
+        cache_key: str | None = None
+        # Databases change without a file to fingerprint, so they are never cached
+        if (
+            self.config.cache_dir is not None
+            and self.config.file_ext_code != LoaderFileExt.SQLTYPE
+            and (not sampling or self.config.random_state is not None)
+        ):
+            load_cache, cache_key = self._get_load_cache(merged_schema_config)
+            if not self.config.cache_refresh:
+                cached = load_cache.load(cache_key)
+                if cached is not None:
+                    self._logger.info(f"Loaded data from load cache ({cache_key[:12]})")
+                    data, schema_metadata, self.compact_report = cached
+                    return data, schema_metadata
+
         # 2: Data reading using pandas reader module
-        data = self._read_data_with_pandas_reader(merged_schema_config)
+        if sampling:
+            data = self._read_sample(merged_schema_config)
+        else:
+            data = self._read_data_with_pandas_reader(merged_schema_config)
 
         # 3: Pass schema to metadater for validation and processing
         schema_metadata = self._process_with_metadater(data, merged_schema_config)
 
+        # 4: Convert to compact dtypes as the schema allows
+        if self.config.compact_dtypes:
+            data = self._compact_dtypes(data, schema_metadata)
+
+        if load_cache is not None:
+            load_cache.save(cache_key, data, schema_metadata, self.compact_report)
+
         self._logger.info("Data loading completed successfully")
         return data, schema_metadata
 
+    def _get_load_cache(self, schema: Schema) -> tuple[LoadCache, str]:
+        """
+        Open the load cache and compute the cache key of this load.
+
+        Args:
+            schema: Merged schema configuration
+
+        Returns:
+            tuple: (load_cache, cache_key)
+                - load_cache: The load cache in config.cache_dir
+                - cache_key: Key of the file content and the loader config
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ConfigError(
+                "pyarrow is required for the load cache. "
+                "Please install it with: pip install petsard[arrow]"
+            ) from e
+
+        schema_config: dict = asdict(schema)
+        # Creation times differ on every run and do not shape the result
+        for config in [schema_config, *schema_config["attributes"].values()]:
+            config.pop("created_at", None)
+            config.pop("updated_at", None)
+
+        load_cache = LoadCache(self.config.cache_dir, self.config.cache_max_size_mb)
+        cache_key: str = load_cache.make_key(
+            self.config.filepath,
+            {
+                "file_ext": self.config.file_ext,
+                "column_types": self.config.column_types,
+                "header_names": self.config.header_names,
+                "na_values": self.config.na_values,
+                "nrows": self.config.nrows,
+                "filters": self.config.filters,
+                "compact_dtypes": self.config.compact_dtypes,
+                "sample_rows": self.config.sample_rows,
+                "sample_frac": self.config.sample_frac,
+                "random_state": self.config.random_state,
+                "precision_sample_size": self.config.precision_sample_size,
+                "schema": schema_config,
+            },
+        )
+        return load_cache, cache_key
+
+    def iter_load(self) -> Generator[pd.DataFrame, None, Schema]:
+        """
+        Load data from the specified file path in chunks.
+
+        Every chunk is read and aligned like load() does for the whole file,
+        while the schema is inferred chunk by chunk and merged,
+        so files larger than memory can be streamed.
+
+        Yields:
+            chunk (pd.DataFrame): Chunk of at most chunksize rows
+
+        Returns:
+            schema (Schema): Schema metadata merged over all chunks,
+                as the return value of the generator, e.g.
+                `schema = yield from loader.iter_load()`
+        """
+        chunksize: int = self.config.chunksize or self.config.DEFAULT_CHUNKSIZE
+        self._logger.info(
+            f"Loading data from {mask_password(self.config.filepath)} in chunks of {chunksize} rows"
+        )
+
+        merged_schema_config = self._merge_legacy_to_schema()
+        reader = self._create_reader(merged_schema_config)
+
+        schema: Schema | None = None
+        tracker = _ChunkTracker()
+        n_chunks: int = 0
+        for chunk in self._iter_reader(reader, chunksize):
+            chunk_schema = self._process_with_metadater(chunk, merged_schema_config)
+            schema = (
+                chunk_schema
+                if schema is None
+                else SchemaMetadater.merge(schema, chunk_schema)
+            )
+            tracker.update(chunk)
+
+            n_chunks += 1
+            yield chunk
+
+        if schema is None:
+            schema = self._process_with_metadater(pd.DataFrame(), merged_schema_config)
+        # Decisions needing the whole column replace the merged chunk decisions,
+        #   except categories defined by the given schema.
+        #   Attributes are copied, as they may be shared with the given schema
+        predefined: set[str] = set(merged_schema_config.attributes or {})
+        attributes: dict[str, Attribute] = {}
+        for name, attribute in schema.attributes.items():
+            type_attr: dict | None = attribute.type_attr
+            if name not in predefined and type_attr is not None:
+                type_attr = {**type_attr, "category": tracker.is_category(name)}
+            attributes[name] = replace(
+                attribute, type_attr=type_attr, is_constant=tracker.is_constant(name)
+            )
+        schema = replace(schema, attributes=attributes)
+
+        self._logger.info(f"Chunked data loading completed with {n_chunks} chunks")
+        return schema
+
+    def _iter_reader(
+        self, reader: LoaderBase, chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate the chunks of a reader, with NA values unified as in load().
+
+        Args:
+            reader: Reader instance
+            chunksize: The maximum number of rows per chunk
+
+        Yields:
+            pd.DataFrame: Chunk of data
+        """
+        try:
+            for chunk in reader.iter_load(chunksize):
+                yield chunk.fillna(pd.NA)
+        except Exception as e:
+            error_msg = f"Failed to load data from {mask_password(self.config.filepath)}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
     def _merge_legacy_to_schema(self) -> Schema:
         """
         Merge legacy column_types and na_values into Schema.
@@ -409,7 +1092,66 @@ class Loader:
         Returns:
             pd.DataFrame: Loaded dataframe
         """
+        loader = self._create_reader(schema)
+
+        try:
+            # Load data with the reader
+            data = loader.load().fillna(pd.NA)
+            self._logger.debug(f"Successfully loaded data with shape: {data.shape}")
+            return data
+
+        except Exception as e:
+            error_msg = f"Failed to load data from {mask_password(self.config.filepath)}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
+    def _read_sample(self, schema: Schema) -> pd.DataFrame:
+        """
+        Read a random sample of rows in one pass over the file chunks.
+
+        Args:
+            schema: Merged schema configuration
+
+        Returns:
+            pd.DataFrame: Sampled dataframe
+        """
+        reader = self._create_reader(schema)
+        chunksize: int = self.config.chunksize or self.config.DEFAULT_CHUNKSIZE
+        sampler = _RowSampler(
+            sample_rows=self.config.sample_rows,
+            sample_frac=self.config.sample_frac,
+            random_state=self.config.random_state,
+        )
+
+        try:
+            try:
+                for chunk in reader.iter_load(chunksize):
+                    sampler.update(chunk)
+            except NotImplementedError:
+                # Readers without chunked reading are sampled after a full load
+                sampler.update(reader.load())
+            data = sampler.result().fillna(pd.NA)
+        except Exception as e:
+            error_msg = f"Failed to load data from {mask_password(self.config.filepath)}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
+        self._logger.info(f"Sampled {len(data)} of {sampler.n_rows} rows")
+        return data
+
+    def _create_reader(self, schema: Schema) -> LoaderBase:
+        """
+        Create the reader of the file type, configured from the config and schema.
+
+        Args:
+            schema: Merged schema configuration
+
+        Returns:
+            LoaderBase: Reader instance
+        """
+        from petsard.loader.loader_arrow import LoaderArrow
         from petsard.loader.loader_pandas import LoaderPandasCsv, LoaderPandasExcel
+        from petsard.loader.loader_sql import LoaderSQL
 
         self._logger.debug("Reading data using pandas loader classes")
 
@@ -417,6 +1159,8 @@ class Loader:
         loaders_map = {
             LoaderFileExt.CSVTYPE: LoaderPandasCsv,
             LoaderFileExt.EXCELTYPE: LoaderPandasExcel,
+            LoaderFileExt.ARROWTYPE: LoaderArrow,
+            LoaderFileExt.SQLTYPE: LoaderSQL,
         }
 
         if self.config.file_ext_code not in loaders_map:
@@ -432,11 +1176,46 @@ class Loader:
             "header_names": self.config.header_names,
         }
 
+        if self.config.compression is not None:
+            config["compression"] = self.config.compression
+            config["file_ext"] = self.config.file_ext
+            self._logger.debug(f"Decompressing {self.config.compression} stream")
+
+        if self.config.engine is not None:
+            config["engine"] = self.config.engine
+            self._logger.debug(f"Using engine: {self.config.engine}")
+
         # Add nrows parameter if specified
         if self.config.nrows is not None:
             config["nrows"] = self.config.nrows
             self._logger.info(f"Reading only first {self.config.nrows} rows")
 
+        # Databases: run the query, or select the schema columns of the table
+        if self.config.file_ext_code == LoaderFileExt.SQLTYPE:
+            config["query"] = self.config.query
+            config["table"] = self.config.table
+            if self.config.schema and self.config.schema.attributes:
+                config["columns"] = list(self.config.schema.attributes.keys())
+
+        # Columnar files: project schema columns, push filters down, keep categoricals
+        if self.config.file_ext_code == LoaderFileExt.ARROWTYPE:
+            if self.config.schema and self.config.schema.attributes:
+                config["columns"] = list(self.config.schema.attributes.keys())
+                self._logger.debug(f"Projecting columns: {config['columns']}")
+            if self.config.filters is not None:
+                config["filters"] = self.config.filters
+            category_columns: list[str] = list(
+                (self.config.column_types or {}).get("category", [])
+            )
+            if schema and schema.attributes:
+                category_columns.extend(
+                    attr_name
+                    for attr_name, attribute in schema.attributes.items()
+                    if (attribute.type_attr or {}).get("category")
+                    and attr_name not in category_columns
+                )
+            config["category_columns"] = category_columns
+
         # Handle legacy na_values (takes precedence over schema na_values for backward compatibility)
         if self.config.na_values is not None:
             config["na_values"] = self.config.na_values
@@ -451,7 +1230,7 @@ class Loader:
                     f"Setting category columns to string type: {category_columns}"
                 )
                 for col in category_columns:
-                    dtype_dict[col] = str
+                    dtype_dict[col] = "category" if self.config.compact_dtypes else str
 
         # Handle schema-based dtype configuration
         if schema and schema.attributes:
@@ -471,6 +1250,17 @@ class Loader:
                         dtype_dict[attr_name] = "boolean"
                     # datetime will be handled post-loading
 
+        # Compact dtypes: text category columns are parsed as category directly,
+        #   numeric ones keep their values and are converted after loading
+        if self.config.compact_dtypes and schema and schema.attributes:
+            for attr_name, attribute in schema.attributes.items():
+                if (attribute.type_attr or {}).get("category") and attribute.type in (
+                    None,
+                    "str",
+                    "string",
+                ):
+                    dtype_dict[attr_name] = "category"
+
         # Only add dtype parameter if we have dtype specifications
         if dtype_dict:
             config["dtype"] = dtype_dict
@@ -486,17 +1276,143 @@ class Loader:
                 config["na_values"] = na_values_dict
                 self._logger.debug(f"Using schema-based na_values: {na_values_dict}")
 
+        return loader_class(config)
+
+    def _compact_dtypes(self, data: pd.DataFrame, schema: Schema) -> pd.DataFrame:
+        """
+        Convert columns to the most compact dtypes the schema allows,
+            and record the memory saved per column in self.compact_report.
+
+        Args:
+            data: Loaded dataframe
+            schema: Schema metadata of the data
+
+        Returns:
+            pd.DataFrame: Data with compact dtypes
+        """
         try:
-            # Create loader instance and load data
-            loader = loader_class(config)
-            data = loader.load().fillna(pd.NA)
-            self._logger.debug(f"Successfully loaded data with shape: {data.shape}")
-            return data
+            import pyarrow  # noqa: F401
+
+            string_dtype: str | None = "string[pyarrow]"
+        except ImportError:
+            string_dtype = None
+
+        report: list[dict[str, Any]] = []
+        for col in data.columns:
+            series: pd.Series = data[col]
+            attribute: Attribute | None = schema.attributes.get(col)
+            if attribute is None:
+                continue
+
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Parsed as category, the text it replaces is estimated
+                original_dtype = "object"
+                original_bytes: int = _object_memory_usage(series)
+                compact = series
+            else:
+                original_dtype = str(series.dtype)
+                original_bytes = int(series.memory_usage(index=False, deep=True))
+                compact = self._compact_series(series, attribute, string_dtype)
+                if compact is None:
+                    continue
+
+            compact_bytes: int = int(compact.memory_usage(index=False, deep=True))
+            data[col] = compact
+            report.append(
+                {
+                    "column": col,
+                    "original_dtype": original_dtype,
+                    "compact_dtype": str(compact.dtype),
+                    "original_bytes": original_bytes,
+                    "compact_bytes": compact_bytes,
+                    "saved_bytes": original_bytes - compact_bytes,
+                }
+            )
+            self._logger.debug(
+                f"Compacted column '{col}' from {original_dtype} to {compact.dtype}, "
+                f"saved {original_bytes - compact_bytes} bytes"
+            )
 
-        except Exception as e:
-            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
-            self._logger.error(error_msg)
-            raise UnableToFollowMetadataError(error_msg) from e
+        self.compact_report = pd.DataFrame(
+            report,
+            columns=[
+                "column",
+                "original_dtype",
+                "compact_dtype",
+                "original_bytes",
+                "compact_bytes",
+                "saved_bytes",
+            ],
+        )
+        self._logger.info(
+            f"Compact dtypes saved {int(self.compact_report['saved_bytes'].sum())} bytes "
+            f"over {len(report)} columns"
+        )
+        return data
+
+    @staticmethod
+    def _compact_series(
+        series: pd.Series, attribute: Attribute, string_dtype: str | None
+    ) -> pd.Series | None:
+        """
+        Convert a column to the most compact dtype its attribute allows.
+
+        Args:
+            series: The column
+            attribute: The attribute of the column
+            string_dtype: The dtype for text columns, None to keep them
+
+        Returns:
+            pd.Series | None: The converted column, None if it is kept as is
+        """
+        type_attr: dict = attribute.type_attr or {}
+
+        if type_attr.get("category"):
+            return series.astype("category")
+
+        if attribute.type == "int" and attribute.enable_optimize_type:
+            if pd.api.types.is_integer_dtype(series):
+                values: pd.Series = series.dropna()
+            elif pd.api.types.is_float_dtype(series):
+                values = series.dropna()
+                if not (values % 1 == 0).all():
+                    return None
+            else:
+                return None
+            if values.empty:
+                return None
+            width: str = str(AttributeMetadater._optimize_int_dtype(values).dtype)
+            if len(values) == len(series):
+                return series.astype(width)
+            # Nullable integers of the same width keep the missing values
+            return series.astype(width.capitalize())
+
+        if (
+            attribute.type == "float"
+            and attribute.enable_optimize_type
+            and pd.api.types.is_float_dtype(series)
+        ):
+            compact = AttributeMetadater._optimize_float_dtype(series, type_attr)
+            if str(compact.dtype) != "float32" or str(series.dtype) == "float32":
+                return None
+            # Only downcast when values round back at the schema precision
+            precision: int = type_attr["precision"]
+            if not (
+                compact.astype("float64")
+                .round(precision)
+                .equals(series.astype("float64").round(precision))
+            ):
+                return None
+            return compact
+
+        if (
+            string_dtype is not None
+            and series.dtype == object
+            and pd.api.types.infer_dtype(series, skipna=True) == "string"
+        ):
+            return series.astype(string_dtype)
+
+        return None
 
     def _process_with_metadater(self, data: pd.DataFrame, schema: Schema) -> Schema:
         """
@@ -514,7 +1430,11 @@ class Loader:
         # If no schema exists, create one from data
         if schema is None or not schema.attributes:
             try:
-                schema = SchemaMetadater.from_data(data, base_schema=None)
+                schema = SchemaMetadater.from_data(
+                    data,
+                    base_schema=None,
+                    precision_sample_size=self.config.precision_sample_size,
+                )
                 # Attributes can now be directly modified (frozen removed)
                 schema.id = self.config.file_name or "inferred_schema"
                 schema.name = self.config.base_name or "Inferred Schema"
@@ -528,7 +1448,11 @@ class Loader:
             # If schema has precision defined, use that precision without inferring from data
             try:
                 # Pass base_schema to from_data, it will correctly inherit all attributes (type, category, nullable, precision, etc.)
-                inferred_schema = SchemaMetadater.from_data(data, base_schema=schema)
+                inferred_schema = SchemaMetadater.from_data(
+                    data,
+                    base_schema=schema,
+                    precision_sample_size=self.config.precision_sample_size,
+                )
 
                 # Use inferred_schema directly, as it has correctly inherited all base_schema attributes
                 # Preserve original schema's metadata (id, name, description, etc.)
@@ -571,7 +1495,9 @@ class Loader:
                         from petsard.metadater import AttributeMetadater
 
                         new_attr = AttributeMetadater.from_data(
-                            data[col_name], enable_stats=schema.enable_stats
+                            data[col_name],
+                            enable_stats=schema.enable_stats,
+                            precision_sample_size=self.config.precision_sample_size,
                         )
                         # Add to schema
                         schema.attributes[col_name] = new_attr
@@ -0,0 +1,193 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+
+from petsard.exceptions import ConfigError, UnableToLoadError
+from petsard.loader.loader_base import LoaderBase
+
+
+class LoaderArrow(LoaderBase):
+    """
+    LoaderArrow
+        pyarrow.dataset implementing of Loader for columnar files,
+        i.e. Parquet, Feather and Arrow IPC.
+
+        Only the columns listed in config["columns"] are read,
+        rows are filtered by config["filters"] while scanning,
+        and the columns in config["category_columns"] arrive as
+        dictionary-encoded pandas categoricals.
+    """
+
+    def __init__(self, config: dict):
+        """
+        Args:
+            config (dict): The configuration for the loader modules.
+
+        Attr:
+            config (dict): The configuration for the loader modules.
+        """
+        super().__init__(config)
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load and return the data
+
+        Return:
+            (pd.DataFrame)
+                Data in columnar file by pd.DataFrame format.
+        """
+        filepath = self.config["filepath"]
+
+        try:
+            dataset, scan_config = self._open()
+            if self.config.get("nrows") is not None:
+                table = dataset.head(self.config["nrows"], **scan_config)
+            else:
+                table = dataset.to_table(**scan_config)
+            return self._to_pandas(table)
+        except ConfigError:
+            raise
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load columnar file: {filepath}", filepath=filepath
+            ) from e
+
+    def iter_load(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Load and yield the data in chunks
+
+        Args:
+            chunksize (int): The maximum number of rows per chunk.
+                Chunks can be smaller at the end of a file fragment.
+
+        Yield:
+            (pd.DataFrame)
+                Chunk of data in columnar file by pd.DataFrame format.
+        """
+        filepath = self.config["filepath"]
+        remaining: int | None = self.config.get("nrows")
+
+        try:
+            dataset, scan_config = self._open()
+
+            import pyarrow as pa
+
+            for batch in dataset.to_batches(batch_size=chunksize, **scan_config):
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+                    batch = batch.slice(0, remaining)
+                    remaining -= batch.num_rows
+                if batch.num_rows == 0:
+                    continue
+                yield self._to_pandas(pa.Table.from_batches([batch]))
+        except ConfigError:
+            raise
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load columnar file: {filepath}", filepath=filepath
+            ) from e
+
+    def _open(self) -> tuple:
+        """
+        Open the file as a pyarrow dataset and build the scan options
+
+        Return:
+            (tuple)
+                - dataset (pyarrow.dataset.Dataset): The opened dataset.
+                - scan_config (dict): columns and filter of the scan.
+        """
+        # Check if pyarrow is installed
+        try:
+            import pyarrow.dataset as ds
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ConfigError(
+                "pyarrow is required to read Parquet, Feather and Arrow IPC files. "
+                "Please install it with: pip install petsard[arrow]"
+            ) from e
+
+        filepath = self.config["filepath"]
+        file_ext: str = self.config.get("file_ext") or Path(filepath).suffix.lower()
+        is_parquet: bool = file_ext == ".parquet"
+
+        # 1. Parquet can decode string columns straight into dictionaries,
+        #    Feather / Arrow IPC keep the encoding they were written with
+        if self.config.get("compression") is not None:
+            dataset = ds.dataset(self._read_compressed(is_parquet))
+        elif is_parquet:
+            file_format = ds.ParquetFileFormat(
+                read_options={
+                    "dictionary_columns": self.config.get("category_columns") or []
+                }
+            )
+            dataset = ds.dataset(filepath, format=file_format)
+        else:
+            dataset = ds.dataset(filepath, format=ds.IpcFileFormat())
+
+        # 2. column projection, only columns present in the file are requested
+        columns: list[str] | None = None
+        if self.config.get("columns"):
+            columns = [
+                col for col in self.config["columns"] if col in dataset.schema.names
+            ]
+
+        # 3. predicate pushdown, in the DNF format of pyarrow.parquet filters
+        filter_expr = None
+        if self.config.get("filters"):
+            filter_expr = pq.filters_to_expression(self.config["filters"])
+
+        return dataset, {"columns": columns, "filter": filter_expr}
+
+    def _read_compressed(self, is_parquet: bool):
+        """
+        Decompress the file into memory and read it,
+            as Parquet and Arrow IPC files need random access.
+
+        Args:
+            is_parquet (bool): Whether the file is Parquet, otherwise Arrow IPC.
+
+        Return:
+            (pyarrow.Table): The table of the file.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with self._open_source(arrow=True) as source:
+            buffer = pa.py_buffer(source.read())
+        if is_parquet:
+            return pq.read_table(
+                pa.BufferReader(buffer),
+                read_dictionary=self.config.get("category_columns") or None,
+            )
+        return pa.ipc.open_file(pa.BufferReader(buffer)).read_all()
+
+    def _to_pandas(self, table) -> pd.DataFrame:
+        """
+        Convert a scanned table to pandas
+
+        Args:
+            table (pyarrow.Table): The scanned table.
+
+        Return:
+            (pd.DataFrame): The table, category columns as pandas categoricals.
+        """
+        import pyarrow.compute as pc
+        from pyarrow import types as pa_types
+
+        # 4. dictionary-encode category columns not stored that way
+        for col in self.config.get("category_columns") or []:
+            if col not in table.column_names:
+                continue
+            idx: int = table.column_names.index(col)
+            if not pa_types.is_dictionary(table.schema.field(idx).type):
+                table = table.set_column(
+                    idx, col, pc.dictionary_encode(table.column(idx))
+                )
+
+        # 5. If header_names is not None, setting custom header names
+        if self.config.get("header_names") is not None:
+            table = table.rename_columns(self.config["header_names"])
+
+        return table.to_pandas()
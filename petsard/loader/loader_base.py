@@ -1,7 +1,20 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 
 import pandas as pd
 
+from petsard.exceptions import ConfigError
+
+# Compression of files by extension, after the extension of the file format
+COMPRESSIONS: dict[str, str] = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
 
 class LoaderBase(ABC):
     """
@@ -28,3 +41,102 @@ class LoaderBase(ABC):
         Load and return the data
         """
         raise NotImplementedError()
+
+    def iter_load(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Load and yield the data in chunks
+
+        Args:
+            chunksize (int): The maximum number of rows per chunk.
+        """
+        raise NotImplementedError()
+
+    @contextmanager
+    def _open_source(self, arrow: bool = False):
+        """
+        Open the file for reading,
+            as a stream of decompressed bytes if config["compression"] is set.
+
+        Args:
+            arrow (bool): Whether to prefer pyarrow streams, which decompress
+                in the C++ codecs of Arrow. Default is False.
+
+        Yield:
+            (str | file-like)
+                The filepath if not compressed, otherwise a binary stream.
+        """
+        filepath = self.config["filepath"]
+        compression: str | None = self.config.get("compression")
+        if compression is None:
+            yield filepath
+            return
+
+        with _open_compressed(filepath, compression, arrow=arrow) as stream:
+            yield stream
+
+
+def _open_compressed(filepath: str, compression: str, arrow: bool = False):
+    """
+    Open a compressed file as a stream of its decompressed bytes.
+
+    zstd is decompressed by pyarrow when installed, otherwise by zstandard.
+
+    Args:
+        filepath (str): The compressed file.
+        compression (str): The compression in COMPRESSIONS.
+        arrow (bool): Whether to prefer pyarrow streams for all compressions.
+            Default is False.
+
+    Return:
+        (file-like): The binary stream.
+    """
+    # Arrow has C++ codecs for all but xz
+    if (arrow or compression == "zstd") and compression != "xz":
+        try:
+            import pyarrow as pa
+
+            if pa.Codec.is_available(compression):
+                return pa.input_stream(filepath, compression=compression)
+        except ImportError:
+            pass
+
+    if compression == "gzip":
+        import gzip
+
+        return gzip.open(filepath, "rb")
+    if compression == "bz2":
+        import bz2
+
+        return bz2.open(filepath, "rb")
+    if compression == "xz":
+        import lzma
+
+        return lzma.open(filepath, "rb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ConfigError(
+                "pyarrow or zstandard is required to read zstd compressed files. "
+                "Please install it with: pip install petsard[arrow]"
+            ) from e
+        return zstandard.open(filepath, "rb")
+
+    raise ConfigError(f"Unsupported compression: {compression}")
+
+
+def mask_password(filepath: str) -> str:
+    """
+    Mask the password of a database URL, for logs and error messages.
+
+    Args:
+        filepath (str): The filepath or database URL.
+
+    Return:
+        (str): The filepath, with the password of a database URL replaced by ***.
+    """
+    parts = urlsplit(str(filepath))
+    if parts.password is None:
+        return str(filepath)
+    netloc: str = parts.netloc.replace(f":{parts.password}@", ":***@", 1)
+    return parts._replace(netloc=netloc).geturl()
@@ -1,15 +1,43 @@
+import importlib.util
+import io
+import itertools
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
 
-from petsard.exceptions import UnableToLoadError
+from petsard.exceptions import ConfigError, UnableToLoadError
 from petsard.loader.loader_base import LoaderBase
 
+# Text recognized as booleans by the pandas C engine
+TRUE_VALUES: list[str] = ["True", "TRUE", "true"]
+FALSE_VALUES: list[str] = ["False", "FALSE", "false"]
+# Text accepted for columns read with dtype "boolean"
+BOOLEAN_STRINGS: dict[str, bool] = {
+    **dict.fromkeys([*TRUE_VALUES, "1", "1.0"], True),
+    **dict.fromkeys([*FALSE_VALUES, "0", "0.0"], False),
+}
+
 
 class LoaderPandasCsv(LoaderBase):
     """
     LoaderPandasCsv
         pandas.read_csv implementing of Loader
+
+        The parsing engine is set by config["engine"]:
+        - 'c' (default) and 'python': The pandas engines.
+        - 'pyarrow': Multithreaded parsing by pyarrow.csv.
+        - 'polars': Multithreaded parsing by polars, converted to pandas.
+        Results of 'pyarrow' and 'polars' are converted to the dtypes
+        the C engine gives, so all engines load identical data.
     """
 
+    ENGINES: tuple[str, ...] = ("c", "python", "pyarrow", "polars")
+    # Rows polars infers the column types from, before falling back to all rows
+    POLARS_INFER_SCHEMA_LENGTH: int = 10000
+
     def __init__(self, config: dict):
         """
         Args:
@@ -28,39 +56,370 @@ class LoaderPandasCsv(LoaderBase):
             (pd.DataFrame)
                 Data in csv by pd.DataFrame format.
         """
-        # 1. set the filepath as first positional argument
         filepath = self.config["filepath"]
+        engine: str = self.config.get("engine") or "c"
+
+        try:
+            if engine == "pyarrow":
+                return self._to_c_engine_dtypes(self._read_pyarrow())
+            if engine == "polars":
+                return self._to_c_engine_dtypes(self._read_polars(), infer_strings=True)
+            with self._open_source() as source:
+                return pd.read_csv(source, engine=engine, **self._get_pandas_config())
+        except ConfigError:
+            raise
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load CSV file: {filepath}", filepath=filepath
+            ) from e
+
+    def iter_load(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Load and yield the data in chunks
+
+        Chunks are parsed by the pandas engines,
+            'pyarrow' and 'polars' fall back to the C engine.
+
+        Args:
+            chunksize (int): The maximum number of rows per chunk.
+
+        Yield:
+            (pd.DataFrame)
+                Chunk of data in csv by pd.DataFrame format.
+        """
+        filepath = self.config["filepath"]
+        engine: str = self.config.get("engine") or "c"
 
+        try:
+            with (
+                self._open_source() as source,
+                pd.read_csv(
+                    source,
+                    chunksize=chunksize,
+                    engine=engine if engine in ("c", "python") else "c",
+                    **self._get_pandas_config(),
+                ) as reader,
+            ):
+                yield from reader
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load CSV file: {filepath}", filepath=filepath
+            ) from e
+
+    def _get_pandas_config(self) -> dict:
+        """
+        Build the keyword arguments of pandas.read_csv
+
+        Return:
+            (dict): Keyword arguments of pandas.read_csv, besides the filepath.
+        """
         pandas_config = {}
 
-        # 2. If header_names is not None, setting custom header names
+        # 1. If header_names is not None, setting custom header names
         if self.config.get("header_names") is not None:
             pandas_config.update({"header": 0, "names": self.config["header_names"]})
         else:
             # Default header settings to match original behavior
             pandas_config.update({"header": "infer", "names": None})
 
-        # 3. assign dtype, na_values, and nrows
+        # 2. assign dtype, na_values, and nrows
         list_setting = ["dtype", "na_values", "nrows"]
         pandas_config.update(
             {k: self.config[k] for k in list_setting if k in self.config}
         )
 
+        return pandas_config
+
+    def _get_column_plan(self) -> tuple[list[str], dict[str, list], set[str], set[str]]:
+        """
+        Plan how the Arrow-based engines read the columns,
+            so the result matches the C engine.
+
+        Return:
+            (tuple)
+                - null_values (list[str]): Text read as null in every column.
+                - column_na_values (dict[str, list]): Extra null text per column.
+                - text_columns (set[str]): Columns read as text and converted later,
+                    i.e. columns with dtype str, "boolean" or "category",
+                    or with extra null text.
+                - float_columns (set[str]): Columns read as float.
+        """
+        dtype: dict = self.config.get("dtype") or {}
+        na_values = self.config.get("na_values")
+
+        null_values: list[str] = sorted(STR_NA_VALUES)
+        column_na_values: dict[str, list] = {}
+        if isinstance(na_values, dict):
+            column_na_values = {
+                col: [str(v) for v in (na if isinstance(na, list) else [na])]
+                for col, na in na_values.items()
+            }
+        elif isinstance(na_values, str):
+            null_values.append(na_values)
+        elif na_values is not None:
+            null_values.extend(str(v) for v in na_values)
+
+        text_columns: set[str] = set(column_na_values) | {
+            col
+            for col, col_dtype in dtype.items()
+            if col_dtype in (str, "boolean", "category")
+        }
+        float_columns: set[str] = {
+            col
+            for col, col_dtype in dtype.items()
+            if col_dtype in (float, "float") and col not in text_columns
+        }
+        return null_values, column_na_values, text_columns, float_columns
+
+    def _read_pyarrow(self):
+        """
+        Parse the file by pyarrow.csv with multiple threads.
+
+        Return:
+            (pyarrow.Table): The parsed table.
+        """
         try:
-            return pd.read_csv(filepath, **pandas_config)
-        except Exception as e:
-            raise UnableToLoadError(
-                f"Failed to load CSV file: {filepath}",
-                filepath=filepath
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError as e:
+            raise ConfigError(
+                "pyarrow is required for the 'pyarrow' CSV engine. "
+                "Please install it with: pip install petsard[arrow]"
             ) from e
 
+        header_names: list[str] | None = self.config.get("header_names")
+        null_values, _, text_columns, float_columns = self._get_column_plan()
+
+        read_options = pa_csv.ReadOptions(
+            use_threads=True,
+            skip_rows=1 if header_names is not None else 0,
+            column_names=header_names,
+        )
+        column_types: dict = {
+            **{col: pa.float64() for col in float_columns},
+            **{col: pa.string() for col in text_columns},
+        }
+
+        def _convert_options():
+            return pa_csv.ConvertOptions(
+                column_types=column_types,
+                null_values=null_values,
+                strings_can_be_null=True,
+                true_values=TRUE_VALUES,
+                false_values=FALSE_VALUES,
+            )
+
+        def _temporal_columns(schema) -> dict:
+            # pyarrow infers dates and times, which the C engine keeps as text
+            return {
+                field.name: pa.string()
+                for field in schema
+                if pa.types.is_temporal(field.type)
+            }
+
+        # 1. keep the date-like columns of the first block as text
+        with (
+            self._open_source(arrow=True) as source,
+            pa_csv.open_csv(
+                source, read_options=read_options, convert_options=_convert_options()
+            ) as reader,
+        ):
+            column_types.update(_temporal_columns(reader.schema))
+
+        # 2. parse, the first rows only if nrows is set
+        nrows: int | None = self.config.get("nrows")
+        if nrows is None:
+            with self._open_source(arrow=True) as source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=read_options,
+                    convert_options=_convert_options(),
+                )
+            # dates first found after the first block need one more pass
+            temporal: dict = _temporal_columns(table.schema)
+            if temporal:
+                column_types.update(temporal)
+                with self._open_source(arrow=True) as source:
+                    table = pa_csv.read_csv(
+                        source,
+                        read_options=read_options,
+                        convert_options=_convert_options(),
+                    )
+        else:
+            # Types are inferred from the first block when reading a stream
+            batches: list = []
+            n_read: int = 0
+            with (
+                self._open_source(arrow=True) as source,
+                pa_csv.open_csv(
+                    source,
+                    read_options=read_options,
+                    convert_options=_convert_options(),
+                ) as reader,
+            ):
+                for batch in reader:
+                    if n_read >= nrows:
+                        break
+                    batches.append(batch)
+                    n_read += batch.num_rows
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+            table = table.slice(0, nrows)
+
+        return table
+
+    def _read_polars(self):
+        """
+        Parse the file by polars with multiple threads.
+
+        Return:
+            (pyarrow.Table): The parsed table.
+        """
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ConfigError(
+                "polars is required for the 'polars' CSV engine. "
+                "Please install it with: pip install polars"
+            ) from e
+
+        header_names: list[str] | None = self.config.get("header_names")
+        null_values, _, text_columns, float_columns = self._get_column_plan()
+
+        read_config: dict = {
+            "has_header": True,
+            "new_columns": header_names,
+            "n_rows": self.config.get("nrows"),
+            "null_values": null_values,
+            "schema_overrides": {
+                **dict.fromkeys(float_columns, pl.Float64),
+                **dict.fromkeys(text_columns, pl.String),
+            },
+        }
+        try:
+            # Types are inferred from the first rows,
+            #   text columns are re-inferred in _to_c_engine_dtypes()
+            with self._open_source(arrow=True) as source:
+                data = pl.read_csv(
+                    source,
+                    infer_schema_length=self.POLARS_INFER_SCHEMA_LENGTH,
+                    **read_config,
+                )
+        except pl.exceptions.ComputeError:
+            # Later rows do not fit the inferred types, infer from all rows
+            with self._open_source(arrow=True) as source:
+                data = pl.read_csv(source, infer_schema_length=None, **read_config)
+        return data.to_arrow()
+
+    def _to_c_engine_dtypes(self, table, infer_strings: bool = False) -> pd.DataFrame:
+        """
+        Convert a table parsed by an Arrow-based engine to pandas,
+            with the values and dtypes the C engine gives.
+
+        Args:
+            table (pyarrow.Table): The parsed table.
+            infer_strings (bool): Whether to re-infer the types of text columns,
+                for engines inferring types from the first rows only.
+                Default is False.
+
+        Return:
+            (pd.DataFrame): The converted data.
+        """
+        from pyarrow import types as pa_types
+
+        dtype: dict = self.config.get("dtype") or {}
+        _, column_na_values, text_columns, _ = self._get_column_plan()
+        null_counts: dict[str, int] = {
+            name: table.column(name).null_count for name in table.column_names
+        }
+        string_columns: set[str] = {
+            field.name
+            for field in table.schema
+            if pa_types.is_string(field.type) or pa_types.is_large_string(field.type)
+        }
+
+        data: pd.DataFrame = table.to_pandas()
+        for col in data.columns:
+            series: pd.Series = data[col]
+            if series.dtype != object:
+                continue
+
+            # Missing text is NaN as in the C engine, not None
+            if null_counts.get(col):
+                series = series.where(series.notna(), np.nan)
+            if col in column_na_values:
+                series = series.mask(series.isin(column_na_values[col]))
+
+            col_dtype = dtype.get(col)
+            if col_dtype is str:
+                data[col] = series
+            elif col_dtype in (float, "float"):
+                data[col] = pd.to_numeric(series).astype("float64")
+            elif col_dtype == "category":
+                data[col] = series.astype("category")
+            elif col_dtype == "boolean":
+                unknown = series.dropna()[~series.dropna().isin(BOOLEAN_STRINGS)]
+                if not unknown.empty:
+                    raise ValueError(
+                        f"Column {col} has non-boolean values: {unknown.iloc[0]}"
+                    )
+                data[col] = series.map(BOOLEAN_STRINGS).astype("boolean")
+            elif (
+                (infer_strings and col in string_columns)
+                or col in text_columns
+                or null_counts.get(col) == len(series)
+            ):
+                data[col] = self._infer_text(series)
+            else:
+                data[col] = series
+
+        return data
+
+    @staticmethod
+    def _infer_text(series: pd.Series) -> pd.Series:
+        """
+        Infer the dtype of a text column as the C engine does.
+
+        Args:
+            series (pd.Series): Text column, missing values as NaN.
+
+        Return:
+            (pd.Series): int64 or float64 if numeric, bool if boolean,
+                otherwise the text as object.
+        """
+        values: pd.Series = series.dropna()
+        if values.empty:
+            return series.astype("float64")
+        try:
+            return pd.to_numeric(series)
+        except (ValueError, TypeError):
+            pass
+        if values.isin(TRUE_VALUES + FALSE_VALUES).all():
+            booleans: pd.Series = series.map(
+                lambda value: value in TRUE_VALUES if isinstance(value, str) else value
+            )
+            return booleans.astype(bool) if len(values) == len(series) else booleans
+        return series
+
 
 class LoaderPandasExcel(LoaderBase):
     """
     LoaderPandasExcel
         pandas.read_excel implementing of Loader
+
+        config["engine"] chooses how the workbook is read:
+        - 'openpyxl' (default): pandas.read_excel, building the whole workbook.
+        - 'streaming': the calamine engine of pandas if python-calamine is installed,
+            otherwise openpyxl read-only row iteration for .xlsx and .xlsm files,
+            building columns straight into typed arrays as pandas.read_excel infers them.
+        - 'calamine': the calamine engine of pandas, requires python-calamine.
     """
 
+    ENGINES: tuple[str, ...] = ("openpyxl", "streaming", "calamine")
+    # Formats openpyxl can iterate in read-only mode
+    STREAMING_EXTS: tuple[str, ...] = (".xlsx", ".xlsm")
+    # Rows transposed into columns at once by the read-only reader
+    BLOCK_SIZE: int = 10000
+
     def __init__(self, config: dict):
         """
         Args:
@@ -79,28 +438,43 @@ class LoaderPandasExcel(LoaderBase):
             (pd.DataFrame)
                 Data in excel by pd.DataFrame format.
         """
-        # Check if openpyxl is installed
-        try:
-            import openpyxl  # noqa: F401
-        except ImportError as e:
-            from petsard.exceptions import ConfigError
+        engine: str = self.config.get("engine") or "openpyxl"
+        file_ext: str = (
+            self.config.get("file_ext") or Path(self.config["filepath"]).suffix.lower()
+        )
 
-            raise ConfigError(
-                "openpyxl is required to read Excel files. "
-                "Please install it with: pip install petsard[xlsx]"
-            ) from e
+        use_calamine: bool = False
+        if engine in ("streaming", "calamine"):
+            use_calamine = importlib.util.find_spec("python_calamine") is not None
+            if engine == "calamine" and not use_calamine:
+                raise ConfigError(
+                    "python-calamine is required for the calamine engine. "
+                    "Please install it with: pip install python-calamine"
+                )
+
+        if not use_calamine:
+            # Check if openpyxl is installed
+            try:
+                import openpyxl  # noqa: F401
+            except ImportError as e:
+                raise ConfigError(
+                    "openpyxl is required to read Excel files. "
+                    "Please install it with: pip install petsard[xlsx]"
+                ) from e
 
         # 1. set the filepath as first positional argument
         filepath = self.config["filepath"]
 
         pandas_config = {}
+        if use_calamine:
+            pandas_config["engine"] = "calamine"
 
         # 2. If header_names is not None, setting custom header names
         if self.config.get("header_names") is not None:
             pandas_config.update({"header": 0, "names": self.config["header_names"]})
         else:
-            # Default header settings to match original behavior
-            pandas_config.update({"header": "infer", "names": None})
+            # The first row is the header, read_excel does not accept "infer"
+            pandas_config.update({"header": 0, "names": None})
 
         # 3. assign dtype, na_values, and nrows
         list_setting = ["dtype", "na_values", "nrows"]
@@ -109,9 +483,247 @@ class LoaderPandasExcel(LoaderBase):
         )
 
         try:
-            return pd.read_excel(filepath, **pandas_config)
+            with self._open_source() as source:
+                if not isinstance(source, str):
+                    # Excel readers need a seekable file
+                    source = io.BytesIO(source.read())
+                if (
+                    engine == "streaming"
+                    and not use_calamine
+                    and file_ext in self.STREAMING_EXTS
+                ):
+                    return self._read_rows(source)
+                return pd.read_excel(source, **pandas_config)
         except Exception as e:
             raise UnableToLoadError(
-                f"Failed to load Excel file: {filepath}",
-                filepath=filepath
+                f"Failed to load Excel file: {filepath}", filepath=filepath
             ) from e
+
+    def _read_rows(self, source) -> pd.DataFrame:
+        """
+        Read the first sheet by openpyxl read-only row iteration,
+            without building the workbook object model.
+
+        Args:
+            source (str | io.BytesIO): The workbook.
+
+        Return:
+            (pd.DataFrame): The sheet as pandas.read_excel reads it.
+        """
+        import openpyxl
+
+        nrows: int | None = self.config.get("nrows")
+        header_names: list | None = self.config.get("header_names")
+
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header: tuple = next(rows, ())
+
+            columns: list[list] = []
+            n_rows: int = 0
+            n_blank: int = 0  # blank rows kept only if data follows
+            block: list[tuple] = []
+            for row in rows:
+                if nrows is not None and n_rows + n_blank >= nrows:
+                    break
+                if row.count(None) == len(row):
+                    n_blank += 1
+                    continue
+                if n_blank:
+                    block.extend([()] * n_blank)
+                    n_rows += n_blank
+                    n_blank = 0
+                block.append(row)
+                n_rows += 1
+                if len(block) >= self.BLOCK_SIZE:
+                    self._extend_columns(columns, block)
+                    block = []
+            self._extend_columns(columns, block)
+        finally:
+            workbook.close()
+
+        # Empty columns up to the last header cell
+        width: int = max(len(columns), _last_value_position(header))
+        columns.extend([None] * n_rows for _ in range(width - len(columns)))
+
+        if header_names is not None:
+            if any(
+                value is not None
+                for col in columns[len(header_names) :]
+                for value in col
+            ):
+                raise ValueError(
+                    f"Data has more columns than header_names ({len(header_names)})"
+                )
+            columns = columns[: len(header_names)]
+            columns.extend(
+                [None] * n_rows for _ in range(len(columns), len(header_names))
+            )
+            names: list = list(header_names)
+        else:
+            names = _make_header(header, width)
+
+        return pd.DataFrame(
+            {
+                name: self._to_series(np.array(col, dtype=object), name)
+                for name, col in zip(names, columns, strict=True)
+            },
+            columns=names,
+        )
+
+    @staticmethod
+    def _extend_columns(columns: list[list], block: list[tuple]) -> None:
+        """
+        Transpose a block of rows onto the columns.
+
+        Args:
+            columns (list[list]): Cell values per column, extended in place.
+            block (list[tuple]): Rows of cell values, blank rows as ().
+        """
+        if not block:
+            return
+        n_rows: int = len(columns[0]) if columns else 0
+        for idx, values in enumerate(itertools.zip_longest(*block)):
+            if idx >= len(columns):
+                if all(value is None for value in values):
+                    # Trailing empty cells of read-only rows
+                    continue
+                columns.extend([None] * n_rows for _ in range(idx - len(columns) + 1))
+            columns[idx].extend(values)
+        # Columns beyond the cells of this block
+        for col in columns:
+            col.extend([None] * (n_rows + len(block) - len(col)))
+
+    def _to_series(self, values: np.ndarray, name) -> pd.Series:
+        """
+        Convert the cell values of a column as pandas.read_excel does.
+
+        Args:
+            values (np.ndarray): Cell values as an object array.
+            name: The column name.
+
+        Return:
+            (pd.Series): The column in the configured or the inferred dtype.
+        """
+        # 1. missing values: empty cells, default and extra NA text
+        na_values = self.config.get("na_values")
+        if isinstance(na_values, dict):
+            na_values = na_values.get(name)
+        if na_values is None:
+            extra_values: list = []
+        elif isinstance(na_values, str | int | float):
+            extra_values = [na_values]
+        else:
+            extra_values = list(na_values)
+        na_strings: set[str] = STR_NA_VALUES | {str(v) for v in extra_values}
+        na_numbers: set[float] = set()
+        for value in extra_values:
+            try:
+                na_numbers.add(float(value))
+            except (TypeError, ValueError):
+                pass
+
+        series = pd.Series(values, dtype=object)
+        cell_types: pd.Series = series.map(type)
+        na_mask: pd.Series = series.isna() | (
+            cell_types.isin([str]) & series.isin(na_strings)
+        )
+        if na_numbers:
+            na_mask |= cell_types.isin([int, float]) & series.isin(na_numbers)
+        series[na_mask] = np.nan
+
+        # 2. integral floats are integers, as pandas reads openpyxl cells
+        is_float: pd.Series = cell_types.isin([float]) & ~na_mask
+        if is_float.any():
+            floats: pd.Series = series[is_float].astype("float64")
+            integral: pd.Series = floats % 1 == 0
+            series[integral[integral].index] = list(floats[integral].astype("int64"))
+
+        # 3. assign dtype
+        dtype = (self.config.get("dtype") or {}).get(name)
+        if dtype is str:
+            return series.mask(~na_mask, series.astype(str))
+        return self._infer_cells(series, dtype)
+
+    @staticmethod
+    def _infer_cells(series: pd.Series, dtype=None) -> pd.Series:
+        """
+        Convert the cells of a column to the dtype, or infer it as pandas.read_excel does.
+
+        Args:
+            series (pd.Series): Cell values as object, missing values as NaN.
+            dtype: The configured dtype of the column, None to infer it.
+
+        Return:
+            (pd.Series): The column in the converted dtype.
+        """
+        if dtype in (float, "float"):
+            return pd.to_numeric(series).astype("float64")
+        if dtype == "boolean":
+            return series.map(
+                lambda value: (
+                    BOOLEAN_STRINGS.get(value, value)
+                    if isinstance(value, str)
+                    else value
+                )
+            ).astype("boolean")
+        if dtype == "category":
+            return series.astype("category")
+
+        values: pd.Series = series.dropna()
+        if values.empty:
+            return series.astype("float64")
+        kind: str = pd.api.types.infer_dtype(values, skipna=False)
+        if kind in ("datetime", "date"):
+            return pd.to_datetime(series)
+        if kind == "boolean":
+            # Booleans with missing values are read as 1.0 / 0.0
+            return (
+                series.astype(bool)
+                if len(values) == len(series)
+                else series.astype("float64")
+            )
+        return LoaderPandasCsv._infer_text(series)
+
+
+def _last_value_position(row: tuple) -> int:
+    """
+    Args:
+        row (tuple): Cell values of a row.
+
+    Return:
+        (int): The number of cells up to the last non-empty one.
+    """
+    for idx in range(len(row), 0, -1):
+        if row[idx - 1] is not None:
+            return idx
+    return 0
+
+
+def _make_header(header: tuple, width: int) -> list:
+    """
+    Name the columns from the header row as pandas.read_excel does,
+        'Unnamed: i' for empty cells and '.n' suffixes for duplicates.
+
+    Args:
+        header (tuple): Cell values of the header row.
+        width (int): The number of columns.
+
+    Return:
+        (list): The column names.
+    """
+    names: list = []
+    counts: dict = {}
+    for idx in range(width):
+        name = header[idx] if idx < len(header) else None
+        if name is None or name == "":
+            name = f"Unnamed: {idx}"
+        count: int = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        counts[name] = count + 1
+        names.append(name)
+    return names
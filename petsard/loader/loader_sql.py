@@ -0,0 +1,231 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from petsard.exceptions import ConfigError, UnableToLoadError
+from petsard.loader.loader_base import LoaderBase, mask_password
+from petsard.loader.loader_pandas import BOOLEAN_STRINGS
+
+
+class LoaderSQL(LoaderBase):
+    """
+    LoaderSQL
+        pandas.read_sql implementing of Loader for databases.
+
+        config["filepath"] is a database URL in the SQLAlchemy format,
+        e.g. sqlite:///data/users.db or postgresql://user@host/db,
+        and rows come from config["query"] or the whole config["table"].
+        Rows are fetched from a streaming (server-side) cursor in chunks,
+        and converted to the dtypes of the schema as CSV files are.
+        SQLite databases are read by the standard sqlite3 module,
+        other databases need SQLAlchemy and the driver of the database.
+    """
+
+    # Rows fetched per round trip in load()
+    FETCH_SIZE: int = 10000
+
+    def __init__(self, config: dict):
+        """
+        Args:
+            config (dict): The configuration for the loader modules.
+
+        Attr:
+            config (dict): The configuration for the loader modules.
+        """
+        super().__init__(config)
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load and return the data
+
+        Return:
+            (pd.DataFrame)
+                Rows of the query or table by pd.DataFrame format.
+        """
+        chunks: list[pd.DataFrame] = list(self.iter_load(self.FETCH_SIZE))
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+
+    def iter_load(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Load and yield the data in chunks
+
+        Args:
+            chunksize (int): The number of rows fetched per chunk.
+
+        Yield:
+            (pd.DataFrame)
+                Chunk of rows of the query or table by pd.DataFrame format.
+                At least one chunk is yielded, empty if there are no rows.
+        """
+        remaining: int | None = self.config.get("nrows")
+
+        try:
+            with self._connect() as (con, quote):
+                sql: str = self._get_sql(con, quote)
+                n_yielded: int = 0
+                for chunk in pd.read_sql(sql, con, chunksize=chunksize):
+                    if remaining is not None:
+                        chunk = chunk.iloc[:remaining]
+                        remaining -= len(chunk)
+                    if n_yielded > 0 and chunk.empty:
+                        break
+                    yield self._convert(chunk).set_axis(
+                        range(n_yielded, n_yielded + len(chunk))
+                    )
+                    n_yielded += len(chunk)
+                    if remaining is not None and remaining <= 0:
+                        break
+        except ConfigError:
+            raise
+        except Exception as e:
+            safe_url: str = mask_password(self.config["filepath"])
+            raise UnableToLoadError(
+                f"Failed to load from database: {safe_url}",
+                filepath=safe_url,
+            ) from e
+
+    @contextmanager
+    def _connect(self):
+        """
+        Connect to the database of config["filepath"]
+
+        Yield:
+            (tuple)
+                - con (sqlite3.Connection | sqlalchemy.engine.Connection):
+                    The connection, streaming results where supported.
+                - quote (Callable[[str], str]): Quotes an identifier for the database.
+        """
+        url: str = self.config["filepath"]
+
+        if url.lower().startswith("sqlite:"):
+            import sqlite3
+
+            # sqlite:///relative.db, sqlite:////absolute.db, sqlite:// in memory
+            parts = urlsplit(url)
+            database: str = parts.path[1:] or ":memory:"
+            if parts.query:
+                con = sqlite3.connect(f"file:{database}?{parts.query}", uri=True)
+            else:
+                con = sqlite3.connect(database)
+            try:
+                # sqlite3 cursors step through the rows as they are fetched
+                yield con, _quote_identifier
+            finally:
+                con.close()
+            return
+
+        try:
+            import sqlalchemy
+        except ImportError as e:
+            raise ConfigError(
+                "SQLAlchemy is required to read databases other than SQLite. "
+                "Please install it with: pip install petsard[sql]"
+            ) from e
+
+        engine = sqlalchemy.create_engine(url)
+        try:
+            with engine.connect() as con:
+                yield (
+                    con.execution_options(stream_results=True),
+                    engine.dialect.identifier_preparer.quote,
+                )
+        finally:
+            engine.dispose()
+
+    def _get_sql(self, con, quote) -> str:
+        """
+        Build the query of the rows to load
+
+        Args:
+            con: The database connection.
+            quote (Callable[[str], str]): Quotes an identifier for the database.
+
+        Return:
+            (str): config["query"], or a SELECT of the table,
+                projected to config["columns"] if given.
+        """
+        if self.config.get("query"):
+            return self.config["query"]
+
+        table: str = ".".join(quote(part) for part in self.config["table"].split("."))
+        selected: str = "*"
+        if self.config.get("columns"):
+            # Only columns present in the table are requested
+            table_columns = pd.read_sql(f"SELECT * FROM {table} WHERE 1 = 0", con)
+            columns: list[str] = [
+                col for col in self.config["columns"] if col in table_columns.columns
+            ]
+            if columns:
+                selected = ", ".join(quote(col) for col in columns)
+        return f"SELECT {selected} FROM {table}"
+
+    def _convert(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert a fetched chunk as the CSV reader converts parsed text
+
+        Args:
+            chunk (pd.DataFrame): The fetched rows.
+
+        Return:
+            (pd.DataFrame): The rows with header names, NA values and dtypes applied.
+        """
+        # 1. If header_names is not None, setting custom header names
+        if self.config.get("header_names") is not None:
+            chunk.columns = self.config["header_names"]
+
+        # 2. extra NA values, for every column or per column
+        na_values = self.config.get("na_values")
+        if na_values is not None:
+            if isinstance(na_values, dict):
+                column_na_values = na_values
+            else:
+                column_na_values = dict.fromkeys(chunk.columns, na_values)
+            for col, na in column_na_values.items():
+                if col in chunk.columns:
+                    chunk[col] = chunk[col].mask(
+                        chunk[col].isin(na if isinstance(na, list) else [na])
+                    )
+
+        # 3. assign dtype
+        dtype: dict = self.config.get("dtype") or {}
+        for col in chunk.columns:
+            series: pd.Series = chunk[col]
+            col_dtype = dtype.get(col)
+            if col_dtype is str:
+                chunk[col] = series.where(series.isna(), series.astype(str))
+            elif col_dtype in (float, "float"):
+                chunk[col] = pd.to_numeric(series).astype("float64")
+            elif col_dtype == "boolean":
+                if series.dtype == object:
+                    series = series.map(
+                        lambda value: (
+                            BOOLEAN_STRINGS.get(value, value)
+                            if isinstance(value, str)
+                            else value
+                        )
+                    )
+                chunk[col] = series.astype("boolean")
+            elif col_dtype == "category":
+                chunk[col] = series.astype("category")
+            elif series.dtype == object and series.isna().all():
+                # Columns without values in this chunk, as the C engine reads them
+                chunk[col] = series.astype("float64")
+
+        return chunk
+
+
+def _quote_identifier(name: str) -> str:
+    """
+    Quote an identifier in the SQL standard way, as SQLite accepts.
+
+    Args:
+        name (str): The identifier.
+
+    Return:
+        (str): The quoted identifier.
+    """
+    return '"' + name.replace('"', '""') + '"'
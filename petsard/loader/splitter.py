@@ -1,11 +1,53 @@
-import random
+import hashlib
+from dataclasses import replace
 
+import numpy as np
 import pandas as pd
 
 from petsard.exceptions import ConfigError
 from petsard.metadater.metadata import Schema
 
 
+class SplitView:
+    """
+    Train or validation rows of a split, kept as positions into the source data.
+        The rows are copied out only when materialize() is called,
+        so many splits of one table hold little more than the table itself.
+    """
+
+    def __init__(self, data: pd.DataFrame, index: np.ndarray):
+        """
+        Args:
+            data (pd.DataFrame): The source data, with a RangeIndex.
+            index (np.ndarray): The sorted integer row positions of the split.
+
+        Attr:
+            data (pd.DataFrame): The source data.
+            index (np.ndarray): The row positions of the split.
+        """
+        self.data: pd.DataFrame = data
+        self.index: np.ndarray = index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return f"SplitView(rows={len(self.index)}, columns={self.data.shape[1]})"
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self.index), self.data.shape[1])
+
+    def materialize(self) -> pd.DataFrame:
+        """
+        Copy out the rows of the split.
+
+        Returns:
+            (pd.DataFrame): The rows of the split, reindexed from 0.
+        """
+        return self.data.iloc[self.index].reset_index(drop=True)
+
+
 class Splitter:
     """
     Splitter is an independent module for Executor use. Included:
@@ -14,6 +56,9 @@ class Splitter:
     c.) output their train/validation indexes (self.index_samples) and pd.DataFrame data (self.data)
     """
 
+    # Candidate rows checked at once when building an overlap-constrained sample
+    CONSTRUCT_BLOCK_SIZE: int = 1 << 16
+
     def __init__(
         self,
         num_samples: int | None = 1,
@@ -21,6 +66,7 @@ class Splitter:
         random_state: int | float | str | None = None,
         max_overlap_ratio: float | None = 1.0,
         max_attempts: int | None = 30,
+        lazy: bool | None = False,
     ):
         """
         Args:
@@ -36,11 +82,15 @@ class Splitter:
                 Default is 1.0 (100%). Set to 0.0 for no overlap.
             max_attempts (int, optional):
                 Maximum number of attempts for sampling. Default is 30.
+            lazy (bool, optional):
+                Return SplitView objects holding the row positions
+                instead of train/validation DataFrame copies,
+                and train indices as integer arrays instead of sets. Default is False.
 
         Attr:
             config (dict):
                 The configuration of Splitter containing:
-                num_samples, train_split_ratio, random_state, max_overlap_ratio, max_attempts.
+                num_samples, train_split_ratio, random_state, max_overlap_ratio, max_attempts, lazy.
         """
         if not (0.0 <= train_split_ratio <= 1.0):
             raise ConfigError(
@@ -57,6 +107,7 @@ class Splitter:
             "random_state": random_state,
             "max_overlap_ratio": max_overlap_ratio,
             "max_attempts": max_attempts,
+            "lazy": bool(lazy),
         }
 
     def split(
@@ -64,7 +115,7 @@ class Splitter:
         data: pd.DataFrame,
         metadata: Schema,
         exist_train_indices: list[set] = None,
-    ) -> tuple[dict, dict, list[set]]:
+    ) -> tuple[dict, dict, list[set] | list[np.ndarray]]:
         """
         Perform index bootstrapping on the Splitter-initialized data
             and split it into train and validation sets
@@ -77,10 +128,12 @@ class Splitter:
                 The existing train index sets we want to avoid overlapping with.
 
         Returns:
-            tuple[dict, dict, list[set]]:
-                - Split data: {1: {train: pd.DataFrame, validation: pd.DataFrame}, 2: ...}
+            tuple[dict, dict, list[set] | list[np.ndarray]]:
+                - Split data: {1: {train: pd.DataFrame, validation: pd.DataFrame}, 2: ...},
+                    or SplitView in place of pd.DataFrame when lazy
                 - Metadata: {1: {train: Schema, validation: Schema}, 2: ...}
-                - Train indices: [{train_indices_set1}, {train_indices_set2}, ...]
+                - Train indices: [{train_indices_set1}, {train_indices_set2}, ...],
+                    or sorted integer arrays in place of sets when lazy
         """
         if data is None:
             raise ConfigError("Data must be provided for splitting")
@@ -90,37 +143,108 @@ class Splitter:
         data.reset_index(drop=True, inplace=True)  # avoid unexpected index
 
         index_result = self._bootstrapping(
-            index=data.index.tolist(), exist_train_indices=exist_train_indices
+            n_rows=len(data), exist_train_indices=exist_train_indices
         )
 
+        return self._assemble_split(data, metadata, index_result)
+
+    def split_batch(
+        self,
+        data: pd.DataFrame,
+        metadata: Schema,
+        num_batches: int,
+        exist_train_indices: list[set] = None,
+    ) -> list[tuple[dict, dict, list[set] | list[np.ndarray]]]:
+        """
+        Perform split() for num_batches Splitters of this configuration in one call,
+            as if they ran one after another on the same data,
+            each avoiding the train indices of the ones before it.
+
+        The results are identical to those sequential calls under the same random_state,
+            but random draws repeated by every call are made only once.
+
+        Args:
+            data (pd.DataFrame): The dataset which wait for split.
+            metadata (Schema): The metadata of the dataset.
+            num_batches (int): Number of sequential split() calls to reproduce.
+            exist_train_indices (list[set], optional):
+                The existing train index sets we want to avoid overlapping with.
+
+        Returns:
+            list[tuple[dict, dict, list[set] | list[np.ndarray]]]:
+                The result of split() of each call, in order.
+        """
+        if data is None:
+            raise ConfigError("Data must be provided for splitting")
+        if metadata is None:
+            raise ConfigError("Metadata must be provided for splitting")
+
+        data.reset_index(drop=True, inplace=True)  # avoid unexpected index
+
+        index_results = self._bootstrapping(
+            n_rows=len(data),
+            exist_train_indices=exist_train_indices,
+            num_batches=num_batches,
+        )
+
+        return [
+            self._assemble_split(data, metadata, index_result)
+            for index_result in index_results
+        ]
+
+    def _assemble_split(
+        self, data: pd.DataFrame, metadata: Schema, index_result: dict
+    ) -> tuple[dict, dict, list[set] | list[np.ndarray]]:
+        """
+        Build the split data, metadata and train indices of split() from index samples.
+
+        Args:
+            data (pd.DataFrame): The dataset with a RangeIndex.
+            metadata (Schema): The metadata of the dataset.
+            index_result (dict): The index samples by _bootstrapping().
+
+        Returns:
+            tuple[dict, dict, list[set] | list[np.ndarray]]: See split().
+        """
         split_data = {}
         metadata_dict = {}
         train_indices_list = []
 
-        for key, index in index_result.items():
-            split_data[key] = {
-                "train": data.iloc[index["train"]].reset_index(drop=True),
-                "validation": data.iloc[index["validation"]].reset_index(drop=True),
-            }
+        # Lazy splits keep row positions, int32 halves them for tables below 2**31 rows
+        position_dtype = np.int32 if len(data) < 2**31 else np.int64
 
-            # Create metadata for both train and validation
-            train_metadata = self._update_metadata_with_split_info(
-                metadata,
-                len(index["train"]),
-                len(index["validation"]),
-            )
-            validation_metadata = self._update_metadata_with_split_info(
+        for key, index in index_result.items():
+            if self.config["lazy"]:
+                index = {
+                    name: positions.astype(position_dtype, copy=False)
+                    for name, positions in index.items()
+                }
+                split_data[key] = {
+                    "train": SplitView(data, index["train"]),
+                    "validation": SplitView(data, index["validation"]),
+                }
+            else:
+                split_data[key] = {
+                    "train": data.iloc[index["train"]].reset_index(drop=True),
+                    "validation": data.iloc[index["validation"]].reset_index(drop=True),
+                }
+
+            # Train and validation share the metadata with split information
+            split_metadata = self._update_metadata_with_split_info(
                 metadata,
                 len(index["train"]),
                 len(index["validation"]),
             )
 
             metadata_dict[key] = {
-                "train": train_metadata,
-                "validation": validation_metadata,
+                "train": split_metadata,
+                "validation": split_metadata,
             }
 
-            train_indices_list.append(set(index["train"]))
+            if self.config["lazy"]:
+                train_indices_list.append(index["train"])
+            else:
+                train_indices_list.append(set(index["train"].tolist()))
 
         return split_data, metadata_dict, train_indices_list
 
@@ -141,6 +265,7 @@ class Splitter:
     ) -> Schema:
         """
         Update metadata with split information using functional approach.
+            Only the description is overridden, the rest is shared with metadata.
 
         Args:
             metadata: Original metadata from training data
@@ -156,61 +281,106 @@ class Splitter:
             f"{metadata.description or ''} | Split info: train={train_rows} rows, validation={validation_rows} rows"
         ).strip()
 
-        # Since Schema is now mutable, we can create a copy and update it
-        from copy import deepcopy
-
-        updated_metadata = deepcopy(metadata)
-        updated_metadata.description = split_description
-
-        # Store split info in a custom field if needed for programmatic access
-        # We can add it as a comment in the description for now
+        # Shallow copy: attributes and stats are shared with the original Schema
+        updated_metadata = replace(metadata, description=split_description)
 
         return updated_metadata
 
     def _bootstrapping(
-        self, index: list, exist_train_indices: list[set] = None
-    ) -> dict[int, dict[str, list[int]]]:
+        self,
+        n_rows: int,
+        exist_train_indices: list[set] = None,
+        num_batches: int | None = None,
+    ) -> dict[int, dict[str, np.ndarray]] | list[dict[int, dict[str, np.ndarray]]]:
         """
         Generate random index samples for data splitting using bootstrap method.
 
+        Train membership of each sample is drawn as a boolean mask over the rows
+            by a NumPy Generator seeded from random_state,
+            and the validation rows are its inversion.
+
         Args:
-            index (list): Index list of dataset to be split
+            n_rows (int): Number of rows of the dataset to be split
             exist_train_indices (list[set]): List of existing training index sets to avoid overlap
-        """
-        if self.config["random_state"] is not None:
-            random.seed(self.config["random_state"])
+            num_batches (int, optional):
+                Generate the samples of this many sequential Splitters, see split_batch().
+                Default is None for the samples of this Splitter only.
 
-        sample_size = round(len(index) * self.config["train_split_ratio"])
+        Returns:
+            dict[int, dict[str, np.ndarray]]:
+                {1: {train: sorted int64 positions, validation: sorted int64 positions}, 2: ...},
+                or a list of them, one per batch, when num_batches is given.
+        """
+        seed: int | None = self._get_seed(self.config["random_state"])
+        if seed is None:
+            # Sequential batches without random_state would not share draws
+            seed = np.random.SeedSequence().entropy
+
+        sample_size = round(n_rows * self.config["train_split_ratio"])
+
+        # Initialize existing training bitsets, ignoring indices outside the data
+        existing_train_bits = []
+        for idx_set in exist_train_indices or []:
+            idx = np.fromiter(idx_set, dtype=np.int64, count=len(idx_set))
+            existing_mask = np.zeros(n_rows, dtype=bool)
+            existing_mask[idx[(idx >= 0) & (idx < n_rows)]] = True
+            existing_train_bits.append(np.packbits(existing_mask))
+
+        # Every batch replays the same seeded draws, which are made only once
+        tape = _DrawTape(seed, n_rows, sample_size)
+        index_results = [
+            self._sample_batch(tape.replay(), n_rows, sample_size, existing_train_bits)
+            for _ in range(num_batches or 1)
+        ]
+        return index_results if num_batches is not None else index_results[0]
+
+    def _sample_batch(
+        self,
+        draws: "_DrawReplay",
+        n_rows: int,
+        sample_size: int,
+        existing_train_bits: list[np.ndarray],
+    ) -> dict[int, dict[str, np.ndarray]]:
+        """
+        Sample num_samples training sets, appending their bitsets to existing_train_bits.
 
-        # Initialize existing training index set list
-        existing_train_sets = []
-        if exist_train_indices:
-            existing_train_sets = [
-                set(idx_set) if not isinstance(idx_set, set) else idx_set
-                for idx_set in exist_train_indices
-            ]
+        Args:
+            draws (_DrawReplay): The random train masks of this batch.
+            n_rows (int): Number of rows of the dataset to be split
+            sample_size (int): Number of training rows per sample.
+            existing_train_bits (list[np.ndarray]): Bitsets of existing training sets
 
+        Returns:
+            dict[int, dict[str, np.ndarray]]: See _bootstrapping().
+        """
         sampled_index = {}
 
         for n in range(self.config["num_samples"]):
-            attempts = 0
-            while attempts < self.config["max_attempts"]:
-                sampled_indices = set(random.sample(index, sample_size))
+            train_mask = None
+            for _ in range(self.config["max_attempts"]):
+                train_mask, train, train_bits = draws.draw()
 
                 # Check if overlap with existing training sets is acceptable
-                if self._check_overlap_acceptable(sampled_indices, existing_train_sets):
-                    # Add current sample to existing training set list for subsequent comparison
-                    existing_train_sets.append(sampled_indices)
-
-                    sampled_index[n + 1] = {
-                        "train": list(sampled_indices),
-                        "validation": list(set(index) - sampled_indices),
-                    }
+                if self._check_overlap_acceptable(train_bits, existing_train_bits):
+                    break
+
+                # Build a sample within the overlap limit instead of redrawing
+                if self.config["max_overlap_ratio"] < 1.0:
+                    train_mask = self._construct_mask(
+                        draws.take_rng(),
+                        n_rows,
+                        sample_size,
+                        existing_train_bits,
+                        n_pending=self.config["num_samples"] - n,
+                    )
+                    if train_mask is not None:
+                        train = np.flatnonzero(train_mask)
+                        train_bits = np.packbits(train_mask)
                     break
 
-                attempts += 1
+                train_mask = None
 
-            if attempts == self.config["max_attempts"]:
+            if train_mask is None:
                 raise ConfigError(
                     f"Splitter: "
                     f"Unable to sample {self.config['num_samples']} pairs of index "
@@ -220,34 +390,358 @@ class Splitter:
                     f"Consider reducing num_samples, increasing max_overlap_ratio, "
                     f"or increasing max_attempts."
                 )
+
+            # Add current sample to existing training bitsets for subsequent comparison
+            existing_train_bits.append(train_bits)
+
+            sampled_index[n + 1] = {
+                "train": train,
+                "validation": np.flatnonzero(~train_mask),
+            }
         return sampled_index
 
+    @staticmethod
+    def _get_seed(random_state: int | float | str | None) -> int | None:
+        """
+        Convert random_state into a seed of np.random.default_rng.
+
+        Args:
+            random_state (int | float | str, optional): Seed given to Splitter.
+
+        Returns:
+            (int | None): Non-negative integers are used as they are,
+                other values are hashed, so that each gives its own stream.
+        """
+        if random_state is None:
+            return None
+        if isinstance(random_state, (int, np.integer)) and random_state >= 0:
+            return int(random_state)
+        digest = hashlib.sha256(repr(random_state).encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "little")
+
+    @staticmethod
+    def _sample_mask(
+        rng: np.random.Generator, n_rows: int, sample_size: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Draw a uniform random subset of sample_size rows as a boolean mask.
+
+        Every row is first kept with probability about sample_size / n_rows,
+            then randomly chosen kept (or dropped) rows are flipped
+            until exactly sample_size rows are kept.
+            Any subset of that size is equally likely,
+            and only the few flipped rows need a draw without replacement.
+
+        Args:
+            rng (np.random.Generator): The random generator.
+            n_rows (int): Number of rows.
+            sample_size (int): Number of rows to keep.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+                - The boolean mask of kept rows.
+                - The sorted int64 positions of kept rows.
+        """
+        # 16-bit draws are enough, the exact size is fixed below
+        threshold: int = min(round(sample_size / max(n_rows, 1) * 65536), 65535)
+        mask = rng.integers(0, 65536, size=n_rows, dtype=np.uint16) < threshold
+
+        surplus = int(np.count_nonzero(mask)) - sample_size
+        if surplus != 0:
+            flip = Splitter._sample_rows_where(rng, mask, surplus > 0, abs(surplus))
+            mask[flip] = ~mask[flip]
+
+        return mask, np.flatnonzero(mask)
+
+    @staticmethod
+    def _sample_rows_where(
+        rng: np.random.Generator, mask: np.ndarray, value: bool, size: int
+    ) -> np.ndarray:
+        """
+        Draw size distinct rows whose mask equals value, uniformly at random.
+
+        Args:
+            rng (np.random.Generator): The random generator.
+            mask (np.ndarray): The boolean mask of rows.
+            value (bool): The mask value of rows to draw from.
+            size (int): Number of rows to draw, at most the rows with that value.
+
+        Returns:
+            (np.ndarray): The int64 positions of drawn rows.
+        """
+        n_rows: int = len(mask)
+        n_candidates: int = (
+            int(np.count_nonzero(mask))
+            if value
+            else n_rows - int(np.count_nonzero(mask))
+        )
+        if n_candidates < 8 * size or n_candidates < n_rows // 8:
+            candidates = np.flatnonzero(mask == value)
+            return candidates[rng.choice(len(candidates), size=size, replace=False)]
+
+        # Rejection on uniform positions, keeping the first draw of each row
+        drawn = np.empty(0, dtype=np.int64)
+        while True:
+            positions = rng.integers(0, n_rows, size=2 * size * n_rows // n_candidates)
+            drawn = np.concatenate([drawn, positions[mask[positions] == value]])
+            _, first = np.unique(drawn, return_index=True)
+            if len(first) >= size:
+                return drawn[np.sort(first)[:size]]
+
+    def _construct_mask(
+        self,
+        rng: np.random.Generator,
+        n_rows: int,
+        sample_size: int,
+        existing_train_bits: list[np.ndarray],
+        n_pending: int = 1,
+    ) -> np.ndarray | None:
+        """
+        Build a training sample meeting max_overlap_ratio against every existing one.
+
+        Rows are pooled by how many existing samples already hold them.
+            Rows of no existing sample are shared out evenly
+            among this and the pending samples, then the pools are used
+            from the least reused one up, and the rest of the unused rows last.
+            Rows of a pool are taken in random order,
+            skipping rows of existing samples whose overlap quota is used up.
+
+        Args:
+            rng (np.random.Generator): The random generator.
+            n_rows (int): Number of rows.
+            sample_size (int): Number of rows to sample.
+            existing_train_bits (list[np.ndarray]): Bitsets of existing training sets
+            n_pending (int, optional):
+                Number of samples still to draw, including this one. Default is 1.
+
+        Returns:
+            (np.ndarray | None): The boolean mask of the sample,
+                or None if the pools cannot fill it within the overlap limit.
+        """
+        if sample_size == 0:
+            return None
+
+        # Largest overlap count accepted by _check_overlap_acceptable
+        quota = int(np.floor(self.config["max_overlap_ratio"] * sample_size))
+        if (quota + 1) / sample_size <= self.config["max_overlap_ratio"]:
+            quota += 1
+        quotas = np.full(len(existing_train_bits), quota, dtype=np.int64)
+
+        reuse = np.zeros(n_rows, dtype=np.uint16)
+        for bits in existing_train_bits:
+            reuse += np.unpackbits(bits, count=n_rows).view(bool)
+
+        mask = np.zeros(n_rows, dtype=bool)
+        remaining = sample_size
+
+        # 1. A fair share of the unused rows, keeping the others for pending samples
+        unused = rng.permutation(np.flatnonzero(reuse == 0))
+        n_share = min(remaining, -(-len(unused) // max(n_pending, 1)))
+        mask[unused[:n_share]] = True
+        remaining -= n_share
+
+        # 2. Reused rows within the overlap quotas, the least reused first
+        for level in np.unique(reuse[reuse > 0]):
+            if remaining == 0:
+                break
+            rows = rng.permutation(np.flatnonzero(reuse == level))
+            for start in range(0, len(rows), self.CONSTRUCT_BLOCK_SIZE):
+                candidates = rows[start : start + self.CONSTRUCT_BLOCK_SIZE]
+                while remaining > 0 and len(candidates) > 0:
+                    members = np.stack(
+                        [_get_bits(bits, candidates) for bits in existing_train_bits]
+                    )
+                    # Drop rows of existing samples without quota left
+                    available = ~members[quotas == 0].any(axis=0)
+                    candidates = candidates[available]
+                    members = members[:, available]
+                    if len(candidates) == 0:
+                        break
+
+                    # Take the longest prefix keeping every overlap within its quota
+                    overlaps = np.cumsum(members, axis=1)
+                    n_taken = min(
+                        remaining,
+                        min(
+                            int(np.searchsorted(overlap, left, side="right"))
+                            for overlap, left in zip(overlaps, quotas, strict=True)
+                        ),
+                    )
+                    mask[candidates[:n_taken]] = True
+                    quotas -= overlaps[:, n_taken - 1]
+                    remaining -= n_taken
+                    candidates = candidates[n_taken:]
+                if remaining == 0:
+                    break
+
+        # 3. The rest of the unused rows
+        n_rest = min(remaining, len(unused) - n_share)
+        mask[unused[n_share : n_share + n_rest]] = True
+        remaining -= n_rest
+
+        return mask if remaining == 0 else None
+
     def _check_overlap_acceptable(
-        self, new_train_sample: set, existing_train_sets: list[set]
+        self, new_train_bits: np.ndarray, existing_train_bits: list[np.ndarray]
     ) -> bool:
         """
         Check if overlap between new training sample and existing training sets is acceptable.
 
         Args:
-            new_train_sample (set): New training sample index set
-            existing_train_sets (list[set]): List of existing training index sets
+            new_train_bits (np.ndarray): Bitset of the new training sample, by np.packbits
+            existing_train_bits (list[np.ndarray]): Bitsets of existing training sets
 
         Returns:
             bool: Returns True if overlap is acceptable, False otherwise
         """
         max_overlap_ratio = self.config["max_overlap_ratio"]
+        sample_size = _popcount(new_train_bits)
+
+        for existing_train_set in existing_train_bits:
+            overlap_size = _popcount(new_train_bits & existing_train_set)
 
-        for existing_train_set in existing_train_sets:
             # 1. Check if completely identical
-            if new_train_sample == existing_train_set:
+            if overlap_size == sample_size == _popcount(existing_train_set):
                 return False
 
             # 2. Check if overlap ratio exceeds limit
-            if max_overlap_ratio < 1.0:  # Only check when not 100%
-                overlap_size = len(new_train_sample.intersection(existing_train_set))
-                overlap_ratio = overlap_size / len(new_train_sample)
+            if max_overlap_ratio < 1.0 and sample_size > 0:  # Only check when not 100%
+                overlap_ratio = overlap_size / sample_size
 
                 if overlap_ratio > max_overlap_ratio:
                     return False
 
         return True
+
+
+class _DrawTape:
+    """
+    Random train masks drawn one after another from a seeded Generator.
+        Each replay() starts over from the seed,
+        reusing the masks already drawn by earlier replays.
+    """
+
+    def __init__(self, seed: int, n_rows: int, sample_size: int):
+        """
+        Args:
+            seed (int): Seed of np.random.default_rng.
+            n_rows (int): Number of rows.
+            sample_size (int): Number of rows kept by every mask.
+
+        Attr:
+            seed (int): Seed of np.random.default_rng.
+            n_rows (int): Number of rows.
+            sample_size (int): Number of rows kept by every mask.
+            bits (list[np.ndarray]): Bitsets of the masks drawn so far.
+            states (list[dict]): Generator state right after each mask.
+        """
+        self.seed: int = seed
+        self.n_rows: int = n_rows
+        self.sample_size: int = sample_size
+        self.bits: list[np.ndarray] = []
+        self.states: list[dict] = []
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+
+    def replay(self) -> "_DrawReplay":
+        """
+        Returns:
+            (_DrawReplay): The draws from the seed again.
+        """
+        return _DrawReplay(self)
+
+    def extend(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Draw the next mask onto the tape.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The mask, its positions and bitset.
+        """
+        mask, train = Splitter._sample_mask(self._rng, self.n_rows, self.sample_size)
+        bits = np.packbits(mask)
+        self.bits.append(bits)
+        self.states.append(self._rng.bit_generator.state)
+        return mask, train, bits
+
+
+class _DrawReplay:
+    """
+    One pass over the draws of a _DrawTape, as a Generator seeded alike would make them.
+        Once the Generator is taken for other draws, the pass leaves the tape
+        and draws on its own.
+    """
+
+    def __init__(self, tape: _DrawTape):
+        """
+        Args:
+            tape (_DrawTape): The shared draws.
+        """
+        self._tape: _DrawTape = tape
+        self._position: int = 0
+        self._rng: np.random.Generator = np.random.default_rng(tape.seed)
+        self._on_tape: bool = True
+
+    def draw(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]:
+                The next random mask, its sorted int64 positions and bitset.
+        """
+        tape = self._tape
+        if not self._on_tape:
+            mask, train = Splitter._sample_mask(
+                self._rng, tape.n_rows, tape.sample_size
+            )
+            return mask, train, np.packbits(mask)
+
+        if self._position == len(tape.bits):
+            mask, train, bits = tape.extend()
+        else:
+            bits = tape.bits[self._position]
+            mask = np.unpackbits(bits, count=tape.n_rows).view(bool)
+            train = np.flatnonzero(mask)
+        # Keep the Generator where it would be after drawing this mask itself
+        self._rng.bit_generator.state = tape.states[self._position]
+        self._position += 1
+        return mask, train, bits
+
+    def take_rng(self) -> np.random.Generator:
+        """
+        Returns:
+            (np.random.Generator): The Generator right after the last draw,
+                for draws of the caller. Later masks are drawn from it too.
+        """
+        self._on_tape = False
+        return self._rng
+
+
+# Number of set bits of every byte value
+_POPCOUNT_TABLE: np.ndarray = np.array(
+    [bin(value).count("1") for value in range(256)], dtype=np.uint8
+)
+
+
+def _popcount(bits: np.ndarray) -> int:
+    """
+    Count the set bits of a bitset.
+
+    Args:
+        bits (np.ndarray): The uint8 bitset, by np.packbits.
+
+    Returns:
+        (int): Number of set bits.
+    """
+    return int(_POPCOUNT_TABLE[bits].sum(dtype=np.int64))
+
+
+def _get_bits(bits: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """
+    Read the bits of some positions from a bitset.
+
+    Args:
+        bits (np.ndarray): The uint8 bitset, by np.packbits.
+        positions (np.ndarray): The int64 positions to read.
+
+    Returns:
+        (np.ndarray): The boolean bits at the positions.
+    """
+    return ((bits[positions >> 3] >> (7 - (positions & 7))) & 1).astype(bool)
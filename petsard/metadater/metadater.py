@@ -17,12 +17,16 @@ class AttributeMetadater:
     All methods are implemented here, Attribute is just configuration
     """
 
+    # Text columns with fewer unique values than this ratio of rows are categorical
+    CATEGORY_UNIQUE_RATIO: float = 0.05
+
     @classmethod
     def from_data(
         cls,
         data: pd.Series,
         enable_stats: bool = True,
         base_attribute: Attribute = None,
+        precision_sample_size: int | None = None,
         **kwargs,
     ) -> Attribute:
         """Create Attribute configuration from Series
@@ -31,6 +35,8 @@ class AttributeMetadater:
             data: Data Series
             enable_stats: Whether to calculate statistics
             base_attribute: Base Attribute (if any), precision not inferred if defined
+            precision_sample_size: Infer float precision from a random sample
+                of this many values, None for all values
             **kwargs: Other parameters
         """
         # With base_attribute: fully inherit attributes, do not re-infer from data
@@ -78,7 +84,8 @@ class AttributeMetadater:
 
             # Infer if it's categorical data
             is_category = dtype_str == "category" or (
-                data.dtype == "object" and len(data.unique()) / len(data) < 0.05
+                data.dtype == "object"
+                and len(data.unique()) / len(data) < cls.CATEGORY_UNIQUE_RATIO
                 if len(data) > 0
                 else False
             )
@@ -89,7 +96,7 @@ class AttributeMetadater:
 
             # Calculate precision for numeric fields (only on first inference and for float)
             if data_type == "float":
-                precision = cls._infer_precision(data)
+                precision = cls._infer_precision(data, precision_sample_size)
                 if precision is not None:
                     type_attr["precision"] = precision
 
@@ -108,25 +115,35 @@ class AttributeMetadater:
             type=data_type,
             type_attr=type_attr if type_attr else None,
             logical_type=logical_type,
+            enable_optimize_type=(
+                base_attribute.enable_optimize_type if base_attribute else True
+            ),
             enable_stats=enable_stats,
             stats=stats,
             is_constant=is_constant,
         )
 
     @classmethod
-    def _infer_precision(cls, data: pd.Series) -> int | None:
+    def _infer_precision(
+        cls, data: pd.Series, sample_size: int | None = None
+    ) -> int | None:
         """Infer precision (decimal places) for numeric fields
 
         This method analyzes all values in the field and finds the maximum decimal places as precision.
+        The decimal places of a value are those of str(value) as the Series yields it,
+        without trailing zeros: float32 values are widened to float64 first,
+        nullable Float32 values keep their float32 repr.
+        They are found for all values at once: a value has at most k decimal places
+        if some decimal of k places rounds to it, and values beyond where that test
+        is exact are formatted by numpy in bulk.
 
         Args:
             data: Numeric Series
+            sample_size: Infer from a random sample of this many values, None for all
 
         Returns:
             Precision (decimal places), None if cannot infer
         """
-        from decimal import Decimal
-
         import numpy as np
 
         # Only handle float types
@@ -138,34 +155,106 @@ class AttributeMetadater:
         if len(non_na_data) == 0:
             return None
 
-        # Calculate decimal places for each value
-        precisions = []
-        for value in non_na_data:
-            if not np.isfinite(value):  # Skip inf and -inf
-                continue
+        if sample_size is not None and len(non_na_data) > sample_size:
+            non_na_data = non_na_data.sample(n=sample_size, random_state=0)
 
-            # Use Decimal for precise decimal place detection
-            # This correctly handles float precision, avoiding string formatting limitations
-            try:
-                # Convert float to Decimal to preserve full precision
-                decimal_value = Decimal(str(value))
-                # Normalize to remove trailing zeros
-                normalized = decimal_value.normalize()
-                # Calculate decimal places
-                sign, digits, exponent = normalized.as_tuple()
-                if exponent < 0:
-                    precisions.append(abs(exponent))
+        # Nullable Float32 yields np.float32 values, which keep their own shortest repr
+        is_float32: bool = isinstance(data.dtype, pd.Float32Dtype)
+        values = non_na_data.to_numpy(dtype=np.float32 if is_float32 else np.float64)
+        values = values[np.isfinite(values)]  # Skip inf and -inf
+        if len(values) == 0:
+            return None
+
+        wide = values.astype(np.float64)
+        if is_float32:
+            # Rounding interval of each float32 value, its midpoints to the neighbours.
+            # They and their multiples by 10**k up to 10**12 are exact in float64
+            lower = (wide + np.nextafter(values, -np.inf).astype(np.float64)) / 2
+            upper = (wide + np.nextafter(values, np.inf).astype(np.float64)) / 2
+            is_even = values.view(np.uint32) % 2 == 0  # Ties round to even
+            max_decimals = 12
+        else:
+            max_decimals = 22  # 10**22 is the largest exact power of 10
+
+        # 1. Values with k decimal places are matched first at k decimals.
+        #    float64 values must round to themselves at k decimals,
+        #    rounding value * 10**k is exact below 2**50.
+        #    float32 values must have an integer within their scaled rounding interval.
+        #    Values beyond are formatted instead
+        precision = 0
+        unresolved = []
+        remaining = np.arange(len(values))
+        with np.errstate(over="ignore", invalid="ignore"):
+            for k in range(max_decimals + 1):
+                scale = 10.0**k
+                current = wide[remaining]
+                scaled = current * scale
+                exact = np.abs(scaled) < 2.0**50
+                if is_float32:
+                    low = lower[remaining] * scale
+                    high = upper[remaining] * scale
+                    even = is_even[remaining]
+                    # Smallest integer in the interval, bounds included for even values
+                    candidate = np.ceil(low)
+                    candidate[(candidate == low) & ~even] += 1
+                    matched = exact & (
+                        (candidate < high) | (even & (candidate == high))
+                    )
                 else:
-                    precisions.append(0)
-            except (ValueError, OverflowError):
-                # If conversion fails, skip this value
-                continue
+                    matched = exact & (np.rint(scaled) / scale == current)
+                if matched.any():
+                    precision = k
+                unresolved.append(remaining[~exact])
+                remaining = remaining[exact & ~matched]
+                if len(remaining) == 0:
+                    break
+        unresolved.append(remaining)
+
+        # 2. Decimal places of the shortest repr of the rest
+        unresolved_values = values[np.concatenate(unresolved)]
+        if len(unresolved_values) > 0:
+            precision = max(precision, cls._get_repr_precision(unresolved_values))
+
+        return precision
 
-        if not precisions:
-            return None
+    @staticmethod
+    def _get_repr_precision(values) -> int:
+        """Find the maximum decimal places of the shortest repr of finite float values
+
+        Args:
+            values: Finite float64 or float32 numpy array, not empty
+
+        Returns:
+            Maximum decimal places
+        """
+        import numpy as np
 
-        # Return maximum precision in this field
-        return max(precisions)
+        # numpy formats floats as the same shortest round-trip repr as str()
+        text = values.astype("U32")
+        codes = text.view(np.uint32).reshape(len(text), -1)
+        lengths = (codes != 0).sum(axis=1)
+
+        is_exponent = codes == ord("e")
+        has_exponent = is_exponent.any(axis=1)
+        exponent_pos = np.where(has_exponent, is_exponent.argmax(axis=1), lengths)
+
+        is_dot = codes == ord(".")
+        has_dot = is_dot.any(axis=1)
+        dot_pos = is_dot.argmax(axis=1)
+
+        # Digits after the dot in the mantissa, "1.0" has none
+        fraction_digits = np.where(has_dot, exponent_pos - dot_pos - 1, 0)
+        first_fraction = codes[
+            np.arange(len(codes)), np.minimum(dot_pos + 1, codes.shape[1] - 1)
+        ]
+        fraction_digits[(fraction_digits == 1) & (first_fraction == ord("0"))] = 0
+
+        exponents = np.zeros(len(values), dtype=np.int64)
+        exponents[has_exponent] = [
+            int(value.split("e")[1]) for value in text[has_exponent]
+        ]
+
+        return int(np.maximum(fraction_digits - exponents, 0).max())
 
     @classmethod
     def _infer_logical_type(cls, data: pd.Series) -> str | None:
@@ -214,6 +303,69 @@ class AttributeMetadater:
         """
         return cls.from_dict(config)
 
+    @classmethod
+    def merge(cls, attribute: Attribute, other: Attribute) -> Attribute:
+        """Merge Attributes inferred from different chunks of the same column
+
+        Decisions are widened so the result holds for both chunks:
+        int and float become float, other type conflicts become str,
+        nullable if either is, category only if both are,
+        and the larger precision is kept.
+
+        Args:
+            attribute: Attribute inferred from the earlier chunks
+            other: Attribute inferred from the new chunk
+
+        Returns:
+            Merged Attribute
+        """
+        if attribute.type == other.type:
+            data_type = attribute.type
+        elif {attribute.type, other.type} == {"int", "float"}:
+            data_type = "float"
+        elif attribute.type is None or other.type is None:
+            data_type = attribute.type or other.type
+        else:
+            data_type = "str"
+
+        type_attr = dict(attribute.type_attr or {})
+        other_type_attr = other.type_attr or {}
+        type_attr["category"] = bool(
+            type_attr.get("category", False) and other_type_attr.get("category", False)
+        )
+        type_attr["nullable"] = bool(
+            type_attr.get("nullable", True) or other_type_attr.get("nullable", True)
+        )
+        precisions = [
+            precision
+            for precision in (
+                type_attr.get("precision"),
+                other_type_attr.get("precision"),
+            )
+            if precision is not None
+        ]
+        if precisions and data_type == "float":
+            type_attr["precision"] = max(precisions)
+        else:
+            type_attr.pop("precision", None)
+
+        return Attribute(
+            **{
+                **attribute.__dict__,
+                "type": data_type,
+                "type_attr": type_attr,
+                "logical_type": (
+                    attribute.logical_type
+                    if attribute.logical_type == other.logical_type
+                    else None
+                ),
+                # Only the caller knows whether both chunks hold the same value
+                "is_constant": attribute.is_constant and other.is_constant,
+                "stats": None,
+                "updated_at": datetime.now(),
+            }
+        )
+
     @classmethod
     def diff(cls, attribute: Attribute, data: pd.Series) -> dict[str, Any]:
         """Compare differences between Attribute and Series"""
@@ -580,6 +732,7 @@ class SchemaMetadater:
         data: pd.DataFrame,
         enable_stats: bool = False,
         base_schema: Schema = None,
+        precision_sample_size: int | None = None,
         **kwargs,
     ) -> Schema:
         """Create Schema configuration from DataFrame
@@ -588,6 +741,8 @@ class SchemaMetadater:
             data: Data DataFrame
             enable_stats: Whether to calculate statistics
             base_schema: Base Schema (if any), precision not inferred if field has definition
+            precision_sample_size: Infer float precision from a random sample
+                of this many values per field, None for all values
             **kwargs: Other parameters
         """
         attributes = {}
@@ -599,7 +754,10 @@ class SchemaMetadater:
                 base_attribute = base_schema.attributes[col]
 
             attributes[col] = AttributeMetadater.from_data(
-                data[col], enable_stats=enable_stats, base_attribute=base_attribute
+                data[col],
+                enable_stats=enable_stats,
+                base_attribute=base_attribute,
+                precision_sample_size=precision_sample_size,
             )
 
         # Calculate table statistics
@@ -956,6 +1114,37 @@ class SchemaMetadater:
             }
         )
 
+    @classmethod
+    def merge(cls, schema: Schema, other: Schema) -> Schema:
+        """Merge Schemas inferred from different chunks of the same table
+
+        Common attributes are merged by AttributeMetadater.merge(),
+        attributes only found in one chunk are kept as they are.
+
+        Args:
+            schema: Schema inferred from the earlier chunks
+            other: Schema inferred from the new chunk
+
+        Returns:
+            Merged Schema, with the identity of the first one
+        """
+        new_attributes = dict(schema.attributes)
+        for name, attribute in other.attributes.items():
+            new_attributes[name] = (
+                AttributeMetadater.merge(new_attributes[name], attribute)
+                if name in new_attributes
+                else attribute
+            )
+
+        return Schema(
+            **{
+                **schema.__dict__,
+                "attributes": new_attributes,
+                "stats": None,
+                "updated_at": datetime.now(),
+            }
+        )
+
     @classmethod
     def diff(cls, schema: Schema, data: pd.DataFrame) -> dict[str, Any]:
         """Compare differences between Schema and DataFrame"""
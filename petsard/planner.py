@@ -0,0 +1,578 @@
+import io
+import itertools
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pandas as pd
+
+# Modules which keep the shape of their input data
+_SHAPE_PRESERVING_MODULES: tuple[str, ...] = (
+    "Preprocessor",
+    "Postprocessor",
+    "Constrainer",
+    "Evaluator",
+    "Describer",
+    "Reporter",
+)
+
+
+class TimingHistory:
+    """
+    Timing of the modules in previous Executor runs, persisted as a JSON file.
+
+    Each run keeps one entry per executed step:
+        module, experiment, method, wall/CPU time, memory and data shape,
+        so Executor.plan() can estimate the cost of a run before starting it.
+    """
+
+    def __init__(self, path: str, max_runs: int = 50):
+        """
+        Args:
+            path (str): Path of the JSON history file.
+            max_runs (int): Number of most recent runs to keep. Default is 50.
+
+        Attr.:
+            _logger (logging.Logger): The logger object.
+            path (str): Path of the JSON history file.
+            max_runs (int): Number of most recent runs to keep.
+            runs (list[dict]): Recorded runs, oldest first.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.path: str = path
+        self.max_runs: int = max_runs
+        self.runs: list[dict] = []
+
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.runs = json.load(f).get("runs", [])
+            except (OSError, ValueError) as e:
+                self._logger.warning(f"Ignoring unreadable timing history: {e}")
+
+    def record(self, config_digest: str, yaml_config: dict, timing: pd.DataFrame):
+        """
+        Append the module runs of a finished Executor run and save the history.
+
+        Args:
+            config_digest (str): Digest of the workflow config.
+            yaml_config (dict): The workflow config (Config.yaml),
+                to look up the method of each experiment.
+            timing (pd.DataFrame): Status.get_timing_report_data() of the run.
+        """
+        if timing.empty:
+            return
+
+        runs: pd.DataFrame = timing[timing["step_name"] == "run"]
+        stages: list[dict] = []
+        for row in runs.to_dict("records"):
+            module: str = row["module_name"].removesuffix("Adapter")
+            expt: str = row["experiment_name"]
+            stages.append(
+                {
+                    "module": module,
+                    "expt": expt,
+                    "method": _get_method(yaml_config.get(module, {}).get(expt)),
+                    **{
+                        key: _to_json_number(row.get(key))
+                        for key in [
+                            "duration_seconds",
+                            "cpu_seconds",
+                            "memory_peak_mb",
+                            "input_rows",
+                            "input_cols",
+                            "output_rows",
+                            "output_cols",
+                        ]
+                    },
+                }
+            )
+
+        self.runs.append(
+            {
+                "config_digest": config_digest,
+                "timestamp": datetime.now().isoformat(),
+                "stages": stages,
+            }
+        )
+        del self.runs[: -self.max_runs]
+        self._save()
+
+    def get_stages(self, config_digest: str | None = None) -> pd.DataFrame:
+        """
+        Args:
+            config_digest (str, optional): Only return runs of this workflow config.
+
+        Returns:
+            (pd.DataFrame): One row per recorded step, with a config_digest column.
+        """
+        rows: list[dict] = [
+            {"config_digest": run["config_digest"], **stage}
+            for run in self.runs
+            if config_digest is None or run["config_digest"] == config_digest
+            for stage in run["stages"]
+        ]
+        return pd.DataFrame(rows)
+
+    def _save(self) -> None:
+        directory: str = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so an interrupted run never truncates the history
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"runs": self.runs}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    Dry-run expansion of a workflow, see Executor.plan().
+
+    Attr.:
+        n_branches (int): Number of experiment branches (full experiment names).
+        stages (pd.DataFrame): One row per module/experiment pair in sequence order:
+            - module, experiment: The stage.
+            - executions: How many times the stage runs (once per upstream branch).
+            - input_rows, input_cols, output_rows, output_cols: Estimated data shape.
+            - est_seconds: Estimated wall time of one execution.
+            - est_total_seconds: est_seconds × executions.
+            - est_memory_mb: Estimated peak memory of one execution.
+            - estimate_source: Where the estimate comes from
+                - history: previous runs of the same config
+                - scaled: previous runs of the same module and method,
+                    scaled by the number of input cells
+                - shape: data shape only, time is unknown
+                - none: nothing to estimate from
+        est_total_seconds (float): Estimated wall time of a serial run,
+            summed over the stages with a time estimate.
+        est_parallel_seconds (float): Estimated wall time with the configured max_workers.
+        est_peak_memory_mb (float | None): Largest est_memory_mb of all stages.
+        max_workers (int): max_workers used for est_parallel_seconds.
+        unestimated_stages (list[str]): "module[experiment]" of the stages
+            without a time estimate, left out of the totals.
+    """
+
+    n_branches: int
+    stages: pd.DataFrame
+    est_total_seconds: float
+    est_parallel_seconds: float
+    est_peak_memory_mb: float | None = None
+    max_workers: int = 1
+    unestimated_stages: list[str] = field(default_factory=list)
+
+
+class ExecutionPlanner:
+    """
+    Expand a Config flow into an ExecutionPlan without running it.
+    """
+
+    DEFAULT_BYTES_PER_CELL: int = 8
+    # Rows read from a Loader file to estimate its shape and memory per cell
+    PROBE_ROWS: int = 1000
+
+    def __init__(
+        self,
+        sequence: list[str],
+        flow: list[tuple[str, str, tuple]],
+        fanout_depth: int,
+        max_workers: int = 1,
+        history: TimingHistory | None = None,
+        config_digest: str = "",
+    ):
+        """
+        Args:
+            sequence (list[str]): The module sequence of the workflow.
+            flow (list[tuple]): (module, expt, adapter spec) in DFS order, see Config.get_flow().
+            fanout_depth (int): Sequence index of the first module run by parallel workers.
+            max_workers (int): Number of parallel workers. Default is 1.
+            history (TimingHistory, optional): Timing of previous runs.
+            config_digest (str): Digest of the workflow config.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.sequence: list[str] = sequence
+        self.flow: list[tuple[str, str, tuple]] = flow
+        self.fanout_depth: int = fanout_depth
+        self.max_workers: int = max_workers
+        self.history: pd.DataFrame = (
+            history.get_stages() if history is not None else pd.DataFrame()
+        )
+        self.config_digest: str = config_digest
+        self.bytes_per_cell: float = self.DEFAULT_BYTES_PER_CELL
+
+    def plan(self) -> ExecutionPlan:
+        """
+        Returns:
+            (ExecutionPlan): The expanded flow with its cost estimates.
+        """
+        shapes: list[tuple[int, int] | None] = []
+        steps: list[dict] = []
+        for module, expt, spec in self.flow:
+            depth: int = self.sequence.index(module)
+            del shapes[depth:]
+            input_shape = shapes[-1] if shapes else None
+            _, expt_config = spec
+
+            step: dict = self._estimate_step(module, expt, expt_config, input_shape)
+            shapes.append(
+                (step["output_rows"], step["output_cols"])
+                if step["output_rows"] is not None
+                else input_shape
+            )
+            steps.append({"depth": depth, **step})
+
+        stage_cols: list[str] = [
+            "module",
+            "experiment",
+            "executions",
+            "input_rows",
+            "input_cols",
+            "output_rows",
+            "output_cols",
+            "est_seconds",
+            "est_total_seconds",
+            "est_memory_mb",
+            "estimate_source",
+        ]
+        step_df = pd.DataFrame(steps)
+        if not step_df.empty:
+            numeric_cols: list[str] = [
+                "input_rows",
+                "input_cols",
+                "output_rows",
+                "output_cols",
+                "est_seconds",
+                "est_memory_mb",
+            ]
+            step_df[numeric_cols] = step_df[numeric_cols].apply(pd.to_numeric)
+        stages = (
+            step_df.groupby(["module", "experiment"], sort=False)
+            .agg(
+                executions=("est_seconds", "size"),
+                input_rows=("input_rows", "max"),
+                input_cols=("input_cols", "max"),
+                output_rows=("output_rows", "max"),
+                output_cols=("output_cols", "max"),
+                est_seconds=("est_seconds", "max"),
+                est_total_seconds=("est_seconds", lambda s: s.sum(min_count=1)),
+                est_memory_mb=("est_memory_mb", "max"),
+                estimate_source=("estimate_source", "first"),
+            )
+            .reset_index()
+            .sort_values(
+                "module", key=lambda col: col.map(self.sequence.index), kind="stable"
+            )
+            .reset_index(drop=True)[stage_cols]
+            if not step_df.empty
+            else pd.DataFrame(columns=stage_cols)
+        )
+
+        est_total_seconds: float = float(step_df["est_seconds"].fillna(0).sum())
+        return ExecutionPlan(
+            n_branches=sum(1 for step in steps if step["module"] == self.sequence[-1]),
+            stages=stages,
+            est_total_seconds=est_total_seconds,
+            est_parallel_seconds=self._estimate_parallel_seconds(steps),
+            est_peak_memory_mb=(
+                float(stages["est_memory_mb"].max())
+                if stages["est_memory_mb"].notna().any()
+                else None
+            ),
+            max_workers=self.max_workers,
+            unestimated_stages=[
+                f"{row.module}[{row.experiment}]"
+                for row in stages.itertuples()
+                if pd.isna(row.est_seconds)
+            ],
+        )
+
+    def _estimate_step(
+        self,
+        module: str,
+        expt: str,
+        expt_config: dict,
+        input_shape: tuple[int, int] | None,
+    ) -> dict:
+        """
+        Estimate the output shape, time and memory of one step.
+
+        Args:
+            module (str): The name of the module.
+            expt (str): The name of the experiment.
+            expt_config (dict): The experiment config.
+            input_shape (tuple[int, int], optional): Estimated (rows, cols) of the input.
+
+        Returns:
+            (dict): module, experiment, shapes, est_seconds, est_memory_mb, estimate_source.
+        """
+        output_shape: tuple[int, int] | None = self._estimate_output_shape(
+            module, expt_config, input_shape
+        )
+        step: dict = {
+            "module": module,
+            "experiment": expt,
+            "input_rows": input_shape[0] if input_shape else None,
+            "input_cols": input_shape[1] if input_shape else None,
+            "output_rows": output_shape[0] if output_shape else None,
+            "output_cols": output_shape[1] if output_shape else None,
+            "est_seconds": None,
+            "est_memory_mb": None,
+            "estimate_source": "none",
+        }
+
+        # 1. Previous runs of the same config
+        exact = self._get_history(module, expt=expt, config_digest=self.config_digest)
+        if not exact.empty:
+            step["est_seconds"] = float(exact["duration_seconds"].mean())
+            if exact["memory_peak_mb"].notna().any():
+                step["est_memory_mb"] = float(exact["memory_peak_mb"].max())
+            if module == "Loader" and exact["output_rows"].notna().any():
+                step["output_rows"] = int(exact["output_rows"].max())
+                step["output_cols"] = int(exact["output_cols"].max())
+            step["estimate_source"] = "history"
+        else:
+            # 2. Previous runs of the same module and method, scaled by data size
+            #   measured on the input, or on the output for modules without one
+            cells: int | None = self._get_cells(input_shape) or self._get_cells(
+                output_shape
+            )
+            similar = self._get_history(module, method=_get_method(expt_config))
+            if cells and not similar.empty:
+                similar_cells = (similar["input_rows"] * similar["input_cols"]).fillna(
+                    similar["output_rows"] * similar["output_cols"]
+                )
+                rates = (similar["duration_seconds"] / similar_cells)[
+                    similar_cells > 0
+                ].dropna()
+                if not rates.empty:
+                    step["est_seconds"] = float(rates.mean() * cells)
+                    step["estimate_source"] = "scaled"
+
+        # 3. Data size, when no memory was traced
+        if step["est_memory_mb"] is None:
+            cells_in: int = self._get_cells(input_shape) or 0
+            cells_out: int = self._get_cells(output_shape) or 0
+            if cells_in or cells_out:
+                step["est_memory_mb"] = (
+                    (cells_in + cells_out) * self.bytes_per_cell / (1024 * 1024)
+                )
+                if step["estimate_source"] == "none":
+                    step["estimate_source"] = "shape"
+
+        return step
+
+    def _estimate_output_shape(
+        self, module: str, expt_config: dict, input_shape: tuple[int, int] | None
+    ) -> tuple[int, int] | None:
+        """
+        Propagate the data shape through a step.
+
+        Args:
+            module (str): The name of the module.
+            expt_config (dict): The experiment config.
+            input_shape (tuple[int, int], optional): Estimated (rows, cols) of the input.
+
+        Returns:
+            (tuple[int, int] | None): Estimated (rows, cols) of the output.
+        """
+        if module == "Loader":
+            return self._probe_loader_shape(expt_config)
+        if input_shape is None:
+            return None
+        rows, cols = input_shape
+        if module == "Splitter":
+            # Downstream modules read the training split
+            return round(rows * expt_config.get("train_split_ratio", 0.8)), cols
+        if module == "Synthesizer":
+            sample_num_rows = expt_config.get("sample_num_rows")
+            return (sample_num_rows if sample_num_rows else rows), cols
+        if module in _SHAPE_PRESERVING_MODULES:
+            return input_shape
+        return None
+
+    def _probe_loader_shape(self, expt_config: dict) -> tuple[int, int] | None:
+        """
+        Estimate the shape of a local file without loading it.
+
+        CSV rows are estimated from the file size over the bytes per row
+            of its first rows, columnar files give their row count in their metadata.
+            The first rows also sample the memory per cell for the memory estimates.
+
+        Args:
+            expt_config (dict): The Loader experiment config.
+
+        Returns:
+            (tuple[int, int] | None): (rows, cols), None if the file cannot be probed.
+        """
+        filepath = expt_config.get("filepath")
+        if not isinstance(filepath, str) or not os.path.isfile(filepath):
+            return None
+        ext: str = os.path.splitext(filepath)[1].lower()
+        if ext == ".csv":
+            probe = self._probe_csv
+        elif ext in [".parquet", ".feather", ".arrow", ".ipc"]:
+            probe = self._probe_columnar
+        else:
+            return None
+
+        try:
+            rows, cols, sample = probe(filepath, expt_config)
+        except ImportError:
+            return None
+        except (OSError, ValueError, pd.errors.ParserError) as e:
+            self._logger.debug(f"Cannot probe {filepath}: {e}")
+            return None
+
+        if expt_config.get("nrows"):
+            rows = min(rows, int(expt_config["nrows"]))
+        if sample.size:
+            self.bytes_per_cell = sample.memory_usage(deep=True, index=False).sum() / (
+                sample.size
+            )
+        return rows, cols
+
+    def _probe_csv(
+        self, filepath: str, expt_config: dict
+    ) -> tuple[int, int, pd.DataFrame]:
+        """
+        Read the first PROBE_ROWS rows of a CSV file,
+            and scale their bytes per row to the file size.
+
+        Args:
+            filepath (str): The path of the file.
+            expt_config (dict): The Loader experiment config.
+
+        Returns:
+            (tuple[int, int, pd.DataFrame]): Estimated rows, columns and the sample.
+        """
+        has_header: bool = not expt_config.get("header_names")
+        with open(filepath, "rb") as f:
+            header: bytes = f.readline() if has_header else b""
+            body: bytes = b"".join(itertools.islice(f, self.PROBE_ROWS))
+            at_end: bool = not f.read(1)
+        sample: pd.DataFrame = pd.read_csv(
+            io.BytesIO(header + body), header=0 if has_header else None
+        )
+
+        rows: int = len(sample)
+        if not at_end and rows:
+            body_size: int = os.path.getsize(filepath) - len(header)
+            rows = round(body_size / (len(body) / rows))
+        return rows, sample.shape[1], sample
+
+    def _probe_columnar(
+        self, filepath: str, expt_config: dict
+    ) -> tuple[int, int, pd.DataFrame]:
+        """
+        Count the rows of a Parquet, Feather or Arrow IPC file from its metadata,
+            and read its first PROBE_ROWS rows.
+
+        Args:
+            filepath (str): The path of the file.
+            expt_config (dict): The Loader experiment config.
+
+        Returns:
+            (tuple[int, int, pd.DataFrame]): Rows, columns and the sample.
+        """
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        is_parquet: bool = filepath.lower().endswith(".parquet")
+        dataset = ds.dataset(filepath, format="parquet" if is_parquet else "ipc")
+        if is_parquet:
+            rows: int = pq.read_metadata(filepath).num_rows
+        else:
+            # Counted from the record batch headers of the footer
+            rows = dataset.count_rows()
+        sample: pd.DataFrame = dataset.head(self.PROBE_ROWS).to_pandas()
+        return rows, len(dataset.schema.names), sample
+
+    def _get_history(
+        self,
+        module: str,
+        expt: str | None = None,
+        config_digest: str | None = None,
+        method: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Returns:
+            (pd.DataFrame): Recorded steps of the module matching the given filters,
+                with a known duration.
+        """
+        if self.history.empty:
+            return self.history
+        mask = self.history["module"] == module
+        if expt is not None:
+            mask &= self.history["expt"] == expt
+        if config_digest is not None:
+            mask &= self.history["config_digest"] == config_digest
+        if method is not None:
+            mask &= self.history["method"] == method
+        matched: pd.DataFrame = self.history[mask]
+        return matched[matched["duration_seconds"].notna()]
+
+    @staticmethod
+    def _get_cells(shape: tuple[int, int] | None) -> int | None:
+        if shape is None or shape[0] is None or shape[1] is None:
+            return None
+        return int(shape[0]) * int(shape[1])
+
+    def _estimate_parallel_seconds(self, steps: list[dict]) -> float:
+        """
+        Estimate the wall time of the parallel mode.
+
+        Steps above the fanout depth run serially, the branches below it
+            are spread over the workers, bounded by the longest branch.
+
+        Args:
+            steps (list[dict]): Estimated steps in DFS order with their depth.
+
+        Returns:
+            (float): Estimated wall time in seconds.
+        """
+        serial: float = 0.0
+        branches: list[float] = []
+        for step in steps:
+            seconds: float = step["est_seconds"] or 0.0
+            if step["depth"] < self.fanout_depth:
+                serial += seconds
+            elif step["depth"] == self.fanout_depth or not branches:
+                branches.append(seconds)
+            else:
+                branches[-1] += seconds
+
+        if self.max_workers <= 1 or not branches:
+            return serial + sum(branches)
+        return serial + max(max(branches), sum(branches) / self.max_workers)
+
+
+def _get_method(expt_config: dict | None) -> str | None:
+    """
+    Returns:
+        (str | None): The method of an experiment config, 'default' if unset,
+            None if the config is unknown.
+    """
+    if not isinstance(expt_config, dict):
+        return None
+    return str(expt_config.get("method", "default")).lower()
+
+
+def _to_json_number(value) -> float | None:
+    """
+    Returns:
+        (float | None): The value as a plain float, None for missing values.
+    """
+    if value is None or pd.isna(value):
+        return None
+    return float(value)
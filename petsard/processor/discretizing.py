@@ -2,7 +2,6 @@ import warnings
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import KBinsDiscretizer
 
 from petsard.exceptions import UnfittedError
 
@@ -129,6 +128,8 @@ class DiscretizingKBins(DiscretizingHandler):
         Args:
             n_bins (int, default=5): The number of bins.
         """
+        from sklearn.preprocessing import KBinsDiscretizer
+
         super().__init__()
         self.model = KBinsDiscretizer(
             encode="ordinal", strategy="uniform", n_bins=n_bins, subsample=200000
@@ -2,7 +2,6 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder, OneHotEncoder
 
 from petsard.exceptions import UnfittedError
 from petsard.processor.schema_transform import SchemaTransformMixin, schema_transform
@@ -268,6 +267,8 @@ class EncoderLabel(SchemaTransformMixin, Encoder):
     )
 
     def __init__(self) -> None:
+        from sklearn.preprocessing import LabelEncoder
+
         super().__init__()
         self.model = LabelEncoder()
         self._na_marker = "__PETSARD_NA_MARKER__"
@@ -371,6 +372,8 @@ class EncoderOneHot(SchemaTransformMixin, Encoder):
     )
 
     def __init__(self) -> None:
+        from sklearn.preprocessing import OneHotEncoder
+
         super().__init__()
         self.model = OneHotEncoder(sparse_output=False, drop="first")
 
@@ -2,8 +2,6 @@ import logging
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import IsolationForest
-from sklearn.neighbors import LocalOutlierFactor
 
 from petsard.exceptions import UnfittedError
 from petsard.processor.encoder import EncoderOneHot
@@ -222,11 +220,15 @@ class MediatorOutlier(Mediator):
             if isinstance(obj, OutlierIsolationForest):
                 global_methods_found.append((_col, "IsolationForest"))
                 if not self._global_model_indicator:
+                    from sklearn.ensemble import IsolationForest
+
                     self.model = IsolationForest()
                     self._global_model_indicator = True
             elif isinstance(obj, OutlierLOF):
                 global_methods_found.append((_col, "LOF"))
                 if not self._global_model_indicator:
+                    from sklearn.neighbors import LocalOutlierFactor
+
                     self.model = LocalOutlierFactor()
                     self._global_model_indicator = True
             elif isinstance(obj, (OutlierIQR, OutlierZScore)):
@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
 
 from petsard.exceptions import UnfittedError
 
@@ -83,6 +82,8 @@ class OutlierZScore(OutlierHandler):
     IS_GLOBAL_TRANSFORMATION = False
 
     def __init__(self) -> None:
+        from sklearn.preprocessing import StandardScaler
+
         super().__init__()
         self.model = StandardScaler()
 
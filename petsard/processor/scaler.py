@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler, StandardScaler
 
 from petsard.exceptions import UnfittedError
 
@@ -111,6 +110,8 @@ class ScalerStandard(Scaler):
     """
 
     def __init__(self) -> None:
+        from sklearn.preprocessing import StandardScaler
+
         super().__init__()
         self.model = StandardScaler()
 
@@ -156,6 +157,8 @@ class ScalerZeroCenter(ScalerStandard):
     """
 
     def __init__(self) -> None:
+        from sklearn.preprocessing import StandardScaler
+
         super().__init__()
         self.model = StandardScaler(with_std=False)
 
@@ -166,8 +169,10 @@ class ScalerMinMax(ScalerStandard):
     """
 
     def __init__(self) -> None:
+        from sklearn.preprocessing import MinMaxScaler
+
         super().__init__()
-        self.model: MinMaxScaler = MinMaxScaler()
+        self.model = MinMaxScaler()
 
 
 class ScalerLog(Scaler):
@@ -23,6 +23,7 @@ class ReporterSaveTiming(BaseReporter):
                     Default is 'petsard'.
                 - module (str or list, optional): Module name(s) to filter timing data.
                 - time_unit (str, optional): Time unit for reporting ('seconds', 'minutes', 'hours', 'days').
+                    Applies to both wall time (duration) and CPU time (cpu).
                     Default is 'seconds'.
         """
         super().__init__(config)
@@ -48,7 +49,9 @@ class ReporterSaveTiming(BaseReporter):
 
         Args:
             data (dict): The data used for creating the timing report.
-                - timing_data (pd.DataFrame): The timing data DataFrame.
+                - timing_data (pd.DataFrame): The timing data DataFrame,
+                    see Status.get_timing_report_data() for its columns
+                    (wall/CPU time, memory, input/output rows and columns).
 
         Returns:
             pd.DataFrame | None: Processed timing data, returns None if no data
@@ -119,28 +122,17 @@ class ReporterSaveTiming(BaseReporter):
         # Handle time unit conversion
         time_unit = self.config["time_unit"]
         if time_unit != "seconds":
-            # Create new column with converted time
-            duration_col = f"duration_{time_unit}"
-            if time_unit == "minutes":
-                timing_data[duration_col] = timing_data["duration_seconds"] / 60
-            elif time_unit == "hours":
-                timing_data[duration_col] = timing_data["duration_seconds"] / 3600
-            elif time_unit == "days":
-                timing_data[duration_col] = timing_data["duration_seconds"] / 86400
-
-            # Remove the original duration_seconds column
-            timing_data = timing_data.drop(columns=["duration_seconds"])
-
-            # Reorder columns to put the new duration column in the right place
-            cols = list(timing_data.columns)
-            if duration_col in cols:
-                cols.remove(duration_col)
-                # Insert after 'end_time' if it exists
-                if "end_time" in cols:
-                    insert_idx = cols.index("end_time") + 1
-                    cols.insert(insert_idx, duration_col)
-                else:
-                    cols.append(duration_col)
+            divisor = {"minutes": 60, "hours": 3600, "days": 86400}[time_unit]
+            for metric in ["duration", "cpu"]:
+                seconds_col = f"{metric}_seconds"
+                if seconds_col not in timing_data.columns:
+                    continue
+
+                # Replace the seconds column with the converted one, in place
+                cols = list(timing_data.columns)
+                unit_col = f"{metric}_{time_unit}"
+                cols[cols.index(seconds_col)] = unit_col
+                timing_data[unit_col] = timing_data[seconds_col] / divisor
                 timing_data = timing_data[cols]
 
         return timing_data
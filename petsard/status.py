@@ -1,10 +1,15 @@
 import logging
-import re
+import os
+import pickle
+import tempfile
 from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from petsard.adapter import BaseAdapter
@@ -12,9 +17,9 @@ from petsard.exceptions import (
     ConfigError,
     SnapshotError,
     StatusError,
-    TimingError,
     UnexecutedError,
 )
+from petsard.instrumentation import Span, recording
 from petsard.metadater.metadata import Metadata, Schema
 from petsard.metadater.metadater import SchemaMetadater
 from petsard.metadater.schema_inferencer import SchemaInferencer
@@ -51,6 +56,16 @@ class TimingRecord:
     end_time: datetime | None = None
     duration_seconds: float | None = None
     context: dict[str, Any] = field(default_factory=dict)
+    # Resource metrics, recorded by spans (see petsard.instrumentation)
+    cpu_seconds: float | None = None
+    peak_rss_mb: float | None = None
+    memory_delta_mb: float | None = None
+    memory_peak_mb: float | None = None
+    input_rows: int | None = None
+    input_cols: int | None = None
+    output_rows: int | None = None
+    output_cols: int | None = None
+    parent_step: str | None = None
 
     def complete(self, end_time: datetime | None = None) -> "TimingRecord":
         """Complete timing record"""
@@ -59,16 +74,7 @@ class TimingRecord:
 
         duration = round((end_time - self.start_time).total_seconds(), 2)
 
-        return TimingRecord(
-            record_id=self.record_id,
-            module_name=self.module_name,
-            experiment_name=self.experiment_name,
-            step_name=self.step_name,
-            start_time=self.start_time,
-            end_time=end_time,
-            duration_seconds=duration,
-            context=self.context,
-        )
+        return replace(self, end_time=end_time, duration_seconds=duration)
 
     @property
     def formatted_duration(self) -> str:
@@ -76,49 +82,118 @@ class TimingRecord:
         return f"{self.duration_seconds:.2f}s" if self.duration_seconds else "N/A"
 
 
-class TimingLogHandler(logging.Handler):
+def _estimate_size(obj, buffers: dict, depth: int = 0, seen: set | None = None) -> int:
     """
-    Simplified timing log handler
+    Estimate the memory held by an operator from the data it references.
+
+    Only DataFrames, Series and numpy arrays are counted,
+        found by walking attributes, dicts and lists a few levels deep.
+        Columns are counted by their buffers, without scanning object values,
+        and a buffer already in buffers is not counted again,
+        so frames sharing data under Copy-on-Write are counted once.
+
+    Args:
+        obj: The object to estimate.
+        buffers (dict): (address, nbytes) of the buffers counted so far,
+            updated in place.
+        depth (int): Current walking depth.
+        seen (set, optional): ids of objects already walked.
+
+    Returns:
+        (int): Estimated size in bytes of the buffers not counted before.
     """
-
-    def __init__(self, status_instance):
-        super().__init__()
-        self.status = status_instance
-        self._timing_pattern = re.compile(
-            r"TIMING_(\w+)\|([^|]+)\|([^|]+)\|([^|]+)(?:\|([^|]+))?"
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or depth > 4:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame | pd.Series):
+        columns = obj.items() if isinstance(obj, pd.DataFrame) else [(None, obj)]
+        return sum(
+            _count_buffer(column.to_numpy(copy=False), buffers)
+            if isinstance(column.dtype, np.dtype)
+            else _count_buffer(column.array, buffers)
+            for _, column in columns
         )
+    if isinstance(obj, np.ndarray):
+        return _count_buffer(obj, buffers)
+    if isinstance(obj, dict):
+        values = obj.values()
+    elif isinstance(obj, list | tuple):
+        values = obj
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        values = vars(obj).values()
+    else:
+        return 0
+    return sum(_estimate_size(value, buffers, depth + 1, seen) for value in values)
+
+
+def _count_buffer(array, buffers: dict) -> int:
+    """
+    Count the bytes of an array once per buffer.
 
-    def emit(self, record):
-        """Process timing log record"""
-        try:
-            message = record.getMessage()
-            if not message.startswith("TIMING_"):
-                return
+    Args:
+        array (np.ndarray | ExtensionArray): The array.
+        buffers (dict): See _estimate_size().
 
-            match = self._timing_pattern.match(message)
-            if not match:
-                return
+    Returns:
+        (int): The bytes of the array, 0 if its buffer was counted before.
+    """
+    address: int = (
+        array.__array_interface__["data"][0]
+        if isinstance(array, np.ndarray)
+        else id(array)
+    )
+    key: tuple[int, int] = (address, array.nbytes)
+    if key in buffers:
+        return 0
+    buffers[key] = array.nbytes
+    return array.nbytes
+
+
+class SpilledOperator:
+    """
+    Stand-in for an operator that Status spilled to disk.
 
-            timing_type, module_name, step_name, timestamp_str, duration_str = (
-                match.groups()
-            )
-            timestamp = float(timestamp_str)
-            duration = float(duration_str) if duration_str else None
+    Attribute access reloads the operator from disk,
+        so Status.get_result() and friends work unchanged.
+        The reloaded operator is reused by later accesses
+        until Status releases it on the next put().
+    """
 
-            expt_name = self.status._current_experiments.get(module_name, "default")
+    def __init__(self, path: str, operator_type: str):
+        """
+        Args:
+            path (str): Pickle file of the operator.
+            operator_type (str): Class name of the operator, for logging.
 
-            if timing_type == "START":
-                self.status._handle_timing_start(
-                    module_name, expt_name, step_name, timestamp
-                )
-            elif timing_type in ["END", "ERROR"]:
-                context = {"status": "error" if timing_type == "ERROR" else "completed"}
-                self.status._handle_timing_end(
-                    module_name, expt_name, step_name, timestamp, duration, context
-                )
+        Attr:
+            _operator (BaseAdapter): The reloaded operator, None if not loaded.
+        """
+        self.path: str = path
+        self.operator_type: str = operator_type
+        self._operator: BaseAdapter | None = None
 
-        except (ValueError, TypeError, AttributeError):
-            pass  # Silently ignore parsing errors
+    def load(self) -> BaseAdapter:
+        """
+        Returns:
+            (BaseAdapter): The operator, reloaded from disk on first access.
+        """
+        if self._operator is None:
+            with open(self.path, "rb") as f:
+                self._operator = pickle.load(f)
+        return self._operator
+
+    def release(self) -> None:
+        """Drop the reloaded operator, keeping it on disk only"""
+        self._operator = None
+
+    def __getattr__(self, name: str):
+        # Never reload for protocol lookups (copy, pickle, repr...)
+        if name.startswith("__") or name == "_operator":
+            raise AttributeError(name)
+        return getattr(self.load(), name)
 
 
 class Status:
@@ -135,6 +210,9 @@ class Status:
         max_snapshots: int = 1000,
         max_changes: int = 5000,
         max_timings: int = 10000,
+        memory_budget_mb: int | None = None,
+        spill_dir: str | None = None,
+        trace_memory: bool = False,
     ):
         """
         Initialize status manager
@@ -144,6 +222,14 @@ class Status:
             max_snapshots: Maximum number of snapshots, prevents memory leak
             max_changes: Maximum number of change records
             max_timings: Maximum number of timing records
+            memory_budget_mb: Memory budget of the operators kept in status, in MB.
+                Above it, operators of idle modules spill to disk,
+                and schemas of finished snapshots are always spilled.
+                Default is None, which keeps everything in memory.
+            spill_dir: Directory for spilled artifacts.
+                Default is a temporary directory removed with the Status.
+            trace_memory: Record the tracemalloc memory delta and peak of each span.
+                Default is False, as tracing slows allocation-heavy modules down.
         """
         self.config = config
         self.sequence: list = config.sequence
@@ -182,26 +268,44 @@ class Status:
         self.timing_records: deque[TimingRecord] = deque(maxlen=max_timings)
         self._timing_counter = 0
         self._active_timings: dict[str, TimingRecord] = {}  # Track active timing
+        # Timing records of the current operator of each module, see get_branch_timing_data()
+        self._module_timings: dict[str, list[TimingRecord]] = {}
+        self._timing_mark: int = 0  # _timing_counter at the last put()
+        self.trace_memory: bool = trace_memory
 
         # Compatibility support for original features
         if "Splitter" in self.sequence:
             self.exist_train_indices: list[set] = []
+            # Splits generated for expanded Splitter experiments, by group
+            self.split_batches: dict[str, dict] = {}
         if "Reporter" in self.sequence:
             self.report: dict = {}
 
         # Validation result storage - used for Constrainer validate mode
         self._validation_results: dict[str, dict] = {}
 
-        # Set up logging handler to capture timing information
-        self._timing_handler = TimingLogHandler(self)
-        self._timing_handler.setLevel(logging.INFO)
-
-        # Add handler to PETsARD's root logger
-        petsard_logger = logging.getLogger("PETsARD")
-        petsard_logger.addHandler(self._timing_handler)
+        # Memory budget - large artifacts spill to disk above it
+        self.memory_budget: int | None = (
+            memory_budget_mb * 1024 * 1024 if memory_budget_mb is not None else None
+        )
+        self._spill_tempdir: tempfile.TemporaryDirectory | None = None
+        if self.memory_budget is not None and spill_dir is None:
+            self._spill_tempdir = tempfile.TemporaryDirectory(prefix="petsard_status_")
+            spill_dir = self._spill_tempdir.name
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+        self.spill_dir: str | None = spill_dir
+        self._spilled_snapshots: dict[str, str] = {}  # snapshot_id -> spill file
+
+    def close(self) -> None:
+        """
+        Release what the Status holds outside itself
 
-        # Store mapping of current experiment names
-        self._current_experiments: dict[str, str] = {}
+        Removes its temporary spill directory if it created one.
+        """
+        if self._spill_tempdir is not None:
+            self._spill_tempdir.cleanup()
+            self._spill_tempdir = None
 
     def _generate_id(self, prefix: str, counter_attr: str) -> str:
         """
@@ -290,6 +394,9 @@ class Status:
             self._snapshot_index = {
                 k: v for k, v in self._snapshot_index.items() if k in valid_ids
             }
+            for snapshot_id in list(self._spilled_snapshots):
+                if snapshot_id not in valid_ids:
+                    os.remove(self._spilled_snapshots.pop(snapshot_id))
 
         self._logger.debug(
             f"Created snapshot: {snapshot.snapshot_id} for {module}[{expt}]"
@@ -364,18 +471,7 @@ class Status:
         # Merge additional context information
         merged_context = self._merge_context(active_timing.context, context)
 
-        completed_timing = active_timing.complete()
-        # Update context
-        completed_timing = TimingRecord(
-            record_id=completed_timing.record_id,
-            module_name=completed_timing.module_name,
-            experiment_name=completed_timing.experiment_name,
-            step_name=completed_timing.step_name,
-            start_time=completed_timing.start_time,
-            end_time=completed_timing.end_time,
-            duration_seconds=completed_timing.duration_seconds,
-            context=merged_context,
-        )
+        completed_timing = replace(active_timing.complete(), context=merged_context)
 
         self.timing_records.append(completed_timing)
 
@@ -385,139 +481,69 @@ class Status:
 
         return completed_timing
 
-    def _create_timing_record(
-        self,
-        timing_id: str,
-        module: str,
-        expt: str,
-        step: str,
-        start_time: datetime,
-        end_time: datetime | None = None,
-        duration_seconds: float | None = None,
-        context: dict[str, Any] | None = None,
-    ) -> TimingRecord:
+    def add_timing_records(self, records: list[TimingRecord]) -> None:
         """
-        Unified timing record creation method, avoid code duplication
+        Append timing records collected by another Status (e.g. a worker process)
 
-        Args:
-            timing_id: Timing record ID
-            module: Module name
-            expt: Experiment name
-            step: Step name
-            start_time: Start time
-            end_time: End time
-            duration_seconds: Duration in seconds
-            context: Context information
+        Record IDs are re-issued so they stay unique and ordered in this Status.
 
-        Returns:
-            TimingRecord: Created timing record
+        Args:
+            records: Completed timing records
         """
-        return TimingRecord(
-            record_id=timing_id,
-            module_name=module,
-            experiment_name=expt,
-            step_name=step,
-            start_time=start_time,
-            end_time=end_time,
-            duration_seconds=duration_seconds,
-            context=context or {},
-        )
+        for record in records:
+            self.timing_records.append(
+                replace(record, record_id=self._generate_timing_id())
+            )
 
-    def _handle_timing_start(self, module: str, expt: str, step: str, timestamp: float):
+    @contextmanager
+    def recording(self, expt: str = "default") -> Iterator[None]:
         """
-        Process start timing information parsed from logging
+        Record the spans of the operations run in the block as timing records
+
+        Every adapter run is a span, with named sub-steps (e.g. Synthesizer fit/sample)
+            nested in it, see petsard.instrumentation.
 
         Args:
-            module: Module name
-            expt: Experiment name
-            step: Step name
-            timestamp: Timestamp
+            expt: Experiment name of the recorded spans
         """
-        try:
-            timing_id = self._generate_timing_id()
-            timing_key = f"{module}_{expt}_{step}"
-            start_time = datetime.fromtimestamp(timestamp)
-
-            timing_record = self._create_timing_record(
-                timing_id=timing_id,
-                module=module,
-                expt=expt,
-                step=step,
-                start_time=start_time,
-                context={"source": "logging"},
-            )
+        with recording(self._record_span, expt=expt, trace_memory=self.trace_memory):
+            yield
 
-            self._active_timings[timing_key] = timing_record
-            self._logger.debug(f"Start timing from logging: {timing_key} - {timing_id}")
-
-        except (ValueError, OSError) as e:
-            raise TimingError(f"Unable to process timing start event: {e}") from e
-
-    def _handle_timing_end(
-        self,
-        module: str,
-        expt: str,
-        step: str,
-        timestamp: float,
-        duration: float | None,
-        context: dict[str, Any],
-    ):
+    def _record_span(self, span: Span) -> None:
         """
-        Process end timing information parsed from logging
+        Convert a finished span into a timing record
 
         Args:
-            module: Module name
-            expt: Experiment name
-            step: Step name
-            timestamp: End timestamp
-            duration: Duration in seconds
-            context: Context information
+            span: The finished span
         """
-        try:
-            timing_key = f"{module}_{expt}_{step}"
-            end_time = datetime.fromtimestamp(timestamp)
-            rounded_duration = round(duration, 2) if duration is not None else None
-
-            if timing_key in self._active_timings:
-                # Has corresponding start record
-                active_timing = self._active_timings.pop(timing_key)
-                merged_context = self._merge_context(active_timing.context, context)
-
-                completed_timing = self._create_timing_record(
-                    timing_id=active_timing.record_id,
-                    module=module,
-                    expt=expt,
-                    step=step,
-                    start_time=active_timing.start_time,
-                    end_time=end_time,
-                    duration_seconds=rounded_duration,
-                    context=merged_context,
-                )
-            else:
-                # No corresponding start record, create orphaned record
-                timing_id = self._generate_timing_id()
-                start_time = datetime.fromtimestamp(timestamp - (duration or 0))
-                orphaned_context = {**context, "source": "logging", "orphaned": True}
-
-                completed_timing = self._create_timing_record(
-                    timing_id=timing_id,
-                    module=module,
-                    expt=expt,
-                    step=step,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration_seconds=rounded_duration,
-                    context=orphaned_context,
-                )
-
-            self.timing_records.append(completed_timing)
-
-            self._logger.debug(
-                f"End timing from logging: {timing_key} - Duration: {completed_timing.formatted_duration}"
-            )
-
-        except (ValueError, OSError) as e:
-            raise TimingError(f"Unable to process timing end event: {e}") from e
+        context: dict[str, Any] = {"source": "span", "status": span.status}
+        if span.error is not None:
+            context["error"] = span.error
+
+        record = TimingRecord(
+            record_id=self._generate_timing_id(),
+            module_name=span.module_name,
+            experiment_name=span.experiment_name,
+            step_name=span.step_name,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            duration_seconds=round(span.wall_seconds, 4),
+            context=context,
+            cpu_seconds=round(span.cpu_seconds, 4),
+            peak_rss_mb=span.peak_rss_mb,
+            memory_delta_mb=span.memory_delta_mb,
+            memory_peak_mb=span.memory_peak_mb,
+            input_rows=span.input_rows,
+            input_cols=span.input_cols,
+            output_rows=span.output_rows,
+            output_cols=span.output_cols,
+            parent_step=span._parent.step_name if span._parent else None,
+        )
+        self.timing_records.append(record)
+        self._logger.debug(
+            f"Recorded span: {span.module_name}_{span.experiment_name}_{span.step_name}"
+            f" - Duration: {record.formatted_duration}"
+        )
 
     def put(self, module: str, expt: str, operator: BaseAdapter):
         """
@@ -530,8 +556,17 @@ class Status:
             expt: Current experiment name
             operator: Current operator
         """
-        # Record current module's experiment name for logging handler use
-        self._current_experiments[module] = expt
+        # Operators reloaded from disk since the last put() return to disk
+        for entry in self.status.values():
+            if isinstance(entry["operator"], SpilledOperator):
+                entry["operator"].release()
+
+        # Timing records added since the last put() belong to this operator
+        new_timings: int = self._timing_counter - self._timing_mark
+        self._module_timings[module] = (
+            list(self.timing_records)[-new_timings:] if new_timings > 0 else []
+        )
+        self._timing_mark = self._timing_counter
         # Get metadata state before execution
         metadata_before = self.metadata.get(module) if module in self.metadata else None
 
@@ -541,7 +576,9 @@ class Status:
             module_to_keep = set(self.sequence[: module_seq_idx + 1])
             keys_to_remove = [key for key in self.status if key not in module_to_keep]
             for exist_module in keys_to_remove:
+                self._release_operator(self.status[exist_module]["operator"])
                 del self.status[exist_module]
+            self._release_operator(self.status[module]["operator"])
 
         # Use Metadater to manage metadata
         if module in ["Loader", "Splitter", "Preprocessor"]:
@@ -644,6 +681,111 @@ class Status:
             f"Status updated: {module}[{expt}] - Snapshot count: {len(self.snapshots)}"
         )
 
+        if self.memory_budget is not None:
+            self._enforce_memory_budget(current_module=module)
+
+    # === Memory budget and spill-to-disk ===
+
+    def _get_spill_path(self, prefix: str) -> str:
+        # Unique file, several Status may share the same spill_dir
+        fd, path = tempfile.mkstemp(
+            dir=self.spill_dir, prefix=f"{prefix}_", suffix=".pkl"
+        )
+        os.close(fd)
+        return path
+
+    def _release_operator(self, operator) -> None:
+        """Remove the spill file of an operator leaving the status"""
+        if isinstance(operator, SpilledOperator):
+            operator.release()
+            try:
+                os.remove(operator.path)
+            except FileNotFoundError:
+                pass
+
+    def _enforce_memory_budget(self, current_module: str) -> None:
+        """
+        Spill idle operators and finished snapshots to disk to fit the memory budget.
+
+        Operators are spilled from the end of the current path,
+            the steps closest to their finished leaves,
+            which the next sibling branch replaces;
+            upstream operators like Loader, which every sibling branch reads,
+            are spilled last. The operator just put is never spilled.
+
+        Args:
+            current_module: The module just put into status.
+        """
+        # Data shared between operators counts for the most upstream one
+        buffers: dict[tuple[int, int], int] = {}
+        sizes: dict[str, int] = {
+            module: _estimate_size(self.status[module]["operator"], buffers)
+            for module in self.sequence
+            if module in self.status
+            and not isinstance(self.status[module]["operator"], SpilledOperator)
+        }
+        total_size: int = sum(sizes.values())
+        for module in reversed(self.sequence):
+            if total_size <= self.memory_budget:
+                break
+            if module not in sizes or module == current_module:
+                continue
+            self._spill_operator(module)
+            total_size -= sizes[module]
+
+        # Schemas of snapshots outside the current path are only read for history
+        for idx in range(len(self.snapshots) - len(self.status)):
+            snapshot = self.snapshots[idx]
+            if snapshot.snapshot_id in self._spilled_snapshots or (
+                snapshot.metadata_before is None and snapshot.metadata_after is None
+            ):
+                continue
+            self.snapshots[idx] = self._spill_snapshot(snapshot)
+
+    def _spill_operator(self, module: str) -> None:
+        """Write an operator to disk and keep a SpilledOperator in its place"""
+        operator = self.status[module]["operator"]
+        path: str = self._get_spill_path(f"operator_{module}")
+        try:
+            with open(path, "wb") as f:
+                pickle.dump(operator, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self._logger.warning(f"Cannot spill {module} operator to disk: {e}")
+            if os.path.exists(path):
+                os.remove(path)
+            return
+
+        self.status[module]["operator"] = SpilledOperator(
+            path=path, operator_type=type(operator).__name__
+        )
+        self._logger.debug(f"Spilled {module} operator to {path}")
+
+    def _spill_snapshot(self, snapshot: ExecutionSnapshot) -> ExecutionSnapshot:
+        """Write the schemas of a snapshot to disk and return the slim snapshot"""
+        path: str = self._get_spill_path("snapshot")
+        with open(path, "wb") as f:
+            pickle.dump(
+                (snapshot.metadata_before, snapshot.metadata_after),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        self._spilled_snapshots[snapshot.snapshot_id] = path
+
+        slim = replace(snapshot, metadata_before=None, metadata_after=None)
+        self._snapshot_index[snapshot.snapshot_id] = slim
+        return slim
+
+    def _load_snapshot(self, snapshot: ExecutionSnapshot) -> ExecutionSnapshot:
+        """Return the snapshot with its spilled schemas reloaded"""
+        path: str | None = self._spilled_snapshots.get(snapshot.snapshot_id)
+        if path is None:
+            return snapshot
+        with open(path, "rb") as f:
+            metadata_before, metadata_after = pickle.load(f)
+        return replace(
+            snapshot, metadata_before=metadata_before, metadata_after=metadata_after
+        )
+
     # === Original interface methods (maintain compatibility) ===
 
     def set_report(self, report: dict) -> None:
@@ -689,6 +831,12 @@ class Status:
         """Get the list of unique training index sets generated by the Splitter module"""
         return self.exist_train_indices
 
+    def get_split_batches(self) -> dict[str, dict]:
+        """Get the splits generated for expanded Splitter experiments, by group"""
+        if not hasattr(self, "split_batches"):
+            self.split_batches = {}
+        return self.split_batches
+
     def update_exist_train_indices(self, new_indices: list[set]) -> None:
         """
         Update exist_train_indices by adding new training indices to the set list
@@ -797,9 +945,13 @@ class Status:
             List[ExecutionSnapshot]: Snapshot list
         """
         if module is None:
-            return self.snapshots.copy()
+            return [self._load_snapshot(s) for s in self.snapshots]
         else:
-            return [s for s in self.snapshots if s.module_name == module]
+            return [
+                self._load_snapshot(s)
+                for s in self.snapshots
+                if s.module_name == module
+            ]
 
     def get_snapshot_by_id(self, snapshot_id: str) -> ExecutionSnapshot | None:
         """
@@ -811,7 +963,8 @@ class Status:
         Returns:
             Optional[ExecutionSnapshot]: Snapshot object or None
         """
-        return self._snapshot_index.get(snapshot_id)
+        snapshot = self._snapshot_index.get(snapshot_id)
+        return self._load_snapshot(snapshot) if snapshot is not None else None
 
     def get_change_history(self, module: str = None) -> list[dict[str, Any]]:
         """
@@ -845,7 +998,7 @@ class Status:
         evolution = []
         seen_ids = set()
 
-        for snapshot in self.snapshots:
+        for snapshot in self.get_snapshots(module):
             if snapshot.module_name == module:
                 if (
                     snapshot.metadata_before
@@ -950,14 +1103,41 @@ class Status:
         else:
             return [r for r in self.timing_records if r.module_name == module]
 
-    def get_timing_report_data(self) -> pd.DataFrame:
+    def get_branch_timing_data(self) -> pd.DataFrame:
+        """
+        Get timing record data of the operators currently in status,
+            i.e. of the steps on the current experiment branch
+
+        Returns:
+            pd.DataFrame: DataFrame of timing records, see get_timing_report_data()
+        """
+        records: list[TimingRecord] = [
+            record
+            for module in self.sequence
+            if module in self.status
+            for record in self._module_timings.get(module, [])
+        ]
+        return self.get_timing_report_data(records)
+
+    def get_timing_report_data(
+        self, records: list[TimingRecord] | None = None
+    ) -> pd.DataFrame:
         """
         Get timing record data suitable for Reporter use - optimized version
 
+        Besides wall time (duration_seconds), span records carry CPU time,
+            peak RSS, tracemalloc memory delta/peak (if trace_memory is enabled),
+            input/output row and column counts, and the parent step of sub-steps.
+
+        Args:
+            records: Timing records to report. Default is all records of the status.
+
         Returns:
             pd.DataFrame: DataFrame of timing records
         """
-        if not self.timing_records:
+        if records is None:
+            records = list(self.timing_records)
+        if not records:
             return pd.DataFrame()
 
         # Use list comprehension and pre-allocation to improve performance
@@ -970,9 +1150,18 @@ class Status:
                 "start_time": record.start_time.isoformat(),
                 "end_time": record.end_time.isoformat() if record.end_time else None,
                 "duration_seconds": record.duration_seconds,
+                "cpu_seconds": record.cpu_seconds,
+                "peak_rss_mb": record.peak_rss_mb,
+                "memory_delta_mb": record.memory_delta_mb,
+                "memory_peak_mb": record.memory_peak_mb,
+                "input_rows": record.input_rows,
+                "input_cols": record.input_cols,
+                "output_rows": record.output_rows,
+                "output_cols": record.output_cols,
+                "parent_step": record.parent_step,
                 **record.context,  # Expand extra information from context
             }
-            for record in self.timing_records
+            for record in records
         ]
 
         return pd.DataFrame(data)
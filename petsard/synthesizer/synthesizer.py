@@ -13,14 +13,17 @@ from petsard.exceptions import (
     UncreatedError,
     UnsupportedMethodError,
 )
+from petsard.instrumentation import span
 from petsard.metadater.metadata import Schema
 from petsard.synthesizer.custom_synthesizer import CustomSynthesizer
-from petsard.synthesizer.petsard_gaussian_copula import PetsardGaussianCopulaSynthesizer
 from petsard.synthesizer.synthesizer_base import BaseSynthesizer
 
 # Lazy import for SDV - will be imported only when needed
 # This allows PETsARD to function without SDV installed
 _SDVSingleTableSynthesizer = None
+# Lazy import for the built-in synthesizer, which depends on torch, scipy and numba
+# This keeps `import petsard` fast when no synthesis is done
+_PetsardGaussianCopulaSynthesizer = None
 
 
 class SynthesizerMap:
@@ -137,10 +140,10 @@ class Synthesizer:
     # Note: SDV synthesizer is loaded lazily in create() method
     # to avoid ImportError when sdv is not installed
     SYNTHESIZER_MAP: dict[int, BaseSynthesizer] = {
-        SynthesizerMap.DEFAULT: PetsardGaussianCopulaSynthesizer,  # Default to built-in synthesizer
+        SynthesizerMap.DEFAULT: None,  # Lazy-loaded built-in PetsardGaussianCopulaSynthesizer
         SynthesizerMap.SDV: None,  # Lazy-loaded SDVSingleTableSynthesizer
         SynthesizerMap.CUSTOM_METHOD: CustomSynthesizer,
-        SynthesizerMap.PETSARD: PetsardGaussianCopulaSynthesizer,
+        SynthesizerMap.PETSARD: None,  # Lazy-loaded PetsardGaussianCopulaSynthesizer
     }
 
     def __init__(self, method: str, sample_num_rows: int = None, **kwargs) -> None:
@@ -295,10 +298,11 @@ class Synthesizer:
         self._logger.debug(f"Merged config keys: {list(merged_config.keys())}")
 
         self._logger.info(f"Creating {synthesizer_class.__name__} instance")
-        self._impl = synthesizer_class(
-            config=merged_config,
-            metadata=metadata,
-        )
+        with span("create"):
+            self._impl = synthesizer_class(
+                config=merged_config,
+                metadata=metadata,
+            )
         self._logger.info(f"Successfully created {synthesizer_class.__name__} instance")
 
     def fit(self, data: pd.DataFrame = None) -> None:
@@ -346,7 +350,9 @@ class Synthesizer:
 
         self._logger.debug(f"Starting fit process for {self.config.syn_method}")
         try:
-            self._impl.fit(data=data)
+            with span("fit") as fit_span:
+                fit_span.set_input(data)
+                self._impl.fit(data=data)
             time_spent = round(time.time() - time_start, 4)
             self._logger.info(f"Fitting completed successfully in {time_spent} seconds")
         except Exception as e:
@@ -371,7 +377,9 @@ class Synthesizer:
         )
 
         try:
-            data: pd.DataFrame = self._impl.sample()
+            with span("sample") as sample_span:
+                data: pd.DataFrame = self._impl.sample()
+                sample_span.set_output(data)
             time_spent: float = round(time.time() - time_start, 4)
 
             sample_info: str = (
@@ -395,7 +403,7 @@ class Synthesizer:
     def _get_synthesizer_class(self, method_code: int) -> BaseSynthesizer:
         """
         Get the synthesizer class for the given method code.
-        Lazy loads SDV synthesizer if needed.
+        Lazy loads the built-in or SDV synthesizer if needed.
 
         Args:
             method_code (int): The synthesizer method code.
@@ -403,10 +411,23 @@ class Synthesizer:
         Returns:
             BaseSynthesizer: The synthesizer class.
         """
-        global _SDVSingleTableSynthesizer
+        global _SDVSingleTableSynthesizer, _PetsardGaussianCopulaSynthesizer
 
         synthesizer_class = self.SYNTHESIZER_MAP.get(method_code)
 
+        if synthesizer_class is None and method_code in (
+            SynthesizerMap.DEFAULT,
+            SynthesizerMap.PETSARD,
+        ):
+            if _PetsardGaussianCopulaSynthesizer is None:
+                self._logger.debug("Lazy loading PETsARD Gaussian Copula synthesizer")
+                from petsard.synthesizer.petsard_gaussian_copula import (
+                    PetsardGaussianCopulaSynthesizer,
+                )
+
+                _PetsardGaussianCopulaSynthesizer = PetsardGaussianCopulaSynthesizer
+            synthesizer_class = _PetsardGaussianCopulaSynthesizer
+
         # If it's None, it's SDV which needs lazy loading
         if synthesizer_class is None and method_code == SynthesizerMap.SDV:
             if _SDVSingleTableSynthesizer is None:
@@ -2,12 +2,18 @@ import hashlib
 import os
 import shutil
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from petsard.exceptions import BenchmarkDatasetsError
-from petsard.loader.benchmarker import BaseBenchmarker, BenchmarkerRequests
+from petsard.loader.benchmarker import (
+    BaseBenchmarker,
+    BenchmarkerRequests,
+    digest_sha256,
+)
 
 
 # Helper function, not a test class to avoid pytest warnings
@@ -102,8 +108,14 @@ class TestBenchmarker:
         with patch("builtins.open", mock_open()) as _:  # mock_file
             with patch.object(BenchmarkerRequests, "_verify_file") as mock_verify:
                 benchmarker = BenchmarkerRequests(sample_config)
-                with patch("os.makedirs", side_effect=None):
+                with (
+                    patch("os.makedirs", side_effect=None),
+                    patch("os.replace") as mock_replace,
+                ):
                     benchmarker.download()
+                    mock_replace.assert_called_once_with(
+                        "benchmark/test.csv.part", "benchmark/test.csv"
+                    )
                     mock_verify.assert_called_once_with(already_exist=False)
 
     def test_verify_file_mismatch_error(self, sample_config):
@@ -313,3 +325,157 @@ class TestBenchmarker:
 
             # Check error message
             assert "SHA-256 verification FAILED" in str(exc_info.value)
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serve the content of the server with Range support, recording the requests
+    以 Range 支援提供伺服器內容，並記錄請求
+    """
+
+    def do_GET(self):
+        content: bytes = self.server.content
+        self.server.ranges.append(self.headers.get("Range"))
+        start = 0
+        if self.headers.get("Range") and self.server.support_range:
+            start = int(self.headers["Range"].removeprefix("bytes=").rstrip("-"))
+            if start >= len(content):
+                self.send_response(416)
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+        if self.server.fail_after is not None:
+            # Drop the connection in the middle of the body
+            self.wfile.write(content[start : self.server.fail_after])
+            self.server.fail_after = None
+            self.close_connection = True
+            return
+        self.wfile.write(content[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestBenchmarkerResume:
+    """Test cases for the SHA-256 record and resumable downloads
+    測試 SHA-256 紀錄與可續傳下載的案例
+    """
+
+    CONTENT: bytes = b"".join(f"{i},{i * i}\n".encode() for i in range(20000))
+
+    @pytest.fixture
+    def server(self):
+        """Local HTTP server serving CONTENT
+        提供 CONTENT 的本地 HTTP 伺服器
+        """
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+        httpd.content = self.CONTENT
+        httpd.ranges = []
+        httpd.support_range = True
+        httpd.fail_after = None
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield httpd
+        httpd.shutdown()
+        httpd.server_close()
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return {
+            "filepath": str(tmp_path / "benchmark" / "test.csv"),
+            "benchmark_bucket_name": "petsard-benchmark",
+            "benchmark_filename": "test.csv",
+            "benchmark_sha256": hashlib.sha256(self.CONTENT).hexdigest(),
+        }
+
+    def _download(self, server, config):
+        benchmarker = BenchmarkerRequests(dict(config))
+        url = f"http://127.0.0.1:{server.server_port}/test.csv"
+        with patch.object(BenchmarkerRequests, "_get_url", return_value=url):
+            benchmarker.download()
+        return benchmarker
+
+    def test_sha256_record_skips_hashing(self, config):
+        """Test an unchanged file is verified from the record without hashing
+        測試未變更的檔案以紀錄驗證而不重新計算雜湊
+        """
+        os.makedirs(os.path.dirname(config["filepath"]))
+        with open(config["filepath"], "wb") as f:
+            f.write(self.CONTENT)
+
+        with patch(
+            "petsard.loader.benchmarker.digest_sha256",
+            wraps=digest_sha256,
+        ) as mock_digest:
+            assert BenchmarkerRequests(dict(config)).config["benchmark_already_exist"]
+            assert BenchmarkerRequests(dict(config)).config["benchmark_already_exist"]
+            assert mock_digest.call_count == 1
+        assert os.path.exists(config["filepath"] + BaseBenchmarker.DIGEST_SUFFIX)
+
+        # A modified file is hashed again and fails verification
+        with open(config["filepath"], "ab") as f:
+            f.write(b"extra")
+        with pytest.raises(BenchmarkDatasetsError):
+            BenchmarkerRequests(dict(config))
+
+    def test_resume_partial_download(self, server, config):
+        """Test a partial download is resumed by a Range request
+        測試部分下載以 Range 請求續傳
+        """
+        os.makedirs(os.path.dirname(config["filepath"]))
+        with open(config["filepath"] + BenchmarkerRequests.PART_SUFFIX, "wb") as f:
+            f.write(self.CONTENT[:1000])
+
+        benchmarker = self._download(server, config)
+        assert server.ranges == ["bytes=1000-"]
+        with open(config["filepath"], "rb") as f:
+            assert f.read() == self.CONTENT
+        assert not os.path.exists(config["filepath"] + BenchmarkerRequests.PART_SUFFIX)
+        assert benchmarker.config["benchmark_already_exist"]
+
+    def test_resume_after_interruption(self, server, config):
+        """Test a dropped connection keeps the partial download for the next run
+        測試連線中斷時保留部分下載供下次續傳
+        """
+        server.fail_after = 50000
+        with pytest.raises(BenchmarkDatasetsError, match="resume"):
+            self._download(server, config)
+        part_path = config["filepath"] + BenchmarkerRequests.PART_SUFFIX
+        part_size = os.path.getsize(part_path)
+        assert 0 < part_size <= 50000
+
+        self._download(server, config)
+        assert server.ranges == [None, f"bytes={part_size}-"]
+        with open(config["filepath"], "rb") as f:
+            assert f.read() == self.CONTENT
+
+    def test_server_without_range_support(self, server, config):
+        """Test the download restarts when the server ignores the Range request
+        測試伺服器忽略 Range 請求時重新下載
+        """
+        server.support_range = False
+        os.makedirs(os.path.dirname(config["filepath"]))
+        with open(config["filepath"] + BenchmarkerRequests.PART_SUFFIX, "wb") as f:
+            f.write(b"stale partial content")
+
+        self._download(server, config)
+        with open(config["filepath"], "rb") as f:
+            assert f.read() == self.CONTENT
+
+    def test_completed_partial_download(self, server, config):
+        """Test a complete partial download is verified without downloading again
+        測試已完成的部分下載直接驗證而不重新下載
+        """
+        os.makedirs(os.path.dirname(config["filepath"]))
+        with open(config["filepath"] + BenchmarkerRequests.PART_SUFFIX, "wb") as f:
+            f.write(self.CONTENT)
+
+        benchmarker = self._download(server, config)
+        assert server.ranges == [f"bytes={len(self.CONTENT)}-"]
+        assert benchmarker.config["benchmark_already_exist"]
@@ -1,8 +1,11 @@
+import random
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from petsard.exceptions import ConfigError
-from petsard.loader import Splitter
+from petsard.loader import Splitter, SplitView
 from petsard.metadater import Schema
 
 
@@ -314,3 +317,203 @@ class TestSplitter:
                 assert overlap_percentage <= 0.5, (
                     f"Overlap {overlap_percentage:.2%} exceeds limit"
                 )
+
+    def test_split_reproducible_with_random_state(self):
+        """Test the same random_state gives the same splits, for int and str seeds
+        測試相同的 random_state（整數與字串）產生相同的分割
+        """
+        data = pd.DataFrame({"A": list(range(1000))})
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        for random_state in (42, "petsard", 0.5):
+            first = Splitter(num_samples=3, random_state=random_state).split(
+                data=data.copy(), metadata=test_schema
+            )
+            second = Splitter(num_samples=3, random_state=random_state).split(
+                data=data.copy(), metadata=test_schema
+            )
+            assert first[2] == second[2]
+            for key in first[0]:
+                pd.testing.assert_frame_equal(
+                    first[0][key]["train"], second[0][key]["train"]
+                )
+
+        other = Splitter(num_samples=3, random_state=43).split(
+            data=data.copy(), metadata=test_schema
+        )
+        assert other[2] != first[2]
+
+    def test_bootstrapping_partitions_rows(self):
+        """Test train and validation partition the rows with the exact train size
+        測試訓練與驗證集恰好分割所有資料列，且訓練集大小正確
+        """
+        for n_rows in (0, 1, 7, 10, 10000):
+            for ratio in (0.0, 0.3, 0.8, 1.0):
+                splitter = Splitter(
+                    num_samples=2, train_split_ratio=ratio, random_state=0
+                )
+                if n_rows * min(ratio, 1 - ratio) < 1:
+                    # Every sample would be identical
+                    continue
+                result = splitter._bootstrapping(n_rows=n_rows)
+                for index in result.values():
+                    train, validation = index["train"], index["validation"]
+                    assert len(train) == round(n_rows * ratio)
+                    assert (np.diff(train) > 0).all()
+                    assert (np.diff(validation) > 0).all()
+                    np.testing.assert_array_equal(
+                        np.sort(np.concatenate([train, validation])),
+                        np.arange(n_rows),
+                    )
+
+    def test_split_does_not_seed_global_random(self, sample_data):
+        """Test splitting leaves the global random module untouched
+        測試分割不會設定全域 random 模組的種子
+        """
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        state = random.getstate()
+        Splitter(random_state=42).split(data=sample_data, metadata=test_schema)
+        assert random.getstate() == state
+
+    def test_overlap_constrained_samples_are_constructed(self):
+        """Test tight overlap limits are met by construction instead of failing
+        測試嚴格的重疊上限以建構方式滿足，而非抽樣失敗
+        """
+        # Five disjoint samples of 20% must partition the rows exactly
+        splitter = Splitter(
+            num_samples=5,
+            train_split_ratio=0.2,
+            max_overlap_ratio=0.0,
+            random_state=42,
+        )
+        result = splitter._bootstrapping(n_rows=100)
+        trains = [set(index["train"].tolist()) for index in result.values()]
+        assert set().union(*trains) == set(range(100))
+        assert sum(len(train) for train in trains) == 100
+
+        # Random draws overlap about 10%, far above the 5% limit
+        splitter = Splitter(
+            num_samples=15,
+            train_split_ratio=0.1,
+            max_overlap_ratio=0.05,
+            random_state=42,
+        )
+        result = splitter._bootstrapping(n_rows=10000)
+        trains = [set(index["train"].tolist()) for index in result.values()]
+        assert all(len(train) == 1000 for train in trains)
+        for i in range(len(trains)):
+            for j in range(i + 1, len(trains)):
+                assert len(trains[i] & trains[j]) <= 50
+
+    def test_overlap_constrained_infeasible_raises(self):
+        """Test impossible overlap limits still raise ConfigError
+        測試無法達成的重疊上限仍會引發 ConfigError
+        """
+        splitter = Splitter(
+            num_samples=4,
+            train_split_ratio=0.3,
+            max_overlap_ratio=0.0,
+            random_state=42,
+        )
+        with pytest.raises(ConfigError):
+            splitter._bootstrapping(n_rows=100)
+
+    def test_check_overlap_acceptable_with_bitsets(self):
+        """Test bitset overlap counts agree with set intersections
+        測試位元集合的重疊計數與集合交集一致
+        """
+        splitter = Splitter(max_overlap_ratio=0.5)
+
+        def to_bits(rows):
+            mask = np.zeros(20, dtype=bool)
+            mask[list(rows)] = True
+            return np.packbits(mask)
+
+        new = {0, 1, 2, 3, 4, 5}
+        assert splitter._check_overlap_acceptable(to_bits(new), [to_bits({0, 1, 2})])
+        assert not splitter._check_overlap_acceptable(
+            to_bits(new), [to_bits({9}), to_bits({0, 1, 2, 3})]
+        )
+        assert not Splitter()._check_overlap_acceptable(to_bits(new), [to_bits(new)])
+
+    def test_lazy_split_returns_views(self):
+        """Test lazy splits hold row positions into the source until materialized
+        測試延遲分割僅保存來源資料的列位置，直到實體化
+        """
+        data = pd.DataFrame({"A": list(range(100)), "B": [f"v{i}" for i in range(100)]})
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        eager = Splitter(num_samples=20, random_state=42).split(
+            data=data.copy(), metadata=test_schema
+        )
+        split_data, metadata, train_indices = Splitter(
+            num_samples=20, random_state=42, lazy=True
+        ).split(data=data, metadata=test_schema)
+
+        assert [set(train.tolist()) for train in train_indices] == eager[2]
+        for key, views in split_data.items():
+            for name in ("train", "validation"):
+                assert isinstance(views[name], SplitView)
+                # Every view shares the one source table
+                assert views[name].data is data
+                pd.testing.assert_frame_equal(
+                    views[name].materialize(), eager[0][key][name]
+                )
+            assert len(views["train"]) + len(views["validation"]) == len(data)
+            assert views["train"].shape == (80, 2)
+
+    def test_split_metadata_shares_schema(self):
+        """Test split metadata overrides only the description of the source Schema
+        測試分割的詮釋資料只覆寫來源 Schema 的描述，其餘共用
+        """
+        from petsard.metadater import SchemaMetadater
+
+        data = pd.DataFrame({"A": list(range(10)), "B": list("abcdefghij")})
+        schema = SchemaMetadater.from_data(data)
+
+        _, metadata, _ = Splitter(num_samples=2, random_state=42).split(
+            data=data, metadata=schema
+        )
+
+        for key in metadata:
+            split_schema = metadata[key]["train"]
+            assert split_schema is not schema
+            assert split_schema.attributes is schema.attributes
+            assert "Split info: train=8 rows" in split_schema.description
+        assert "Split info" not in (schema.description or "")
+
+    def test_split_batch_matches_sequential_split(self):
+        """Test split_batch reproduces sequential split() calls avoiding each other
+        測試 split_batch 與逐次呼叫 split() 並避開先前樣本的結果相同
+        """
+        data = pd.DataFrame({"A": list(range(200))})
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        for config in (
+            {"random_state": 42},
+            {"random_state": "exp", "train_split_ratio": 0.2, "max_overlap_ratio": 0.3},
+        ):
+            exist = [set(range(10))]
+            sequential = []
+            for _ in range(4):
+                result = Splitter(**config).split(
+                    data=data, metadata=test_schema, exist_train_indices=exist
+                )
+                exist = exist + result[2]
+                sequential.append(result)
+
+            batch = Splitter(**config).split_batch(
+                data=data,
+                metadata=test_schema,
+                num_batches=4,
+                exist_train_indices=[set(range(10))],
+            )
+
+            assert len(batch) == 4
+            for batch_result, sequential_result in zip(batch, sequential, strict=True):
+                assert batch_result[2] == sequential_result[2]
+                pd.testing.assert_frame_equal(
+                    batch_result[0][1]["validation"],
+                    sequential_result[0][1]["validation"],
+                )
@@ -445,6 +445,36 @@ class TestSchemaOperations:
         with pytest.raises(KeyError):
             SchemaMetadater.get(schema, "nonexistent")
 
+    def test_merge_chunk_schemas(self):
+        """測試合併分塊推斷的 Schema"""
+        chunk1 = pd.DataFrame({"id": [1, 2, 3], "value": [1, 2, 3], "name": ["A"] * 3})
+        chunk2 = pd.DataFrame(
+            {"id": [4, 5, 6], "value": [1.5, None, 2.25], "extra": ["x", "y", "z"]}
+        )
+        schema = SchemaMetadater.from_data(chunk1)
+        merged = SchemaMetadater.merge(schema, SchemaMetadater.from_data(chunk2))
+
+        assert list(merged.attributes) == ["id", "value", "name", "extra"]
+        assert merged.attributes["id"].type == "int"
+        # int 與 float 合併為 float，nullable 取聯集，精度取較大者
+        value = merged.attributes["value"]
+        assert value.type == "float"
+        assert value.type_attr["nullable"] is True
+        assert value.type_attr["precision"] == 2
+        # 原始 schema 應該不變
+        assert schema.attributes["value"].type == "int"
+
+    def test_merge_attribute_conflicts(self):
+        """測試合併欄位時的型別衝突與類別判斷"""
+        text = AttributeMetadater.from_data(pd.Series(["A"] * 40, name="col"))
+        number = AttributeMetadater.from_data(pd.Series(range(40), name="col"))
+        assert text.type_attr["category"] is True
+
+        merged = AttributeMetadater.merge(text, number)
+        assert merged.type == "str"
+        # 只有兩個分塊都判斷為類別時才視為類別
+        assert merged.type_attr["category"] is False
+
 
 class TestLogicalTypeInference:
     """測試邏輯型別推斷"""
@@ -732,6 +762,89 @@ class TestPrecisionTracking:
 
         assert attr.type_attr.get("precision") == 2
 
+    def test_infer_precision_matches_decimal_repr(self):
+        """測試向量化精度推斷與逐值 Decimal(str(value)) 的結果一致"""
+        from decimal import Decimal
+
+        def decimal_precision(series):
+            precisions = [
+                max(-Decimal(str(value)).normalize().as_tuple().exponent, 0)
+                for value in series.dropna()
+                if np.isfinite(value)
+            ]
+            return max(precisions) if precisions else None
+
+        rng = np.random.default_rng(0)
+        corpus = [
+            np.array([0.0, -0.0, 0.1 + 0.2, 1e-05, 1.5e-10, 5e-324, 1e22, 1e23]),
+            np.array([1.7976931348623157e308, 123456789.125, 2.0**60, 0.5]),
+            rng.random(200).astype(np.float32).astype(np.float64),
+            rng.integers(-(10**15), 10**15, 200) / 1000,
+        ]
+        for scale in (1e-20, 1e-4, 1.0, 1e6, 1e16, 1e300):
+            corpus.append(rng.random(200) * scale)
+            for decimals in (0, 2, 5, 9):
+                corpus.append(np.round(rng.random(200), decimals) * scale)
+
+        for values in corpus:
+            for series in [pd.Series(values)] + [
+                pd.Series(values[i : i + 1]) for i in range(0, len(values), 17)
+            ]:
+                expected = decimal_precision(series)
+                assert AttributeMetadater._infer_precision(series) == expected
+
+        # float32 values keep the decimals of their float64 repr,
+        # nullable Float32 values those of their float32 repr
+        values32 = np.array([-9.826997, 9.548303, 0.1], dtype=np.float32)
+        assert AttributeMetadater._infer_precision(pd.Series(values32)) == 17
+        assert AttributeMetadater._infer_precision(pd.Series(values32[2:])) == 17
+        assert (
+            AttributeMetadater._infer_precision(pd.Series(values32, dtype="Float32"))
+            == 6
+        )
+        assert (
+            AttributeMetadater._infer_precision(
+                pd.Series([0.1, 1.25, 3.3], dtype="Float32")
+            )
+            == 2
+        )
+        corpus32 = [
+            np.array([0.1, 0.25, 1e-45, 3.4e38, 16777217.0, 1.5e-07, -0.0]),
+            rng.integers(0, 2**32, 200, dtype=np.uint64)
+            .astype(np.uint32)
+            .view(np.float32),
+            rng.random(200),
+            rng.random(200) * 1e-06,
+        ]
+        for decimals in (0, 2, 5):
+            corpus32.append(np.round(rng.random(200), decimals) * 1e4)
+        for values in corpus32:
+            values = values.astype(np.float32)
+            values = values[np.isfinite(values)]
+            for dtype in ("float32", "Float32"):
+                for series in [pd.Series(values, dtype=dtype)] + [
+                    pd.Series(values[i : i + 1], dtype=dtype)
+                    for i in range(0, len(values), 17)
+                ]:
+                    expected = decimal_precision(series)
+                    assert AttributeMetadater._infer_precision(series) == expected
+        assert AttributeMetadater._infer_precision(pd.Series([np.inf, np.nan])) is None
+
+    def test_infer_precision_sample_size(self):
+        """測試以抽樣推斷精度"""
+        series = pd.Series([1.5] * 999 + [1.12345], name="value")
+        assert AttributeMetadater._infer_precision(series) == 5
+
+        sample = series.sample(n=10, random_state=0)
+        assert AttributeMetadater._infer_precision(
+            series, sample_size=10
+        ) == AttributeMetadater._infer_precision(sample)
+
+        schema = SchemaMetadater.from_data(series.to_frame(), precision_sample_size=10)
+        assert schema.attributes["value"].type_attr["precision"] == (
+            AttributeMetadater._infer_precision(sample)
+        )
+
     def test_schema_precision_preservation(self):
         """測試 Schema 層級的精度保留"""
         df = pd.DataFrame(
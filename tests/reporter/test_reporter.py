@@ -1200,6 +1200,21 @@ class TestReporterSaveTiming:
         for i, expected_col in enumerate(expected_start):
             assert actual_columns[i] == expected_col
 
+    def test_create_converts_cpu_time(self, sample_timing_data):
+        """測試 CPU 時間與執行時間一同轉換單位"""
+        sample_timing_data["cpu_seconds"] = [0.6, 1.2, 3.0]
+        sample_timing_data["output_rows"] = [100, 80, None]
+        config = {"method": "save_timing", "time_unit": "minutes"}
+        reporter = ReporterSaveTiming(config)
+
+        result_df = reporter.create({"timing_data": sample_timing_data})
+
+        assert "cpu_seconds" not in result_df.columns
+        assert list(result_df["cpu_minutes"]) == pytest.approx([0.01, 0.02, 0.05])
+        cols = list(result_df.columns)
+        assert cols.index("cpu_minutes") > cols.index("duration_minutes")
+        assert list(result_df["output_rows"][:2]) == [100, 80]
+
     def test_report_empty_result(self):
         """測試空結果的報告"""
         config = {"method": "save_timing"}
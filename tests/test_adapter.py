@@ -14,6 +14,8 @@ from petsard.adapter import (
     SynthesizerAdapter,
 )
 from petsard.exceptions import ConfigError
+from petsard.instrumentation import recording
+from petsard.loader import Splitter, SplitView
 from petsard.metadater import Schema
 
 
@@ -67,12 +69,15 @@ class TestBaseAdapter:
         config = {"method": "test"}
 
         class TestOperator(BaseAdapter):
+            _result_attr = "data"
+
             def __init__(self, config):
                 super().__init__(config)
                 self.run_called = False
 
             def _run(self, input):
                 self.run_called = True
+                self.data = input["data"].head(2)
 
             def set_input(self, status):
                 return {}
@@ -84,17 +89,26 @@ class TestBaseAdapter:
                 return Mock(spec=Schema)
 
         operator = TestOperator(config)
+        spans = []
 
-        with patch("time.time", side_effect=[1000.0, 1001.0, 1001.0]):
-            with patch.object(operator, "_logger") as mock_logger:
-                operator.run({})
+        with patch.object(operator, "_logger") as mock_logger:
+            with recording(spans.append, expt="test_exp"):
+                operator.run({"data": pd.DataFrame({"a": range(5), "b": range(5)})})
 
         assert operator.run_called
-
-        # 驗證計時 logging 訊息
-        mock_logger.info.assert_any_call("TIMING_START|TestOp|run|1000.0")
         mock_logger.info.assert_any_call("Starting TestOp execution")
-        mock_logger.info.assert_any_call("TIMING_END|TestOp|run|1001.0|1.0")
+
+        # 驗證計時 span
+        assert len(spans) == 1
+        run_span = spans[0]
+        assert run_span.module_name == "TestOp"
+        assert run_span.experiment_name == "test_exp"
+        assert run_span.step_name == "run"
+        assert run_span.status == "completed"
+        assert run_span.wall_seconds >= 0
+        assert run_span.cpu_seconds >= 0
+        assert (run_span.input_rows, run_span.input_cols) == (5, 2)
+        assert (run_span.output_rows, run_span.output_cols) == (2, 2)
 
     def test_log_and_raise_config_error_decorator(self):
         """測試配置錯誤裝飾器"""
@@ -154,18 +168,21 @@ class TestBaseAdapter:
                 return Mock(spec=Schema)
 
         operator = ErrorOperator(config)
+        spans = []
 
-        with patch("time.time", side_effect=[1000.0, 1001.5, 1001.5]):
-            with patch.object(operator, "_logger") as mock_logger:
+        with patch.object(operator, "_logger") as mock_logger:
+            with recording(spans.append):
                 with pytest.raises(ValueError, match="Test error"):
                     operator.run({})
 
-        # 驗證錯誤計時 logging 訊息
-        mock_logger.info.assert_any_call("TIMING_START|ErrorOp|run|1000.0")
         mock_logger.info.assert_any_call("Starting ErrorOp execution")
-        mock_logger.error.assert_any_call(
-            "TIMING_ERROR|ErrorOp|run|1001.5|1.5|Test error"
-        )
+
+        # 驗證錯誤計時 span
+        assert len(spans) == 1
+        assert spans[0].module_name == "ErrorOp"
+        assert spans[0].status == "error"
+        assert spans[0].error == "Test error"
+        assert spans[0].wall_seconds is not None
 
 
 class TestLoaderAdapter:
@@ -856,6 +873,100 @@ class TestSplitterAdapter:
             assert "train" in result
             assert "validation" in result
 
+    def test_get_result_materializes_lazy_views(self):
+        """測試延遲分割的 SplitView 於取得結果時實體化"""
+        data = pd.DataFrame({"A": list(range(10))})
+        schema = Schema(id="test", name="Test Schema", attributes={})
+        schema.enable_stats = False
+
+        operator = SplitterAdapter({"random_state": 42, "lazy": True})
+        operator._run({"data": data, "metadata": schema, "exist_train_indices": []})
+
+        assert isinstance(operator.data[1]["train"], SplitView)
+        result = operator.get_result()
+        assert isinstance(result["train"], pd.DataFrame)
+        assert isinstance(result["validation"], pd.DataFrame)
+        assert len(result["train"]) == 8
+        rows = result["train"]["A"].tolist() + result["validation"]["A"].tolist()
+        assert sorted(rows) == list(range(10))
+
+    def test_lazy_result_materialized_once(self):
+        """測試延遲分割只實體化一次，索引以集合回傳，詮釋資料共用"""
+        data = pd.DataFrame({"A": list(range(10))})
+        schema = Schema(id="test", name="Test Schema", attributes={})
+        schema.enable_stats = False
+
+        operator = SplitterAdapter({"random_state": 42, "lazy": True})
+        operator._run({"data": data, "metadata": schema, "exist_train_indices": []})
+
+        with patch.object(
+            SplitView, "materialize", autospec=True, side_effect=SplitView.materialize
+        ) as materialize:
+            first = operator.get_result()
+            second = operator.get_result()
+        assert materialize.call_count == 2  # train 與 validation 各一次
+        pd.testing.assert_frame_equal(first["train"], second["train"])
+
+        train_indices = operator.get_train_indices()
+        assert isinstance(train_indices[0], set)
+        assert train_indices[0] == set(operator.train_indices[0].tolist())
+        assert operator.get_metadata() is operator.metadata[1]["train"]
+
+    def test_run_in_batch_matches_sequential(self):
+        """測試展開的實驗以單次批次產生分割，結果與逐一分割相同"""
+        from petsard.config import Config
+
+        data = pd.DataFrame({"A": list(range(50))})
+        schema = Schema(id="test", name="Test Schema", attributes={})
+        schema.enable_stats = False
+        splitter_configs = Config(
+            {
+                "Splitter": {
+                    "split": {
+                        "num_samples": 4,
+                        "random_state": 42,
+                        "max_overlap_ratio": 0.9,
+                    }
+                }
+            }
+        ).yaml["Splitter"]
+
+        def run_all(configs):
+            status = Mock()
+            status.get_result.return_value = data
+            status.get_metadata.return_value = schema
+            status.get_exist_train_indices.return_value = exist = []
+            status.get_split_batches.return_value = {}
+            results = []
+            for config in configs:
+                operator = SplitterAdapter(config)
+                operator.run(operator.set_input(status))
+                exist.extend(operator.get_train_indices())
+                results.append(operator.get_result())
+            return exist, results
+
+        with patch.object(
+            Splitter, "split_batch", autospec=True, side_effect=Splitter.split_batch
+        ) as split_batch:
+            batch_indices, batch_results = run_all(splitter_configs.values())
+        split_batch.assert_called_once()
+
+        sequential_indices, sequential_results = run_all(
+            {key: value for key, value in config.items() if key != "_batch"}
+            for config in splitter_configs.values()
+        )
+        assert batch_indices == sequential_indices
+        assert len(set(map(frozenset, batch_indices))) == 4
+        for batch_result, sequential_result in zip(
+            batch_results, sequential_results, strict=True
+        ):
+            pd.testing.assert_frame_equal(
+                batch_result["train"], sequential_result["train"]
+            )
+            pd.testing.assert_frame_equal(
+                batch_result["validation"], sequential_result["validation"]
+            )
+
     def test_get_metadata(self):
         """測試元資料取得"""
         config = {"method": "random"}
@@ -870,18 +981,16 @@ class TestSplitterAdapter:
             metadata_dict = {1: {"train": mock_metadata, "validation": mock_metadata}}
             operator.metadata = metadata_dict
 
-            with patch(
-                "petsard.adapter.deepcopy", return_value=mock_metadata
-            ) as mock_deepcopy:
+            with patch("petsard.adapter.deepcopy") as mock_deepcopy:
                 result = operator.get_metadata()
 
-                mock_deepcopy.assert_called_once_with(mock_metadata)
-                assert result == mock_metadata
+                mock_deepcopy.assert_not_called()
+                assert result is mock_metadata
 
     def test_get_train_indices(self):
         """測試訓練索引取得"""
         config = {"method": "random"}
-        mock_train_indices = {1: [0, 1, 2], 2: [3, 4, 5]}
+        mock_train_indices = [{0, 1, 2}, {3, 4, 5}]
 
         with patch("petsard.adapter.Splitter") as mock_splitter_class:
             mock_splitter = Mock()
@@ -890,13 +999,10 @@ class TestSplitterAdapter:
             operator = SplitterAdapter(config)
             operator.train_indices = mock_train_indices
 
-            with patch(
-                "petsard.adapter.deepcopy", return_value=mock_train_indices
-            ) as mock_deepcopy:
-                result = operator.get_train_indices()
+            result = operator.get_train_indices()
 
-                mock_deepcopy.assert_called_once_with(mock_train_indices)
-                assert result == mock_train_indices
+            assert result == mock_train_indices
+            assert result[0] is not mock_train_indices[0]
 
 
 class TestPreprocessorAdapter:
@@ -1015,11 +1121,33 @@ class TestPreprocessorAdapter:
         operator = PreprocessorAdapter(config)
         operator.data_preproc = test_data
 
-        with patch("petsard.adapter.deepcopy", return_value=test_data) as mock_deepcopy:
+        result = operator.get_result()
+
+        assert result is not test_data
+        assert result.equals(test_data)
+
+        # 預設回傳獨立副本，修改結果不影響 Adapter 內部資料
+        result.loc[0, "A"] = 99
+        assert test_data.loc[0, "A"] == 1
+
+    def test_get_result_copy_on_write(self):
+        """測試 Copy-on-Write 模式下結果共用記憶體"""
+        import numpy as np
+
+        config = {"method": "default"}
+        test_data = pd.DataFrame({"A": [1, 2, 3]})
+
+        operator = PreprocessorAdapter(config)
+        operator.data_preproc = test_data
+
+        with pd.option_context("mode.copy_on_write", True):
             result = operator.get_result()
 
-            mock_deepcopy.assert_called_once_with(test_data)
-            assert result.equals(test_data)
+            assert result is not test_data
+            assert np.shares_memory(result["A"].to_numpy(), test_data["A"].to_numpy())
+
+            result.loc[0, "A"] = 99
+            assert test_data.loc[0, "A"] == 1
 
     def test_get_metadata(self):
         """測試元資料取得"""
@@ -1134,13 +1262,10 @@ class TestSynthesizerAdapter:
         operator = SynthesizerAdapter(config)
         operator.data_syn = synthetic_data
 
-        with patch(
-            "petsard.adapter.deepcopy", return_value=synthetic_data
-        ) as mock_deepcopy:
-            result = operator.get_result()
+        result = operator.get_result()
 
-            mock_deepcopy.assert_called_once_with(synthetic_data)
-            assert result.equals(synthetic_data)
+        assert result is not synthetic_data
+        assert result.equals(synthetic_data)
 
 
 class TestConstrainerAdapter:
@@ -1,7 +1,7 @@
 import queue
 from dataclasses import dataclass, field
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pandas as pd
 import pytest
@@ -9,7 +9,12 @@ import pytest
 from petsard.adapter import BaseAdapter
 from petsard.config import Config
 from petsard.config_base import BaseConfig, ConfigGetParamActionMap
-from petsard.exceptions import ConfigError, UnexecutedError
+from petsard.exceptions import (
+    BenchmarkDatasetsError,
+    ConfigError,
+    UnexecutedError,
+    UnsupportedMethodError,
+)
 from petsard.metadater.metadata import Schema
 from petsard.status import Status
 
@@ -75,6 +80,11 @@ class TestConfig:
         for expt_config in splitter_config.values():
             assert expt_config["num_samples"] == 1
 
+        # 檢查展開的實驗共用同一批次的分割
+        assert [expt_config["_batch"] for expt_config in splitter_config.values()] == [
+            {"group": "split_data", "index": n, "size": 3} for n in (1, 2, 3)
+        ]
+
     def test_set_flow(self):
         """測試流程設定
         Test flow setup"""
@@ -102,6 +112,72 @@ class TestConfig:
         assert modules == ["Loader", "Synthesizer"]
         assert expts == ["load_data", "synth_data"]
 
+    def test_set_flow_lazy_adapter(self):
+        """測試 Adapter 延遲建立
+        Test adapters are only built when taken out of the flow"""
+        config_dict = {
+            "Loader": {
+                "load_a": {"filepath": "a.csv"},
+                "load_b": {"filepath": "b.csv"},
+            },
+            "Describer": {"describe": {"method": "default", "source": "Loader"}},
+        }
+
+        config = Config(config_dict)
+
+        # 佇列中只有 (adapter class, config)，尚未建立 Adapter
+        # Only specs are queued, no adapter is built yet
+        from petsard.adapter import DescriberAdapter, LoaderAdapter
+
+        assert all(
+            isinstance(spec, tuple) and not isinstance(spec[0], BaseAdapter)
+            for spec in config.config.queue
+        )
+
+        # 每個分支都拿到獨立的 Adapter 與設定副本
+        # Each branch gets its own adapter on a private copy of the config
+        operators = [config.config.get() for _ in range(config.config.qsize())]
+        assert [type(op) for op in operators] == [
+            LoaderAdapter,
+            DescriberAdapter,
+            LoaderAdapter,
+            DescriberAdapter,
+        ]
+        assert operators[1] is not operators[3]
+        assert config_dict["Describer"]["describe"]["source"] == "Loader"
+
+    def test_set_flow_validates_config(self):
+        """測試每個實驗設定在建立流程時驗證一次
+        Test each experiment config is validated once when the flow is set"""
+        from petsard.adapter import EvaluatorAdapter
+
+        config_dict = {
+            "Loader": {
+                "load_a": {"filepath": "a.csv"},
+                "load_b": {"filepath": "b.csv"},
+            },
+            "Evaluator": {"eval": {"method": "default"}},
+        }
+        with patch.object(
+            EvaluatorAdapter, "validate", wraps=EvaluatorAdapter.validate
+        ) as validate:
+            Config(config_dict)
+        validate.assert_called_once_with({"method": "default"})
+
+        config_dict["Evaluator"]["eval"]["method"] = "no-such-method"
+        with pytest.raises(UnsupportedMethodError):
+            Config(config_dict)
+
+    def test_set_flow_validates_without_download(self):
+        """測試驗證 benchmark 設定時不下載資料集
+        Test benchmark configs are validated without downloading"""
+        with patch("petsard.loader.benchmarker.BenchmarkerRequests") as requests:
+            Config({"Loader": {"load": {"filepath": "benchmark://adult-income"}}})
+        requests.assert_not_called()
+
+        with pytest.raises(BenchmarkDatasetsError):
+            Config({"Loader": {"load": {"filepath": "benchmark://no-such-data"}}})
+
 
 class TestStatus:
     """測試 Status 類別"""
@@ -1,11 +1,11 @@
 import os
 import tempfile
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import yaml
 
-from petsard.exceptions import ConfigError
+from petsard.exceptions import ConfigError, UnsupportedMethodError
 from petsard.executor import Executor, ExecutorConfig
 
 
@@ -61,6 +61,14 @@ class TestExecutorConfig:
             config = ExecutorConfig(log_output_type=output_type)
             assert config.log_output_type == output_type
 
+    def test_max_workers(self):
+        """測試平行工作程序數量設定"""
+        assert ExecutorConfig().max_workers == 1
+        assert ExecutorConfig(max_workers=4).max_workers == 4
+
+        with pytest.raises(ConfigError):
+            ExecutorConfig(max_workers=0)
+
 
 class TestExecutor:
     """測試 Executor 類別"""
@@ -215,7 +223,8 @@ class TestExecutor:
                 # 設定模擬物件
                 mock_config = Mock()
                 mock_config.sequence = ["Loader", "Synthesizer"]  # 設定 sequence 屬性
-                mock_status = Mock()
+                # Status.recording() 為 context manager，需使用 MagicMock
+                mock_status = MagicMock()
                 mock_config_class.return_value = mock_config
                 mock_status_class.return_value = mock_status
 
@@ -443,6 +452,25 @@ class TestExecutorIntegration:
         finally:
             os.unlink(temp_file_path)
 
+    def test_invalid_method_fails_on_init(self, tmp_path):
+        """測試無效的方法在建立 Executor 時即失敗，而非執行到該步驟時"""
+        import pandas as pd
+
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"age": [20, 30, 40]}).to_csv(data_path, index=False)
+
+        with pytest.raises(UnsupportedMethodError):
+            Executor(
+                f"""
+Loader:
+  data:
+    filepath: '{data_path}'
+Evaluator:
+  eval:
+    method: no-such-method
+"""
+            )
+
     @patch("petsard.executor.time.time")
     def test_execution_timing(self, mock_time):
         """測試執行時間計算"""
@@ -489,5 +517,858 @@ class TestExecutorIntegration:
             os.unlink(config_file.name)
 
 
+class TestExecutorParallel:
+    """平行執行測試"""
+
+    @pytest.fixture
+    def workflow_yaml(self, tmp_path):
+        """建立可離線執行的多分支工作流程"""
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(0)
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame(
+            {
+                "age": rng.integers(18, 80, 200),
+                "income": rng.normal(5e4, 1e4, 200).round(2),
+                "job": rng.choice(["a", "b", "c"], 200),
+            }
+        ).to_csv(data_path, index=False)
+
+        def _yaml(max_workers: int) -> str:
+            return f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+  max_workers: {max_workers}
+Loader:
+  data:
+    filepath: '{data_path}'
+Splitter:
+  split:
+    num_samples: 2
+    random_state: 42
+Synthesizer:
+  full:
+    method: custom_data
+    filepath: '{data_path}'
+  head:
+    method: custom_data
+    filepath: '{data_path}'
+    sample_num_rows: 50
+Reporter:
+  save:
+    method: save_data
+    source: Synthesizer
+    output: '{tmp_path / f"workers{max_workers}"}'
+"""
+
+        return _yaml
+
+    def test_get_parallel_depths(self, workflow_yaml):
+        """測試分支切分位置：Splitter 之後平行，Reporter 延後至主程序"""
+        executor = Executor(workflow_yaml(2))
+
+        fanout_depth, deferred_depth = executor._get_parallel_depths()
+        assert executor.sequence[fanout_depth] == "Synthesizer"
+        assert executor.sequence[deferred_depth] == "Reporter"
+
+    def test_parallel_matches_serial(self, workflow_yaml):
+        """測試平行執行結果、快照順序與序列執行一致"""
+        import pandas as pd
+
+        serial = Executor(workflow_yaml(1))
+        serial.run()
+        parallel = Executor(workflow_yaml(2))
+        parallel.run()
+
+        assert parallel.is_execution_completed()
+
+        serial_result = serial.get_result()
+        parallel_result = parallel.get_result()
+        assert list(serial_result) == list(parallel_result)
+        assert len(serial_result) == 4
+        for expt_name, report in serial_result.items():
+            assert report.keys() == parallel_result[expt_name].keys()
+            for key, value in report.items():
+                pd.testing.assert_frame_equal(value, parallel_result[expt_name][key])
+
+        assert [
+            (snapshot.module_name, snapshot.experiment_name)
+            for snapshot in serial.status.snapshots
+        ] == [
+            (snapshot.module_name, snapshot.experiment_name)
+            for snapshot in parallel.status.snapshots
+        ]
+        assert serial.status.exist_train_indices == parallel.status.exist_train_indices
+
+    def test_parallel_run_releases_statuses(self, workflow_yaml):
+        """測試平行執行的工作 Status 結束後不殘留 logger handler"""
+        import logging
+
+        from petsard.executor import _run_branch
+
+        petsard_logger = logging.getLogger("PETsARD")
+        executor = Executor(workflow_yaml(2))
+        handlers = list(petsard_logger.handlers)
+
+        executor.run()
+        assert petsard_logger.handlers == handlers
+
+        _run_branch(executor.sequence, [], [], None, [])
+        assert petsard_logger.handlers == handlers
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_iter_run_streams_branches(self, workflow_yaml, max_workers):
+        """測試 iter_run 逐一產出分支結果，且結果與 run 相同"""
+        import pandas as pd
+
+        expected = Executor(workflow_yaml(1))
+        expected.run()
+
+        executor = Executor(workflow_yaml(max_workers))
+        branches = executor.iter_run()
+        full_expt_name, result, timing = next(branches)
+
+        # 第一個分支完成時，其餘分支尚未執行
+        assert full_expt_name == next(iter(expected.get_result()))
+        assert not executor.is_execution_completed()
+        if max_workers == 1:
+            assert executor.config.config.qsize() > 0
+
+        streamed = {full_expt_name: result}
+        timings = [timing]
+        for full_expt_name, result, timing in branches:
+            streamed[full_expt_name] = result
+            timings.append(timing)
+
+        assert executor.is_execution_completed()
+        assert executor.get_result() == {}
+        assert list(streamed) == list(expected.get_result())
+        for expt_name, report in expected.get_result().items():
+            for key, value in report.items():
+                pd.testing.assert_frame_equal(value, streamed[expt_name][key])
+
+        # 每個分支的計時只包含該分支上的步驟
+        for timing in timings:
+            runs = timing[timing["step_name"] == "run"]
+            assert list(runs["module_name"]) == [
+                "LoaderAdapter",
+                "SplitterAdapter",
+                "SynthesizerAdapter",
+                "ReporterAdapter",
+            ]
+            assert runs["experiment_name"].iloc[0] == "data"
+        assert [
+            timing.loc[timing["module_name"] == "SynthesizerAdapter", "experiment_name"]
+            .unique()
+            .tolist()
+            for timing in timings
+        ] == [["full"], ["head"], ["full"], ["head"]]
+
+
+class TestExecutorStageCache:
+    """階段快取測試"""
+
+    @pytest.fixture
+    def workflow_yaml(self, tmp_path):
+        """建立使用階段快取的工作流程"""
+        import pandas as pd
+
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"x": range(100), "y": [i % 3 for i in range(100)]}).to_csv(
+            data_path, index=False
+        )
+
+        def _yaml(sample_num_rows: int) -> str:
+            return f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+  cache_dir: '{tmp_path / "cache"}'
+Loader:
+  data:
+    filepath: '{data_path}'
+Splitter:
+  split:
+    num_samples: 2
+    random_state: 42
+Synthesizer:
+  synth:
+    method: custom_data
+    filepath: '{data_path}'
+    sample_num_rows: {sample_num_rows}
+"""
+
+        return _yaml
+
+    def test_cache_config(self):
+        """測試快取設定"""
+        config = ExecutorConfig()
+        assert config.cache_dir is None
+        assert config.cache_max_size_mb == 1024
+
+        with pytest.raises(ConfigError):
+            ExecutorConfig(cache_max_size_mb=0)
+
+    def test_rerun_loads_from_cache(self, workflow_yaml, tmp_path):
+        """測試重新執行時由快取載入，不再執行各階段"""
+        import pandas as pd
+
+        from petsard.adapter import LoaderAdapter, SplitterAdapter, SynthesizerAdapter
+
+        first = Executor(workflow_yaml(10))
+        first.run()
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 5
+
+        second = Executor(workflow_yaml(10))
+        with (
+            patch.object(LoaderAdapter, "_run") as loader_run,
+            patch.object(SplitterAdapter, "_run") as splitter_run,
+            patch.object(SynthesizerAdapter, "_run") as synthesizer_run,
+        ):
+            second.run()
+        loader_run.assert_not_called()
+        splitter_run.assert_not_called()
+        synthesizer_run.assert_not_called()
+
+        assert list(first.get_result()) == list(second.get_result())
+        for expt_name, data in first.get_result().items():
+            pd.testing.assert_frame_equal(data, second.get_result()[expt_name])
+        assert first.status.exist_train_indices == second.status.exist_train_indices
+
+    def test_changed_config_invalidates_downstream(self, workflow_yaml, tmp_path):
+        """測試設定變更只重新執行受影響的階段"""
+        from petsard.adapter import SplitterAdapter, SynthesizerAdapter
+
+        Executor(workflow_yaml(10)).run()
+
+        executor = Executor(workflow_yaml(20))
+        with (
+            patch.object(SplitterAdapter, "_run") as splitter_run,
+            patch.object(
+                SynthesizerAdapter,
+                "_run",
+                autospec=True,
+                side_effect=SynthesizerAdapter._run,
+            ) as synthesizer_run,
+        ):
+            executor.run()
+        splitter_run.assert_not_called()
+        assert synthesizer_run.call_count == 2
+        assert all(len(data) == 20 for data in executor.get_result().values())
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 7
+
+    def test_unseeded_splitter_not_cached(self, workflow_yaml, tmp_path):
+        """測試未設定 random_state 的 Splitter 與其下游階段不使用快取"""
+        from petsard.adapter import SplitterAdapter, SynthesizerAdapter
+
+        unseeded_yaml = workflow_yaml(10).replace("    random_state: 42\n", "")
+        Executor(unseeded_yaml).run()
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+        executor = Executor(unseeded_yaml)
+        with (
+            patch.object(
+                SplitterAdapter,
+                "_run",
+                autospec=True,
+                side_effect=SplitterAdapter._run,
+            ) as splitter_run,
+            patch.object(
+                SynthesizerAdapter,
+                "_run",
+                autospec=True,
+                side_effect=SynthesizerAdapter._run,
+            ) as synthesizer_run,
+        ):
+            executor.run()
+        assert splitter_run.call_count == 2
+        assert synthesizer_run.call_count == 2
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    def test_serial_fallback_uses_cache(self, tmp_path):
+        """測試設定 max_workers 但無分支可平行時，序列執行仍使用快取"""
+        import pandas as pd
+
+        from petsard.adapter import LoaderAdapter
+
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"x": range(100)}).to_csv(data_path, index=False)
+        workflow = f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+  cache_dir: '{tmp_path / "cache"}'
+  max_workers: 2
+Loader:
+  data:
+    filepath: '{data_path}'
+Reporter:
+  save:
+    method: save_data
+    source: Loader
+    output: '{tmp_path / "output"}'
+"""
+        Executor(workflow).run()
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+        with patch.object(LoaderAdapter, "_run") as loader_run:
+            Executor(workflow).run()
+        loader_run.assert_not_called()
+
+    def test_no_key_past_last_cacheable_module(self, tmp_path):
+        """測試最後一個可快取模組之後的步驟不計算快取鍵"""
+        import pandas as pd
+
+        from petsard.cache import StageCache
+
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"x": range(100)}).to_csv(data_path, index=False)
+        workflow = f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+  cache_dir: '{tmp_path / "cache"}'
+Loader:
+  data:
+    filepath: '{data_path}'
+Reporter:
+  save:
+    method: save_data
+    source: Loader
+    output: '{tmp_path / "output"}'
+"""
+        with patch.object(
+            StageCache, "make_key", autospec=True, side_effect=StageCache.make_key
+        ) as make_key:
+            Executor(workflow).run()
+        assert [call.args[1] for call in make_key.call_args_list] == ["Loader"]
+
+    def test_splitter_key_tracks_exist_train_indices(self, tmp_path):
+        """測試 Splitter 快取鍵隨既有訓練索引改變"""
+        import numpy as np
+
+        from petsard.adapter import SplitterAdapter
+        from petsard.cache import StageCache
+
+        stage_cache = StageCache(cache_dir=str(tmp_path / "cache"))
+        spec = (SplitterAdapter, {"num_samples": 1, "random_state": 42})
+
+        def _key(exist_train_indices) -> str:
+            status = Mock(exist_train_indices=exist_train_indices)
+            return stage_cache.make_key("Splitter", spec, "", status)
+
+        assert _key([{3, 1, 2}]) == _key([np.array([1, 2, 3])])
+        assert _key([{1, 2}, {3}]) != _key([{1}, {2, 3}])
+        assert _key([{1, 2, 3}]) != _key([])
+
+    def test_lru_eviction(self, tmp_path):
+        """測試超過容量上限時淘汰最久未使用的項目"""
+        import time
+
+        from petsard.cache import StageCache
+
+        stage_cache = StageCache(cache_dir=str(tmp_path / "cache"), max_size_mb=1)
+        payload = "x" * (400 * 1024)
+
+        stage_cache.save("a", payload)
+        time.sleep(0.01)
+        stage_cache.save("b", payload)
+        time.sleep(0.01)
+        assert stage_cache.load("a") == payload  # a becomes most recently used
+        time.sleep(0.01)
+        stage_cache.save("c", payload)
+
+        assert stage_cache.load("b") is None
+        assert stage_cache.load("a") == payload
+        assert stage_cache.load("c") == payload
+
+
+class TestExecutorCheckpoint:
+    """檢查點與續跑測試"""
+
+    @pytest.fixture
+    def workflow_yaml(self, tmp_path):
+        """建立記錄檢查點的工作流程"""
+        import pandas as pd
+
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"x": range(100), "y": [i % 3 for i in range(100)]}).to_csv(
+            data_path, index=False
+        )
+
+        def _yaml(checkpoint: bool = True) -> str:
+            checkpoint_line = (
+                f"  checkpoint_dir: '{tmp_path / 'checkpoint'}'" if checkpoint else ""
+            )
+            return f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+{checkpoint_line}
+Loader:
+  data:
+    filepath: '{data_path}'
+Splitter:
+  split:
+    num_samples: 2
+    random_state: 42
+Synthesizer:
+  full:
+    method: custom_data
+    filepath: '{data_path}'
+  head:
+    method: custom_data
+    filepath: '{data_path}'
+    sample_num_rows: 10
+"""
+
+        return _yaml
+
+    def test_resume_skips_completed_branches(self, workflow_yaml, tmp_path):
+        """測試中斷後續跑只執行未完成的分支"""
+        import pandas as pd
+
+        from petsard.adapter import SynthesizerAdapter
+
+        expected = Executor(workflow_yaml(checkpoint=False))
+        expected.run()
+
+        calls: list = []
+
+        def _fail_third_call(self, input):
+            calls.append(self)
+            if len(calls) == 3:
+                raise MemoryError("simulated crash")
+            return original_run(self, input)
+
+        original_run = SynthesizerAdapter._run
+        interrupted = Executor(workflow_yaml())
+        with (
+            patch.object(SynthesizerAdapter, "_run", _fail_third_call),
+            pytest.raises(MemoryError),
+        ):
+            interrupted.run()
+        assert len(interrupted.get_result()) == 2
+
+        resumed = Executor(workflow_yaml())
+        with patch.object(
+            SynthesizerAdapter, "_run", autospec=True, side_effect=original_run
+        ) as synthesizer_run:
+            resumed.resume(str(tmp_path / "checkpoint"))
+        assert synthesizer_run.call_count == 2
+        assert resumed.is_execution_completed()
+
+        assert list(resumed.get_result()) == list(expected.get_result())
+        for expt_name, data in expected.get_result().items():
+            pd.testing.assert_frame_equal(data, resumed.get_result()[expt_name])
+
+    def test_resume_requires_matching_checkpoint(self, workflow_yaml, tmp_path):
+        """測試檢查點不存在或設定不符時拋出錯誤"""
+        with pytest.raises(ConfigError):
+            Executor(workflow_yaml()).resume(str(tmp_path / "missing"))
+
+        Executor(workflow_yaml()).run()
+        changed = Executor(
+            workflow_yaml().replace("random_state: 42", "random_state: 7")
+        )
+        with pytest.raises(ConfigError):
+            changed.resume()
+
+    def test_index_records_completed_branches_only(self, workflow_yaml, tmp_path):
+        """測試檢查點索引只記錄完成的分支，不隨快照數量成長"""
+        import json
+
+        executor = Executor(workflow_yaml())
+        executor.run()
+
+        with open(tmp_path / "checkpoint" / "index.json", encoding="utf-8") as f:
+            index = json.load(f)
+        assert set(index) == {"config_digest", "completed"}
+        assert len(index["completed"]) == len(executor.get_result())
+
+
+class TestExecutorCopyOnWrite:
+    """Copy-on-Write 資料交接測試"""
+
+    @pytest.fixture
+    def workflow_yaml(self, tmp_path):
+        """建立涵蓋各資料處理模組的工作流程"""
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(0)
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame(
+            {
+                "age": rng.integers(18, 80, 200),
+                "income": rng.normal(5e4, 1e4, 200).round(2),
+                "job": rng.choice(["a", "b", "c"], 200),
+            }
+        ).to_csv(data_path, index=False)
+
+        def _yaml(copy_on_write: bool) -> str:
+            return f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+  copy_on_write: {str(copy_on_write).lower()}
+Loader:
+  data:
+    filepath: '{data_path}'
+Splitter:
+  split:
+    num_samples: 1
+    random_state: 42
+Preprocessor:
+  preproc:
+    method: default
+Synthesizer:
+  synth:
+    method: petsard-gaussian_copula
+Postprocessor:
+  postproc:
+    method: default
+Evaluator:
+  eval:
+    method: default
+Reporter:
+  save:
+    method: save_data
+    source: Postprocessor
+    output: '{tmp_path / "result"}'
+"""
+
+        return _yaml
+
+    @pytest.mark.parametrize("copy_on_write", [False, True])
+    def test_stages_do_not_mutate_inputs(self, workflow_yaml, copy_on_write):
+        """測試任何模組都不會修改上游交付的資料"""
+        import pandas as pd
+
+        from petsard.adapter import BaseAdapter
+
+        def _frames(obj) -> list:
+            if isinstance(obj, pd.DataFrame):
+                return [obj]
+            if isinstance(obj, dict):
+                return [frame for value in obj.values() for frame in _frames(value)]
+            return []
+
+        def _fingerprint(frame: pd.DataFrame) -> tuple:
+            return (
+                tuple(frame.columns),
+                tuple(str(dtype) for dtype in frame.dtypes),
+                int(pd.util.hash_pandas_object(frame, index=True).sum()),
+            )
+
+        mutated: list[str] = []
+        original_run = BaseAdapter.run
+
+        def _guarded_run(self, input):
+            frames = _frames(input)
+            before = [_fingerprint(frame) for frame in frames]
+            original_run(self, input)
+            if before != [_fingerprint(frame) for frame in frames]:
+                mutated.append(self.module_name)
+
+        executor = Executor(workflow_yaml(copy_on_write))
+        with patch.object(BaseAdapter, "run", _guarded_run):
+            executor.run()
+
+        assert executor.is_execution_completed()
+        assert mutated == []
+
+    def test_handoff_shares_memory(self, workflow_yaml):
+        """測試啟用 Copy-on-Write 時交接不複製資料，且下游修改不影響上游"""
+        import numpy as np
+        import pandas as pd
+
+        executor = Executor(workflow_yaml(True))
+        executor.run()
+
+        # 執行結束後已還原設定，於 Copy-on-Write 下重現執行期間的交接
+        loader = executor.status.status["Loader"]["operator"]
+        with pd.option_context("mode.copy_on_write", True):
+            handed_off = executor.status.get_result("Loader")
+            assert handed_off is not loader.data
+            assert np.shares_memory(
+                handed_off["income"].to_numpy(), loader.data["income"].to_numpy()
+            )
+
+            original_value = loader.data.loc[0, "income"]
+            handed_off.loc[0, "income"] = -1.0
+            assert loader.data.loc[0, "income"] == original_value
+
+    def test_option_restored_after_run(self, workflow_yaml):
+        """測試執行結束後還原呼叫端的 pandas Copy-on-Write 設定"""
+        import pandas as pd
+
+        original = pd.options.mode.copy_on_write
+        Executor(workflow_yaml(True)).run()
+
+        assert pd.options.mode.copy_on_write == original
+
+
+class TestExecutorMemoryBudget:
+    """Status 記憶體預算測試"""
+
+    def test_memory_budget_matches_unbounded_run(self, tmp_path):
+        """測試設定記憶體預算時結果與不設定相同"""
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(0)
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"x": rng.random(20_000), "y": rng.integers(0, 5, 20_000)}).to_csv(
+            data_path, index=False
+        )
+
+        def _yaml(memory_budget: str) -> str:
+            return f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+{memory_budget}
+Loader:
+  data:
+    filepath: '{data_path}'
+Splitter:
+  split:
+    num_samples: 2
+    random_state: 42
+Synthesizer:
+  synth:
+    method: custom_data
+    filepath: '{data_path}'
+"""
+
+        unbounded = Executor(_yaml(""))
+        unbounded.run()
+        bounded = Executor(
+            _yaml(f"  memory_budget_mb: 1\n  spill_dir: '{tmp_path / 'spill'}'")
+        )
+        bounded.run()
+
+        assert bounded.status.memory_budget == 1024 * 1024
+        assert any((tmp_path / "spill").iterdir())
+        assert list(unbounded.get_result()) == list(bounded.get_result())
+        for expt_name, data in unbounded.get_result().items():
+            pd.testing.assert_frame_equal(data, bounded.get_result()[expt_name])
+        assert (
+            unbounded.status.exist_train_indices == bounded.status.exist_train_indices
+        )
+
+
+class TestExecutorTiming:
+    """結構化計時與資源指標測試"""
+
+    def test_timing_records_resource_metrics(self, tmp_path):
+        """測試每個模組與合成、評測子步驟皆記錄時間、CPU、記憶體與資料形狀"""
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(0)
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame(
+            {
+                "age": rng.integers(18, 80, 200),
+                "income": rng.normal(5e4, 1e4, 200).round(2),
+                "job": rng.choice(["a", "b", "c"], 200),
+            }
+        ).to_csv(data_path, index=False)
+
+        executor = Executor(f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+  trace_memory: true
+Loader:
+  data:
+    filepath: '{data_path}'
+Splitter:
+  split:
+    num_samples: 1
+    random_state: 42
+Preprocessor:
+  default:
+    method: default
+Synthesizer:
+  synth:
+    method: petsard-gaussian-copula
+Postprocessor:
+  default:
+    method: default
+Evaluator:
+  eval:
+    method: mlutility-regression
+    target: income
+""")
+        executor.run()
+
+        timing = executor.get_timing()
+        assert set(timing["source"]) == {"span"}
+        assert set(timing["status"]) == {"completed"}
+
+        runs = timing[timing["step_name"] == "run"].set_index("module_name")
+        assert list(runs.index) == [
+            "LoaderAdapter",
+            "SplitterAdapter",
+            "PreprocessorAdapter",
+            "SynthesizerAdapter",
+            "PostprocessorAdapter",
+            "EvaluatorAdapter",
+        ]
+        assert (runs["cpu_seconds"] >= 0).all()
+        assert (runs["peak_rss_mb"] > 0).all()
+        assert runs["memory_peak_mb"].notna().all()
+        assert runs.loc["LoaderAdapter", "output_rows"] == 200
+        assert runs.loc["SplitterAdapter", "input_rows"] == 200
+        assert runs.loc["PreprocessorAdapter", "input_rows"] == 160
+        assert runs.loc["SynthesizerAdapter", "output_cols"] == 3
+
+        sub_steps = timing[timing["parent_step"] == "run"]
+        assert set(
+            zip(sub_steps["module_name"], sub_steps["step_name"], strict=True)
+        ) >= {
+            ("SynthesizerAdapter", "fit"),
+            ("SynthesizerAdapter", "sample"),
+            ("EvaluatorAdapter", "eval"),
+        }
+        assert (sub_steps["experiment_name"] != "default").all()
+
+
+class TestExecutorPlan:
+    """執行前規劃（dry run）測試"""
+
+    @pytest.fixture
+    def workflow_yaml(self, tmp_path):
+        """建立可離線執行的多分支工作流程"""
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(0)
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame(
+            {
+                "age": rng.integers(18, 80, 200),
+                "income": rng.normal(5e4, 1e4, 200).round(2),
+                "job": rng.choice(["a", "b", "c"], 200),
+            }
+        ).to_csv(data_path, index=False)
+
+        def _yaml(random_state: int = 42) -> str:
+            return f"""
+Executor:
+  log_output_type: stdout
+  log_level: WARNING
+  max_workers: 2
+  timing_history: '{tmp_path / "history.json"}'
+Loader:
+  data:
+    filepath: '{data_path}'
+Splitter:
+  split:
+    num_samples: 2
+    random_state: {random_state}
+Synthesizer:
+  full:
+    method: custom_data
+    filepath: '{data_path}'
+  head:
+    method: custom_data
+    filepath: '{data_path}'
+    sample_num_rows: 50
+"""
+
+        return _yaml
+
+    def test_plan_expands_without_running(self, workflow_yaml, tmp_path):
+        """測試規劃展開分支與執行次數，且不執行任何模組"""
+        executor = Executor(workflow_yaml())
+        plan = executor.plan()
+
+        assert plan.n_branches == 4
+        assert plan.max_workers == 2
+        stages = plan.stages.set_index(["module", "experiment"])
+        assert stages.loc[("Loader", "data"), "executions"] == 1
+        assert stages.loc[("Splitter", "split_[2-1]"), "executions"] == 1
+        assert stages.loc[("Synthesizer", "full"), "executions"] == 2
+        assert stages.loc[("Synthesizer", "head"), "executions"] == 2
+
+        # 由 Loader 檔案推估資料形狀
+        assert stages.loc[("Loader", "data"), "output_rows"] == 200
+        assert stages.loc[("Loader", "data"), "output_cols"] == 3
+        assert stages.loc[("Splitter", "split_[2-1]"), "output_rows"] == 160
+        assert stages.loc[("Synthesizer", "head"), "output_rows"] == 50
+        assert (plan.stages["est_memory_mb"] > 0).all()
+
+        # 沒有歷史紀錄時無法估計時間
+        assert plan.est_total_seconds == 0
+        assert len(plan.unestimated_stages) == len(plan.stages)
+
+        # 規劃不消耗流程，也不執行模組
+        assert executor.config.config.qsize() == 7
+        assert executor.get_timing().empty
+        assert not (tmp_path / "history.json").exists()
+
+        executor.run()
+        assert len(executor.get_result()) == 4
+
+    def test_plan_estimates_from_timing_history(self, workflow_yaml, tmp_path):
+        """測試以先前執行的計時紀錄估計時間"""
+        Executor(workflow_yaml()).run()
+        assert (tmp_path / "history.json").exists()
+
+        plan = Executor(workflow_yaml()).plan()
+        assert set(plan.stages["estimate_source"]) == {"history"}
+        assert plan.unestimated_stages == []
+        assert plan.est_total_seconds > 0
+        assert plan.est_parallel_seconds <= plan.est_total_seconds
+        assert plan.est_total_seconds == pytest.approx(
+            plan.stages["est_total_seconds"].sum()
+        )
+
+        # 設定不同時，以相同模組與方法的紀錄依資料量縮放
+        changed = Executor(workflow_yaml(random_state=7)).plan()
+        assert set(changed.stages["estimate_source"]) == {"scaled"}
+        assert changed.est_total_seconds > 0
+
+    def test_plan_probes_loader_files(self, tmp_path):
+        """測試不讀取整個檔案即可推估 CSV 與欄式檔案的資料形狀"""
+        import pandas as pd
+
+        from petsard.planner import ExecutionPlanner
+
+        data = pd.DataFrame({"x": range(10000, 15000), "y": ["abc"] * 5000})
+        data.to_csv(tmp_path / "data.csv", index=False)
+        data.to_parquet(tmp_path / "data.parquet")
+        data.to_feather(tmp_path / "data.feather")
+        data.to_csv(tmp_path / "data.tsv", sep="\t", index=False)
+
+        planner = ExecutionPlanner(sequence=["Loader"], flow=[], fanout_depth=0)
+        for name in ["data.parquet", "data.feather"]:
+            shape = planner._probe_loader_shape({"filepath": str(tmp_path / name)})
+            assert shape == (5000, 2)
+
+        # CSV 列數由前幾列的平均位元組數推估
+        rows, cols = planner._probe_loader_shape(
+            {"filepath": str(tmp_path / "data.csv")}
+        )
+        assert rows == pytest.approx(5000, rel=0.01)
+        assert cols == 2
+        assert planner._probe_loader_shape(
+            {"filepath": str(tmp_path / "data.csv"), "nrows": 100}
+        ) == (100, 2)
+
+        # LoaderFileExt 不支援的副檔名不推估
+        assert (
+            planner._probe_loader_shape({"filepath": str(tmp_path / "data.tsv")})
+            is None
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
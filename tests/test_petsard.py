@@ -6,7 +6,10 @@ using the same YAML configurations as the demo examples, ensuring that
 the overall system functionality works as expected.
 """
 
+import json
 import os
+import subprocess
+import sys
 import tempfile
 
 import pandas as pd
@@ -23,6 +26,49 @@ def temp_output_dir():
         yield temp_dir
 
 
+class TestPETsARDImport:
+    """Guard the import time of PETsARD against heavy eager imports."""
+
+    HEAVY_MODULES = [
+        "torch",
+        "numba",
+        "sdv",
+        "sdmetrics",
+        "anonymeter",
+        "xgboost",
+        "sklearn",
+    ]
+    # Import time of PETsARD on top of pandas, generous to absorb slow runners
+    MAX_IMPORT_SECONDS = 2.0
+
+    def _import_petsard(self) -> dict:
+        """Import petsard in a fresh interpreter, reporting the time and heavy modules."""
+        script = (
+            "import json, sys, time\n"
+            "import pandas\n"
+            "start = time.perf_counter()\n"
+            "import petsard\n"
+            "seconds = time.perf_counter() - start\n"
+            f"heavy = [m for m in {self.HEAVY_MODULES!r} if m in sys.modules]\n"
+            "print(json.dumps({'seconds': seconds, 'heavy': heavy}))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_import_skips_heavy_dependencies(self):
+        """Test that importing petsard does not load heavy optional dependencies."""
+        assert self._import_petsard()["heavy"] == []
+
+    def test_import_time(self):
+        """Test that importing petsard stays within the import time budget."""
+        assert self._import_petsard()["seconds"] < self.MAX_IMPORT_SECONDS
+
+
 class TestPETsARDFunctionalWorkflows:
     """Test complete PETsARD workflows using demo YAML configurations."""
 
@@ -2,14 +2,17 @@
 測試新的 Status 快照功能
 """
 
-from unittest.mock import Mock
+import os
+from unittest.mock import Mock, patch
 
 import pandas as pd
+import pytest
 
 from petsard.adapter import BaseAdapter
 from petsard.config import Config
 from petsard.metadater.metadata import Schema
-from petsard.status import Status
+from petsard.metadater.metadater import SchemaMetadater
+from petsard.status import SpilledOperator, Status
 
 
 class TestStatusSnapshots:
@@ -155,76 +158,69 @@ class TestStatusTiming:
         self.config = Config(config_dict)
         self.status = Status(self.config)
 
-    def test_timing_log_handler_setup(self):
-        """測試 TimingLogHandler 設置"""
+    def test_no_timing_log_handler(self):
+        """測試 Status 不在共用的 PETsARD logger 上附加 handler"""
         import logging
 
-        # 檢查 handler 是否正確設置
-        assert self.status._timing_handler is not None
-        assert isinstance(self.status._timing_handler, logging.Handler)
-
-        # 檢查是否添加到 PETsARD logger
-        petsard_logger = logging.getLogger("PETsARD")
-        assert self.status._timing_handler in petsard_logger.handlers
-
-    def test_timing_message_parsing(self):
-        """測試時間訊息解析"""
-        import logging
-
-        # 確保 PETsARD logger 級別設置正確
         petsard_logger = logging.getLogger("PETsARD")
-        petsard_logger.setLevel(logging.INFO)
-
-        # 建立測試 log record
-        logger = logging.getLogger("PETsARD.test")
+        handlers = list(petsard_logger.handlers)
 
-        # 設置實驗名稱映射
-        self.status._current_experiments["TestAdapter"] = "test_exp"
+        Status(self.config)
 
-        # 模擬開始計時訊息
-        start_time = 1000.0
-        logger.info(f"TIMING_START|TestAdapter|run|{start_time}")
+        assert petsard_logger.handlers == handlers
 
-        # 檢查是否有活躍的計時記錄
+    def test_start_end_timing(self):
+        """測試以 start_timing / end_timing 記錄時間"""
+        self.status.start_timing("TestAdapter", "test_exp", "run")
         timing_key = "TestAdapter_test_exp_run"
         assert timing_key in self.status._active_timings
 
-        # 模擬結束計時訊息
-        end_time = 1001.5
-        duration = 1.5
-        logger.info(f"TIMING_END|TestAdapter|run|{end_time}|{duration}")
+        record = self.status.end_timing(
+            "TestAdapter", "test_exp", "run", context={"status": "completed"}
+        )
 
         # 檢查計時記錄是否完成
         assert timing_key not in self.status._active_timings
-        timing_records = self.status.get_timing_records()
-        assert len(timing_records) == 1
-
-        record = timing_records[0]
+        assert list(self.status.get_timing_records()) == [record]
         assert record.module_name == "TestAdapter"
         assert record.experiment_name == "test_exp"
         assert record.step_name == "run"
-        assert record.duration_seconds == duration
+        assert record.duration_seconds >= 0
         assert record.context["status"] == "completed"
 
-    def test_timing_error_handling(self):
-        """測試錯誤情況下的計時記錄"""
-        import logging
+        # 未開始的計時不產生記錄
+        assert self.status.end_timing("TestAdapter", "test_exp", "fit") is None
 
-        # 確保 PETsARD logger 級別設置正確
-        petsard_logger = logging.getLogger("PETsARD")
-        petsard_logger.setLevel(logging.INFO)
+    def test_timing_record_complete_keeps_metrics(self):
+        """測試完成計時記錄時保留資源指標"""
+        from datetime import datetime
 
-        logger = logging.getLogger("PETsARD.test")
-        self.status._current_experiments["ErrorAdapter"] = "error_exp"
+        from petsard.status import TimingRecord
 
-        # 模擬錯誤計時訊息
-        start_time = 1000.0
-        end_time = 1001.0
-        duration = 1.0
-        error_msg = "Test error"
+        record = TimingRecord(
+            record_id="timing_000001",
+            module_name="SynthesizerAdapter",
+            experiment_name="synth",
+            step_name="fit",
+            start_time=datetime(2024, 1, 1, 10, 0, 0),
+            cpu_seconds=1.25,
+            input_rows=10,
+            parent_step="run",
+        ).complete(end_time=datetime(2024, 1, 1, 10, 0, 2))
 
-        logger.info(f"TIMING_START|ErrorAdapter|run|{start_time}")
-        logger.info(f"TIMING_ERROR|ErrorAdapter|run|{end_time}|{duration}|{error_msg}")
+        assert record.duration_seconds == 2.0
+        assert record.cpu_seconds == 1.25
+        assert record.input_rows == 10
+        assert record.parent_step == "run"
+
+    def test_timing_error_handling(self):
+        """測試錯誤情況下的計時記錄"""
+        from petsard.instrumentation import span
+
+        with pytest.raises(ValueError):
+            with self.status.recording("error_exp"):
+                with span("run", module="ErrorAdapter"):
+                    raise ValueError("Test error")
 
         # 檢查錯誤記錄
         timing_records = self.status.get_timing_records()
@@ -232,39 +228,22 @@ class TestStatusTiming:
 
         record = timing_records[0]
         assert record.context["status"] == "error"
-        # Error message format has changed, no longer in context["error"]
-        # assert record.context["error"] == error_msg
-        assert record.duration_seconds == duration
+        assert record.context["error"] == "Test error"
+        assert record.duration_seconds >= 0
 
     def test_get_timing_records_filtering(self):
         """測試時間記錄過濾"""
-        import logging
-
-        # 確保 PETsARD logger 級別設置正確
-        petsard_logger = logging.getLogger("PETsARD")
-        petsard_logger.setLevel(logging.INFO)
-
-        logger = logging.getLogger("PETsARD.test")
-
-        # 設置多個模組的實驗名稱
-        self.status._current_experiments.update(
-            {"LoaderAdapter": "load_exp", "SynthesizerAdapter": "synth_exp"}
-        )
+        from petsard.instrumentation import span
 
         # 模擬多個模組的計時
-        modules = [
-            ("LoaderAdapter", "load_exp", 1.0),
-            ("SynthesizerAdapter", "synth_exp", 2.0),
-            ("LoaderAdapter", "load_exp", 1.5),  # 同一模組的另一次執行
-        ]
-
-        start_time = 1000.0
-        for i, (module, _exp, duration) in enumerate(modules):
-            current_start = start_time + i * 10
-            current_end = current_start + duration
-
-            logger.info(f"TIMING_START|{module}|run|{current_start}")
-            logger.info(f"TIMING_END|{module}|run|{current_end}|{duration}")
+        for module, expt in [
+            ("LoaderAdapter", "load_exp"),
+            ("SynthesizerAdapter", "synth_exp"),
+            ("LoaderAdapter", "load_exp"),  # 同一模組的另一次執行
+        ]:
+            with self.status.recording(expt):
+                with span("run", module=module):
+                    pass
 
         # 測試所有記錄
         all_records = self.status.get_timing_records()
@@ -278,23 +257,15 @@ class TestStatusTiming:
         synth_records = self.status.get_timing_records("SynthesizerAdapter")
         assert len(synth_records) == 1
         assert synth_records[0].module_name == "SynthesizerAdapter"
+        assert synth_records[0].experiment_name == "synth_exp"
 
     def test_get_timing_report_data(self):
         """測試時間報告資料格式"""
-        import logging
-
-        import pandas as pd
+        from petsard.instrumentation import span
 
-        # 確保 PETsARD logger 級別設置正確
-        petsard_logger = logging.getLogger("PETsARD")
-        petsard_logger.setLevel(logging.INFO)
-
-        logger = logging.getLogger("PETsARD.test")
-        self.status._current_experiments["TestAdapter"] = "test_exp"
-
-        # 模擬計時記錄
-        logger.info("TIMING_START|TestAdapter|run|1000.0")
-        logger.info("TIMING_END|TestAdapter|run|1001.5|1.5")
+        with self.status.recording("test_exp"):
+            with span("run", module="TestAdapter"):
+                pass
 
         # 取得 DataFrame 格式
         timing_df = self.status.get_timing_report_data()
@@ -322,10 +293,116 @@ class TestStatusTiming:
         assert row["module_name"] == "TestAdapter"
         assert row["experiment_name"] == "test_exp"
         assert row["step_name"] == "run"
-        assert row["duration_seconds"] == 1.5
-        assert row["source"] == "logging"
+        assert row["duration_seconds"] >= 0
+        assert row["source"] == "span"
         assert row["status"] == "completed"
 
+    def test_add_timing_records(self):
+        """測試合併其他 Status（如平行工作程序）的時間記錄"""
+        from datetime import datetime
+
+        from petsard.status import TimingRecord
+
+        record = TimingRecord(
+            record_id="timing_000001_worker",
+            module_name="SynthesizerAdapter",
+            experiment_name="synth",
+            step_name="run",
+            start_time=datetime(2024, 1, 1, 10, 0, 0),
+            end_time=datetime(2024, 1, 1, 10, 0, 2),
+            duration_seconds=2.0,
+        )
+
+        self.status.add_timing_records([record, record])
+
+        timing_records = self.status.get_timing_records()
+        assert len(timing_records) == 2
+        assert timing_records[0].record_id != timing_records[1].record_id
+        assert all(r.duration_seconds == 2.0 for r in timing_records)
+
+    def test_recording_spans(self):
+        """測試以 span 記錄時間與資源指標（含子步驟）"""
+        from petsard.instrumentation import span
+
+        data = pd.DataFrame({"a": range(10), "b": range(10)})
+
+        with self.status.recording("synth"):
+            with span("run", module="SynthesizerAdapter") as run_span:
+                run_span.set_input(data)
+                with span("fit") as fit_span:
+                    fit_span.set_input(data)
+                run_span.set_output({"train": data.head(8), "validation": data})
+
+        # 子步驟先結束，因此先被記錄
+        fit_record, run_record = self.status.get_timing_records("SynthesizerAdapter")
+        assert fit_record.step_name == "fit"
+        assert fit_record.parent_step == "run"
+        assert fit_record.experiment_name == "synth"
+        assert run_record.parent_step is None
+        assert (run_record.input_rows, run_record.input_cols) == (10, 2)
+        assert (run_record.output_rows, run_record.output_cols) == (18, 2)
+        assert run_record.cpu_seconds >= 0
+        assert run_record.peak_rss_mb > 0
+        assert run_record.memory_delta_mb is None
+
+        timing_df = self.status.get_timing_report_data()
+        for col in [
+            "cpu_seconds",
+            "peak_rss_mb",
+            "memory_delta_mb",
+            "memory_peak_mb",
+            "input_rows",
+            "input_cols",
+            "output_rows",
+            "output_cols",
+            "parent_step",
+        ]:
+            assert col in timing_df.columns
+        assert set(timing_df["source"]) == {"span"}
+        assert set(timing_df["status"]) == {"completed"}
+
+    def test_recording_spans_trace_memory(self):
+        """測試 trace_memory 記錄 tracemalloc 記憶體變化與峰值"""
+        import tracemalloc
+
+        from petsard.instrumentation import span
+
+        status = Status(self.config, trace_memory=True)
+        with status.recording("synth"):
+            with span("run", module="SynthesizerAdapter"):
+                kept = bytearray(4 * 1024 * 1024)
+                with span("sample"):
+                    temp = bytearray(8 * 1024 * 1024)
+                    del temp
+
+        assert not tracemalloc.is_tracing()
+        sample_record, run_record = status.get_timing_records()
+        assert sample_record.memory_peak_mb >= 8
+        assert sample_record.memory_delta_mb < 1
+        assert run_record.memory_peak_mb >= 12
+        assert run_record.memory_delta_mb >= 4
+        del kept
+
+    def test_span_error_and_no_recording(self):
+        """測試錯誤 span 的記錄，以及未啟用記錄時不產生記錄"""
+        import pytest
+
+        from petsard.instrumentation import span
+
+        with span("run", module="LoaderAdapter"):
+            pass
+        assert len(self.status.get_timing_records()) == 0
+
+        with pytest.raises(ValueError):
+            with self.status.recording("data"):
+                with span("run", module="LoaderAdapter"):
+                    raise ValueError("boom")
+
+        timing_df = self.status.get_timing_report_data()
+        assert len(timing_df) == 1
+        assert timing_df.iloc[0]["status"] == "error"
+        assert timing_df.iloc[0]["error"] == "boom"
+
     def test_empty_timing_data(self):
         """測試空的時間資料"""
         # 沒有任何計時記錄時
@@ -339,3 +416,133 @@ class TestStatusTiming:
         # 過濾不存在的模組
         nonexistent_records = self.status.get_timing_records("NonExistentModule")
         assert len(nonexistent_records) == 0
+
+
+class _DataOperator:
+    """可序列化的模擬操作器 / Picklable stand-in operator"""
+
+    def __init__(self, data: pd.DataFrame, metadata: Schema | None = None):
+        self.data = data
+        self.metadata = metadata
+
+    def get_result(self) -> pd.DataFrame:
+        return self.data.copy()
+
+    def get_metadata(self) -> Schema | None:
+        return self.metadata
+
+
+class TestStatusMemoryBudget:
+    """測試 Status 記憶體預算與溢寫至磁碟"""
+
+    def setup_method(self):
+        """設定測試環境"""
+        config_dict = {
+            "Loader": {"data": {"filepath": "data.csv"}},
+            "Synthesizer": {"synth": {"method": "default"}},
+            "Evaluator": {"eval": {"method": "default"}},
+        }
+        self.config = Config(config_dict)
+
+    @staticmethod
+    def _operator(n_rows: int = 200_000, seed: int = 0) -> _DataOperator:
+        """建立約 1.6 MB 的操作器"""
+        import numpy as np
+
+        data = pd.DataFrame({"x": np.random.default_rng(seed).random(n_rows)})
+        return _DataOperator(data, SchemaMetadater.from_data(data))
+
+    def test_no_budget_keeps_operators(self):
+        """測試未設定預算時不溢寫"""
+        status = Status(self.config)
+        status.put("Loader", "data", self._operator())
+        status.put("Synthesizer", "synth", self._operator(seed=1))
+
+        assert status.memory_budget is None
+        assert status.spill_dir is None
+        assert not isinstance(status.status["Loader"]["operator"], SpilledOperator)
+
+    def test_idle_operator_spills_and_reloads(self, tmp_path):
+        """測試閒置的上游操作器溢寫後可透明重新載入"""
+        status = Status(self.config, memory_budget_mb=1, spill_dir=str(tmp_path))
+        loader = self._operator()
+        status.put("Loader", "data", loader)
+        assert not isinstance(status.status["Loader"]["operator"], SpilledOperator)
+
+        status.put("Synthesizer", "synth", self._operator(seed=1))
+        spilled = status.status["Loader"]["operator"]
+        assert isinstance(spilled, SpilledOperator)
+        assert os.path.exists(spilled.path)
+        assert not isinstance(status.status["Synthesizer"]["operator"], SpilledOperator)
+        pd.testing.assert_frame_equal(status.get_result("Loader"), loader.data)
+
+        status.put("Evaluator", "eval", _DataOperator(pd.DataFrame({"score": [1.0]})))
+        assert isinstance(status.status["Synthesizer"]["operator"], SpilledOperator)
+        assert not isinstance(status.status["Evaluator"]["operator"], SpilledOperator)
+
+        # 新分支取代舊的操作器時，移除其溢寫檔案
+        synth_path = status.status["Synthesizer"]["operator"].path
+        status.put("Synthesizer", "synth", self._operator(n_rows=10))
+        assert not os.path.exists(synth_path)
+        assert "Evaluator" not in status.status
+
+    def test_finished_snapshot_schemas_spill(self, tmp_path):
+        """測試已完成分支的快照 Schema 溢寫，讀取時重新載入"""
+        status = Status(self.config, memory_budget_mb=1, spill_dir=str(tmp_path))
+        first = self._operator(n_rows=10)
+        status.put("Loader", "data", first)
+        status.put("Synthesizer", "synth", self._operator(n_rows=10, seed=1))
+        status.put("Loader", "data", self._operator(n_rows=20, seed=2))
+
+        # 第一個分支的快照已溢寫，只保留輕量版本於記憶體
+        assert status.snapshots[0].metadata_after is None
+        assert status.snapshots[-1].metadata_after is not None
+
+        snapshot = status.get_snapshots()[0]
+        assert snapshot.metadata_after.id == first.metadata.id
+        assert len(snapshot.metadata_after.attributes) == 1
+        assert (
+            status.get_snapshot_by_id(snapshot.snapshot_id).metadata_after.id
+            == first.metadata.id
+        )
+        assert all(s.metadata_after is not None for s in status.get_snapshots("Loader"))
+
+    def test_spill_from_end_of_path(self, tmp_path):
+        """測試由路徑末端開始溢寫，保留各分支都會讀取的上游操作器"""
+        status = Status(self.config, memory_budget_mb=3, spill_dir=str(tmp_path))
+        status.put("Loader", "data", self._operator(n_rows=100_000))
+        status.put("Synthesizer", "synth", self._operator(seed=1))
+        assert not isinstance(status.status["Loader"]["operator"], SpilledOperator)
+
+        status.put("Evaluator", "eval", self._operator(n_rows=100_000, seed=2))
+        assert isinstance(status.status["Synthesizer"]["operator"], SpilledOperator)
+        assert not isinstance(status.status["Loader"]["operator"], SpilledOperator)
+
+    def test_reloaded_operator_kept_until_put(self, tmp_path):
+        """測試重新載入的操作器在下一次 put 前重複使用"""
+        import pickle
+
+        status = Status(self.config, memory_budget_mb=1, spill_dir=str(tmp_path))
+        loader = self._operator()
+        status.put("Loader", "data", loader)
+        status.put("Synthesizer", "synth", self._operator(seed=1))
+        spilled = status.status["Loader"]["operator"]
+
+        with patch("petsard.status.pickle.load", wraps=pickle.load) as load:
+            pd.testing.assert_frame_equal(status.get_result("Loader"), loader.data)
+            pd.testing.assert_frame_equal(status.get_result("Loader"), loader.data)
+            assert status.get_metadata("Loader") is not None
+        assert load.call_count == 1
+
+        status.put("Evaluator", "eval", _DataOperator(pd.DataFrame({"score": [1.0]})))
+        assert spilled._operator is None
+
+    def test_shared_data_counted_once(self, tmp_path):
+        """測試操作器間共用的資料只計算一次"""
+        status = Status(self.config, memory_budget_mb=2, spill_dir=str(tmp_path))
+        loader = self._operator()
+        status.put("Loader", "data", loader)
+        # 與 Loader 共用欄位緩衝區，如 Copy-on-Write 下未修改資料的模組
+        status.put("Synthesizer", "synth", _DataOperator(loader.data.copy(deep=False)))
+
+        assert not isinstance(status.status["Loader"]["operator"], SpilledOperator)